@@ -14,7 +14,13 @@ from common import (
 )
 from neofs_testlib.env.env import NeoFSEnv
 from neofs_testlib.shell import Shell
+from operation_metrics import export_operation_metrics
 from python_keywords.neofs_verbs import get_netmap_netinfo
+from resource_sampler import (
+    RESOURCE_SAMPLE_INTERVAL,
+    ResourceSampler,
+    get_neofs_env_process_targets,
+)
 
 from helpers.wallet_helpers import create_wallet
 
@@ -62,6 +68,25 @@ def neofs_env(request):
     allure.attach.file(logs_zip_file_path, name="neofs logs", extension="zip")
 
 
+@pytest.fixture(scope="session", autouse=True)
+@allure.title("Export operation metrics")
+def operation_metrics_export():
+    yield
+    export_operation_metrics()
+
+
+@pytest.fixture(scope="function", autouse=True)
+@allure.title("Sample resources of services")
+def sample_service_resources(neofs_env: NeoFSEnv):
+    if not RESOURCE_SAMPLE_INTERVAL:
+        yield
+        return
+    targets = get_neofs_env_process_targets(neofs_env)
+    with ResourceSampler(targets, RESOURCE_SAMPLE_INTERVAL) as sampler:
+        yield
+    sampler.attach()
+
+
 @pytest.fixture(scope="session")
 @allure.title("Prepare default wallet and deposit")
 def default_wallet(temp_directory):
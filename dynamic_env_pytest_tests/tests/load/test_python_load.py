@@ -0,0 +1,79 @@
+import allure
+import pytest
+from k6 import LoadParams, LoadResults
+from load_generator import GrpcLoadClient, HttpLoadClient, LoadClient, LoadGenerator, S3LoadClient
+from load_params import (
+    PYTHON_LOAD_DELETERS,
+    PYTHON_LOAD_OBJ_SIZE,
+    PYTHON_LOAD_READERS,
+    PYTHON_LOAD_TIME,
+    PYTHON_LOAD_WRITERS,
+)
+from neofs_env.neofs_env_test_base import NeofsEnvTestBase
+from neofs_testlib.env.env import NeoFSEnv
+from python_keywords.container import create_container
+from resource_sampler import ResourceSampler, get_neofs_env_process_targets
+from s3.s3_gate_base import TestNeofsS3GateBase
+from wellknown_acl import PUBLIC_ACL
+
+
+def pytest_generate_tests(metafunc):
+    if "s3_client" in metafunc.fixturenames:
+        metafunc.parametrize("s3_client", ["boto3"], indirect=True)
+
+
+def run_python_load(load_type: str, client: LoadClient, neofs_env: NeoFSEnv) -> LoadResults:
+    load_params = LoadParams(
+        load_type=load_type,
+        endpoint="",
+        writers=PYTHON_LOAD_WRITERS,
+        readers=PYTHON_LOAD_READERS,
+        # HTTP gate can not delete objects, so its load has no deleters
+        deleters=PYTHON_LOAD_DELETERS if client.supports_delete else 0,
+        obj_size=PYTHON_LOAD_OBJ_SIZE,
+        load_time=PYTHON_LOAD_TIME,
+    )
+    with ResourceSampler(get_neofs_env_process_targets(neofs_env)) as sampler:
+        results = LoadGenerator(load_params, client).run()
+    sampler.attach()
+
+    assert results.write_ops > 0, "No objects were written"
+    if PYTHON_LOAD_READERS:
+        assert results.read_ops > 0, "No objects were read"
+    failed = {operation: errors for operation, errors in results.errors.items() if errors}
+    assert not failed, f"Load operations failed: {failed}"
+    return results
+
+
+@pytest.mark.load
+class TestPythonLoad(NeofsEnvTestBase):
+    PLACEMENT_RULE = "REP 2 IN X CBF 1 SELECT 2 FROM * AS X"
+
+    @pytest.mark.parametrize("load_type", ["grpc", "http"])
+    def test_python_load(self, default_wallet, load_type: str):
+        allure.dynamic.title(f"Python load of local environment over {load_type}")
+        cid = create_container(
+            default_wallet.path,
+            shell=self.shell,
+            endpoint=self.neofs_env.sn_rpc,
+            rule=self.PLACEMENT_RULE,
+            basic_acl=PUBLIC_ACL,
+        )
+        if load_type == "grpc":
+            client = GrpcLoadClient(
+                default_wallet.path,
+                cid,
+                self.shell,
+                [storage_node.endpoint for storage_node in self.neofs_env.storage_nodes],
+            )
+        else:
+            client = HttpLoadClient(cid, f"http://{self.neofs_env.http_gw.address}")
+        run_python_load(load_type, client, self.neofs_env)
+
+
+@pytest.mark.load
+@pytest.mark.s3_gate
+class TestS3PythonLoad(TestNeofsS3GateBase):
+    @allure.title("Python load of local environment over S3")
+    def test_s3_python_load(self, bucket):
+        run_python_load("s3", S3LoadClient(self.s3_client, bucket), self.neofs_env)
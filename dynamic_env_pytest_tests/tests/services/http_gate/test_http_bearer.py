@@ -17,7 +17,7 @@ from python_keywords.acl import (
     form_bearertoken_file,
     set_eacl,
     sign_bearer,
-    wait_for_cache_expired,
+    wait_for_eacl_propagation,
 )
 from wellknown_acl import PUBLIC_ACL
 
@@ -53,11 +53,16 @@ class Test_http_bearer(NeofsEnvTestBase):
             set_eacl(
                 self.wallet.path,
                 user_container,
-                create_eacl(user_container, eacl, shell=self.shell),
+                create_eacl(user_container, eacl),
                 shell=self.shell,
                 endpoint=self.neofs_env.sn_rpc,
             )
-            wait_for_cache_expired()
+            wait_for_eacl_propagation(
+                self.wallet.path,
+                user_container,
+                self.shell,
+                [node.endpoint for node in self.neofs_env.storage_nodes],
+            )
 
     @pytest.fixture(scope="class")
     def bearer_token_no_limit_for_others(self, user_container: str) -> str:
@@ -4,7 +4,7 @@ import allure
 import pytest
 from container import create_container
 from file_helper import generate_file
-from http_gate import upload_via_http_gate_curl
+from http_gate import upload_via_http_gate_stream
 from http_gw.http_utils import get_object_and_verify_hashes
 from neofs_env.neofs_env_test_base import NeofsEnvTestBase
 from wellknown_acl import PUBLIC_ACL
@@ -34,7 +34,7 @@ class Test_http_streaming(NeofsEnvTestBase):
 
         Steps:
         1. Create big object;
-        2. Put object using curl with pipe (streaming);
+        2. Put object using HTTP gate in chunks (streaming);
         3. Download object using HTTP gate (https://github.com/nspcc-dev/neofs-http-gw#downloading);
         4. Compare hashes between original and downloaded object;
 
@@ -54,9 +54,9 @@ class Test_http_streaming(NeofsEnvTestBase):
             file_path = generate_file(object_size)
 
         with allure.step(
-            "Put objects using curl utility and Get object and verify hashes [ get/$CID/$OID ]"
+            "Put objects by streaming and Get object and verify hashes [ get/$CID/$OID ]"
         ):
-            oid = upload_via_http_gate_curl(
+            oid = upload_via_http_gate_stream(
                 cid=cid, filepath=file_path, endpoint=f"http://{self.neofs_env.http_gw.address}"
             )
             get_object_and_verify_hashes(
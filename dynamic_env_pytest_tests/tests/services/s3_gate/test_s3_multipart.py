@@ -1,3 +1,5 @@
+import os
+
 import allure
 import pytest
 from file_helper import generate_file, get_file_hash, split_file
@@ -131,3 +133,38 @@ class TestS3GateMultipart(TestNeofsS3GateBase):
         with allure.step("Check we can get whole object from bucket"):
             got_object = s3_gate_object.get_object_s3(self.s3_client, bucket, object_key)
             assert get_file_hash(got_object) == get_file_hash(file_name_large)
+
+    @allure.title("Test S3 Concurrent Multipart Upload")
+    def test_s3_concurrent_multipart(self):
+        bucket = s3_gate_bucket.create_bucket_s3(self.s3_client, bucket_configuration="rep-1")
+        set_bucket_versioning(self.s3_client, bucket, s3_gate_bucket.VersioningStatus.ENABLED)
+        parts_count = 5
+        file_name_large = generate_file(PART_SIZE * parts_count + 1)
+        object_key = object_key_from_file_path(file_name_large)
+        copy_key = f"{object_key}-copy"
+
+        with allure.step("Upload object with concurrent parts"):
+            _, parts = s3_gate_object.upload_multipart_s3(
+                self.s3_client, bucket, object_key, file_name_large, part_size=PART_SIZE
+            )
+            assert len(parts) == parts_count + 1, f"Expected {parts_count + 1} parts, got {parts}"
+
+        with allure.step("Check object read by concurrent segments"):
+            download = s3_gate_object.get_object_segmented_s3(self.s3_client, bucket, object_key)
+            assert download.sha256 == get_file_hash(file_name_large)
+
+        with allure.step("Copy object with concurrent ranged parts"):
+            s3_gate_object.upload_multipart_copy_s3(
+                self.s3_client,
+                bucket,
+                copy_key,
+                f"{bucket}/{object_key}",
+                os.path.getsize(file_name_large),
+                part_size=PART_SIZE,
+            )
+            got_object = s3_gate_object.get_object_s3(self.s3_client, bucket, copy_key)
+            assert get_file_hash(got_object) == get_file_hash(file_name_large)
+
+        with allure.step("Check upload list is empty"):
+            uploads = s3_gate_object.list_multipart_uploads_s3(self.s3_client, bucket)
+            assert not uploads, f"Expected there is no uploads in bucket {bucket}"
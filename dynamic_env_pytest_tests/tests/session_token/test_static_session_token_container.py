@@ -12,7 +12,7 @@ from python_keywords.acl import (
     EACLRule,
     create_eacl,
     set_eacl,
-    wait_for_cache_expired,
+    wait_for_eacl_propagation,
 )
 from python_keywords.container import (
     create_container,
@@ -300,12 +300,17 @@ class TestSessionTokenContainer(NeofsEnvTestBase):
             set_eacl(
                 user_wallet.path,
                 cid,
-                create_eacl(cid, eacl_deny, shell=self.shell),
+                create_eacl(cid, eacl_deny),
                 shell=self.shell,
                 endpoint=self.neofs_env.sn_rpc,
                 session_token=static_sessions[ContainerVerb.SETEACL],
             )
-            wait_for_cache_expired()
+            wait_for_eacl_propagation(
+                user_wallet.path,
+                cid,
+                self.shell,
+                [node.endpoint for node in self.neofs_env.storage_nodes],
+            )
 
         assert not can_put_object(stranger_wallet.path, cid, file_path, self.shell, neofs_env=self.neofs_env)
 
@@ -346,7 +351,7 @@ class TestSessionTokenContainer(NeofsEnvTestBase):
                 set_eacl(
                     user_wallet.path,
                     cid,
-                    create_eacl(cid, new_eacl, shell=self.shell),
+                    create_eacl(cid, new_eacl),
                     shell=self.shell,
                     endpoint=self.neofs_env.sn_rpc,
                     session_token=stranger_token[ContainerVerb.SETEACL],
@@ -358,7 +363,7 @@ class TestSessionTokenContainer(NeofsEnvTestBase):
                     set_eacl(
                         scammer_wallet.path,
                         cid,
-                        create_eacl(cid, new_eacl, shell=self.shell),
+                        create_eacl(cid, new_eacl),
                         shell=self.shell,
                         endpoint=self.neofs_env.sn_rpc,
                         session_token=user_token[ContainerVerb.SETEACL],
@@ -368,7 +373,7 @@ class TestSessionTokenContainer(NeofsEnvTestBase):
                     set_eacl(
                         scammer_wallet.path,
                         cid,
-                        create_eacl(cid, new_eacl, shell=self.shell),
+                        create_eacl(cid, new_eacl),
                         shell=self.shell,
                         endpoint=self.neofs_env.sn_rpc,
                         session_token=stranger_token[ContainerVerb.SETEACL],
@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+import uuid
 from datetime import datetime
 from typing import Optional
 
@@ -93,27 +94,68 @@ class AwsCliClient:
         output = _cmd_run(cmd)
         return self._to_json(output)
 
-    def list_objects(self, Bucket: str) -> dict:
+    # AWS CLI requests all pages itself unless pagination parameters are set, so a single
+    # page is returned only when MaxKeys or a marker is passed
+    def list_objects(
+        self,
+        Bucket: str,
+        Prefix: Optional[str] = None,
+        Marker: Optional[str] = None,
+        MaxKeys: Optional[int] = None,
+    ) -> dict:
         cmd = (
             f"aws {self.common_flags} s3api list-objects --bucket {Bucket} "
             f"--endpoint {self.s3gate_endpoint}"
         )
+        if Prefix:
+            cmd += f" --prefix '{Prefix}'"
+        if Marker:
+            cmd += f" --marker '{Marker}'"
+        if MaxKeys:
+            cmd += f" --max-keys {MaxKeys}"
         output = _cmd_run(cmd)
         return self._to_json(output)
 
-    def list_objects_v2(self, Bucket: str) -> dict:
+    def list_objects_v2(
+        self,
+        Bucket: str,
+        Prefix: Optional[str] = None,
+        ContinuationToken: Optional[str] = None,
+        MaxKeys: Optional[int] = None,
+    ) -> dict:
         cmd = (
             f"aws {self.common_flags} s3api list-objects-v2 --bucket {Bucket} "
             f"--endpoint {self.s3gate_endpoint}"
         )
+        if Prefix:
+            cmd += f" --prefix '{Prefix}'"
+        if ContinuationToken:
+            cmd += f" --continuation-token '{ContinuationToken}'"
+        if MaxKeys:
+            cmd += f" --max-keys {MaxKeys}"
         output = _cmd_run(cmd)
         return self._to_json(output)
 
-    def list_object_versions(self, Bucket: str) -> dict:
+    def list_object_versions(
+        self,
+        Bucket: str,
+        Prefix: Optional[str] = None,
+        KeyMarker: Optional[str] = None,
+        VersionIdMarker: Optional[str] = None,
+        MaxKeys: Optional[int] = None,
+    ) -> dict:
         cmd = (
             f"aws {self.common_flags} s3api list-object-versions --bucket {Bucket} "
             f"--endpoint {self.s3gate_endpoint}"
         )
+        if Prefix:
+            cmd += f" --prefix '{Prefix}'"
+        if KeyMarker:
+            cmd += f" --key-marker '{KeyMarker}'"
+        if VersionIdMarker:
+            cmd += f" --version-id-marker {VersionIdMarker}"
+        if MaxKeys:
+            cmd += f" --max-keys {MaxKeys}"
         output = _cmd_run(cmd)
         return self._to_json(output)
 
@@ -269,7 +311,7 @@ class AwsCliClient:
         return self._to_json(output)
 
     def delete_objects(self, Bucket: str, Delete: dict) -> dict:
-        file_path = os.path.join(os.getcwd(), ASSETS_DIR, "delete.json")
+        file_path = os.path.join(os.getcwd(), ASSETS_DIR, f"delete_{str(uuid.uuid4())}.json")
         with open(file_path, "w") as out_file:
             out_file.write(json.dumps(Delete))
         logger.info(f"Input file for delete-objects: {json.dumps(Delete)}")
@@ -522,22 +564,38 @@ class AwsCliClient:
         output = _cmd_run(cmd)
         return self._to_json(output)
 
-    def upload_part(self, UploadId: str, Bucket: str, Key: str, PartNumber: int, Body: str) -> dict:
+    def upload_part(
+        self,
+        UploadId: str,
+        Bucket: str,
+        Key: str,
+        PartNumber: int,
+        Body: str,
+        ContentMD5: Optional[str] = None,
+    ) -> dict:
+        content_md5 = f" --content-md5 {ContentMD5}" if ContentMD5 else ""
         cmd = (
             f"aws {self.common_flags} s3api upload-part --bucket {Bucket} --key {Key} "
-            f"--upload-id {UploadId} --part-number {PartNumber} --body {Body} "
+            f"--upload-id {UploadId} --part-number {PartNumber} --body {Body}{content_md5} "
             f"--endpoint-url {self.s3gate_endpoint}"
         )
         output = _cmd_run(cmd, LONG_TIMEOUT)
         return self._to_json(output)
 
     def upload_part_copy(
-        self, UploadId: str, Bucket: str, Key: str, PartNumber: int, CopySource: str
+        self,
+        UploadId: str,
+        Bucket: str,
+        Key: str,
+        PartNumber: int,
+        CopySource: str,
+        CopySourceRange: Optional[str] = None,
     ) -> dict:
+        copy_source_range = f" --copy-source-range {CopySourceRange}" if CopySourceRange else ""
         cmd = (
             f"aws {self.common_flags} s3api upload-part-copy --bucket {Bucket} --key {Key} "
-            f"--upload-id {UploadId} --part-number {PartNumber} --copy-source {CopySource} "
-            f"--endpoint-url {self.s3gate_endpoint}"
+            f"--upload-id {UploadId} --part-number {PartNumber} --copy-source {CopySource}"
+            f"{copy_source_range} --endpoint-url {self.s3gate_endpoint}"
         )
         output = _cmd_run(cmd, LONG_TIMEOUT)
         return self._to_json(output)
@@ -0,0 +1,277 @@
+import fcntl
+import json
+import logging
+import os
+import re
+import statistics
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Optional
+
+import allure
+from common import ASSETS_DIR
+from neofs_testlib.hosting import Hosting
+
+logger = logging.getLogger("NeoLogger")
+
+# JSON lines file that keeps results of all benchmark runs. Assets directory is removed at the end
+# of the session, so the file should be set to a persistent path to compare runs across sessions
+BENCHMARK_HISTORY_FILE = os.getenv(
+    "BENCHMARK_HISTORY_FILE", os.path.join(os.getcwd(), ASSETS_DIR, "benchmark_history.jsonl")
+)
+# Number of comparable runs required before new runs are checked for regressions
+BENCHMARK_MIN_HISTORY = int(os.getenv("BENCHMARK_MIN_HISTORY", "5"))
+# Width of the band around historical median, in scaled median absolute deviations
+BENCHMARK_REGRESSION_MADS = float(os.getenv("BENCHMARK_REGRESSION_MADS", "3"))
+# Deviations smaller than this share of the median are never reported, so perfectly stable
+# history (zero MAD) does not turn every tiny change into a regression
+BENCHMARK_MIN_RELATIVE_DEVIATION = 0.05
+# Scales MAD to standard deviation of normally distributed values
+MAD_SCALE = 1.4826
+# Metrics that are better when they are lower, all other metrics (rates) are better when higher
+LOWER_IS_BETTER_REGEX = re.compile(r"latency|error|duration")
+
+_benchmark_environment: dict[str, dict] = {"versions": {}, "topology": {}}
+
+
+@dataclass
+class BenchmarkRecord:
+    """Results of a single load or benchmark run.
+
+    Attributes:
+        name: Name of the benchmark, only runs with the same name are compared.
+        metrics: Measured values by metric name.
+        params: Parameters of the run, only runs with the same parameters are compared.
+        versions: Versions of binaries by binary name.
+        topology: Services of the cluster by host.
+        timestamp: Time of the run in ISO format.
+        run_id: Unique identifier of the run.
+    """
+
+    name: str
+    metrics: dict[str, float]
+    params: dict = field(default_factory=dict)
+    versions: dict[str, str] = field(default_factory=dict)
+    topology: dict = field(default_factory=dict)
+    timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    run_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+
+    def is_comparable(self, other: "BenchmarkRecord") -> bool:
+        return (
+            self.name == other.name
+            and self.params == other.params
+            and self.topology == other.topology
+        )
+
+
+@dataclass
+class Regression:
+    """Metric of a run that is worse than the history allows.
+
+    Attributes:
+        metric: Name of the metric.
+        value: Value of the metric in the new run.
+        median: Median of the metric in history.
+        lower_bound: The lowest acceptable value.
+        upper_bound: The highest acceptable value.
+    """
+
+    metric: str
+    value: float
+    median: float
+    lower_bound: float
+    upper_bound: float
+
+
+def set_benchmark_environment(versions: dict[str, str], topology: dict) -> None:
+    """Sets binary versions and cluster topology that are stored with every benchmark run.
+
+    Args:
+        versions: Versions of binaries, e.g. from get_local_binaries_versions and
+            get_remote_binaries_versions.
+        topology: Cluster topology, see get_cluster_topology.
+    """
+    _benchmark_environment["versions"] = dict(versions)
+    _benchmark_environment["topology"] = topology
+
+
+def get_cluster_topology(hosting: Hosting) -> dict[str, list[str]]:
+    """Returns names of services and CLIs of every host of the cluster."""
+    return {
+        host.config.address: sorted(
+            [service_config.name for service_config in host.config.services]
+            + [cli_config.name for cli_config in host.config.clis]
+        )
+        for host in hosting.hosts
+    }
+
+
+def load_benchmark_history(history_file: str = BENCHMARK_HISTORY_FILE) -> list[BenchmarkRecord]:
+    """Reads all benchmark runs from the history file.
+
+    Args:
+        history_file: Path to the history file.
+
+    Returns:
+        Runs in the order they were recorded.
+    """
+    if not os.path.exists(history_file):
+        return []
+    records = []
+    with open(history_file, "r") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                records.append(BenchmarkRecord(**json.loads(line)))
+            except (TypeError, ValueError) as err:
+                logger.warning(f"Skipping malformed benchmark record: {err}")
+    return records
+
+
+def save_benchmark_record(
+    record: BenchmarkRecord, history_file: str = BENCHMARK_HISTORY_FILE
+) -> None:
+    """Appends the run to the history file.
+
+    The file is locked while the record is written, so parallel sessions do not interleave
+    their records.
+
+    Args:
+        record: Run to save.
+        history_file: Path to the history file.
+    """
+    history_dir = os.path.dirname(history_file)
+    if history_dir:
+        os.makedirs(history_dir, exist_ok=True)
+    with open(history_file, "a") as file:
+        fcntl.flock(file, fcntl.LOCK_EX)
+        try:
+            file.write(json.dumps(asdict(record), sort_keys=True) + "\n")
+        finally:
+            fcntl.flock(file, fcntl.LOCK_UN)
+
+
+def detect_regressions(
+    record: BenchmarkRecord,
+    history: list[BenchmarkRecord],
+    mads: float = BENCHMARK_REGRESSION_MADS,
+    min_history: int = BENCHMARK_MIN_HISTORY,
+) -> list[Regression]:
+    """Compares the run with distribution of comparable runs in history.
+
+    Every metric should fit into median ± mads * MAD band of the history. Only the worse side
+    of the band is checked: rates should not drop below it and latencies, errors and
+    durations should not rise above it.
+
+    Args:
+        record: New run.
+        history: Previous runs, runs that are not comparable with the new one are ignored.
+        mads: Width of the band in scaled median absolute deviations.
+        min_history: Minimum number of comparable runs required to check a metric.
+
+    Returns:
+        Regressed metrics.
+    """
+    comparable = [previous for previous in history if previous.is_comparable(record)]
+    regressions = []
+    for metric, value in record.metrics.items():
+        values = [previous.metrics[metric] for previous in comparable if metric in previous.metrics]
+        if len(values) < min_history:
+            logger.info(f"Not enough history of {metric} to detect regressions: {len(values)}")
+            continue
+        median = statistics.median(values)
+        mad = statistics.median(abs(previous - median) for previous in values) * MAD_SCALE
+        deviation = max(mads * mad, abs(median) * BENCHMARK_MIN_RELATIVE_DEVIATION)
+        lower_bound, upper_bound = median - deviation, median + deviation
+        if LOWER_IS_BETTER_REGEX.search(metric):
+            regressed = value > upper_bound
+        else:
+            regressed = value < lower_bound
+        if regressed:
+            regressions.append(Regression(metric, value, median, lower_bound, upper_bound))
+    return regressions
+
+
+@allure.step("Record benchmark run {name}")
+def record_benchmark_run(
+    name: str,
+    metrics: dict[str, float],
+    params: Optional[dict] = None,
+    history_file: str = BENCHMARK_HISTORY_FILE,
+) -> tuple[BenchmarkRecord, list[Regression]]:
+    """Records the run in history and compares it with previous runs.
+
+    Regressions are attached to the report, but the run is not failed, so several runs can be
+    recorded before their regressions are checked with assert_no_benchmark_regressions.
+
+    Args:
+        name: Name of the benchmark.
+        metrics: Measured values by metric name.
+        params: Parameters of the run.
+        history_file: Path to the history file.
+
+    Returns:
+        Saved record of the run and its regressed metrics.
+    """
+    record = BenchmarkRecord(
+        name=name,
+        metrics=metrics,
+        params=json.loads(json.dumps(params or {}, default=str)),
+        versions=_benchmark_environment["versions"],
+        topology=_benchmark_environment["topology"],
+    )
+    history = load_benchmark_history(history_file)
+    save_benchmark_record(record, history_file)
+
+    regressions = detect_regressions(record, history)
+    rows = [f"{'metric':<32}{'value':>12}{'median':>12}{'lower':>12}{'upper':>12}"]
+    rows.extend(
+        f"{regression.metric:<32}{regression.value:>12.2f}{regression.median:>12.2f}"
+        f"{regression.lower_bound:>12.2f}{regression.upper_bound:>12.2f}"
+        for regression in regressions
+    )
+    allure.attach("\n".join(rows), f"Regressions of {name}", allure.attachment_type.TEXT)
+    return record, regressions
+
+
+def assert_no_benchmark_regressions(regressions: dict[str, list[Regression]]) -> None:
+    """Fails if any of the recorded runs regressed.
+
+    Args:
+        regressions: Regressed metrics by name of the benchmark.
+    """
+    failed = [
+        f"{name}: "
+        + ", ".join(
+            f"{regression.metric} = {regression.value:.2f} (median {regression.median:.2f})"
+            for regression in name_regressions
+        )
+        for name, name_regressions in regressions.items()
+        if name_regressions
+    ]
+    assert not failed, "Performance regressed: " + "; ".join(failed)
+
+
+@allure.step("Check benchmark regressions")
+def check_benchmark_regressions(
+    name: str,
+    metrics: dict[str, float],
+    params: Optional[dict] = None,
+    history_file: str = BENCHMARK_HISTORY_FILE,
+) -> BenchmarkRecord:
+    """Records the run in history and fails if it is a regression against previous runs.
+
+    Args:
+        name: Name of the benchmark.
+        metrics: Measured values by metric name.
+        params: Parameters of the run.
+        history_file: Path to the history file.
+
+    Returns:
+        Saved record of the run.
+    """
+    record, regressions = record_benchmark_run(name, metrics, params, history_file)
+    assert_no_benchmark_regressions({name: regressions})
+    return record
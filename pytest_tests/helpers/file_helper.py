@@ -9,6 +9,8 @@ from common import ASSETS_DIR, TEST_FILES_DIR
 
 logger = logging.getLogger("NeoLogger")
 
+HASH_CHUNK_SIZE = 1024 * 1024
+
 
 def generate_file(size: int) -> str:
     """Generates a binary file with the specified size in bytes.
@@ -74,16 +76,16 @@ def get_file_hash(file_path: str, len: Optional[int] = None, offset: Optional[in
     """
     file_hash = hashlib.sha256()
     with open(file_path, "rb") as out:
-        if len and not offset:
-            file_hash.update(out.read(len))
-        elif len and offset:
-            out.seek(offset, 0)
-            file_hash.update(out.read(len))
-        elif offset and not len:
+        if offset:
             out.seek(offset, 0)
-            file_hash.update(out.read())
-        else:
-            file_hash.update(out.read())
+        # File is hashed in chunks, so large files are not read into memory at once
+        end = out.tell() + len if len else None
+        while end is None or out.tell() < end:
+            chunk_size = HASH_CHUNK_SIZE if end is None else min(HASH_CHUNK_SIZE, end - out.tell())
+            chunk = out.read(chunk_size)
+            if not chunk:
+                break
+            file_hash.update(chunk)
     return file_hash.hexdigest()
 
 
@@ -1,13 +1,29 @@
+import base64
+import gzip
+import inspect
+import json
+import logging
 import re
+import shlex
+import threading
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from time import sleep
-from typing import Optional
+from typing import Iterator, Optional
 
 import allure
-from neofs_testlib.shell import Shell
+from latency_histogram import (
+    DEFAULT_SUB_BUCKETS,
+    MIN_TRACKABLE_VALUE,
+    LatencyHistogram,
+    get_bucket_index,
+)
+from neofs_testlib.reporter import get_reporter
+from neofs_testlib.shell import CommandOptions, Shell
 from remote_process import RemoteProcess
 
+logger = logging.getLogger("NeoLogger")
+
 EXIT_RESULT_CODE = 0
 LOAD_RESULTS_PATTERNS = {
     "grpc": {
@@ -16,10 +32,59 @@ LOAD_RESULTS_PATTERNS = {
     },
     "s3": {
         "write_ops": r"aws_obj_put_total\W*\d*\W*(?P<write_ops>\d*\.\d*)",
-        "read_ops": r"aws_obj_get_total\W*\d*\W*(?P<write_ops>\d*\.\d*)",
+        "read_ops": r"aws_obj_get_total\W*\d*\W*(?P<read_ops>\d*\.\d*)",
     },
     "http": {"total_ops": r"http_reqs\W*\d*\W*(?P<total_ops>\d*\.\d*)"},
 }
+# Metrics of k6 summary by operation: (counter of requests, trend of durations, errors)
+LOAD_METRICS = {
+    "grpc": {
+        "write": ("neofs_obj_put_total", "neofs_obj_put_duration", "neofs_obj_put_fails"),
+        "read": ("neofs_obj_get_total", "neofs_obj_get_duration", "neofs_obj_get_fails"),
+        "delete": ("neofs_obj_delete_total", "neofs_obj_delete_duration", "neofs_obj_delete_fails"),
+    },
+    "s3": {
+        "write": ("aws_obj_put_total", "aws_obj_put_duration", "aws_obj_put_fails"),
+        "read": ("aws_obj_get_total", "aws_obj_get_duration", "aws_obj_get_fails"),
+        "delete": ("aws_obj_delete_total", "aws_obj_delete_duration", "aws_obj_delete_fails"),
+    },
+    "http": {"total": ("http_reqs", "http_req_duration", "http_req_failed")},
+}
+# Counters of verify scenario by status of verified objects, invalid objects are either missing
+# or have unexpected payload
+VERIFY_COUNTERS = {"verified": "verified_obj", "invalid": "invalid_obj", "skipped": "skipped_obj"}
+K6_SUMMARY_FILE = "summary.json"
+K6_SUMMARY_TREND_STATS = "avg,min,med,max,p(90),p(95),p(99)"
+# Sub-metrics of iterations by scenario, e.g. iterations{scenario:write}
+SCENARIO_ITERATIONS_REGEX = re.compile(r"^iterations\{scenario:(?P<scenario>[^}]+)\}$")
+# Every metric point is written to this file, k6 compresses it because of .gz extension
+K6_POINTS_FILE = "points.json.gz"
+# Points are binned into histograms on the load node, so only histograms are transferred.
+# Bucketing function is taken from latency_histogram module to keep buckets compatible
+K6_HISTOGRAM_SCRIPT = f"""
+import gzip, json, math, sys
+MIN_TRACKABLE_VALUE = {MIN_TRACKABLE_VALUE}
+DEFAULT_SUB_BUCKETS = {DEFAULT_SUB_BUCKETS}
+{inspect.getsource(get_bucket_index)}
+metrics = set(sys.argv[2].split(","))
+histograms = {{}}
+with gzip.open(sys.argv[1], "rt") as points:
+    for line in points:
+        point = json.loads(line)
+        if point.get("type") != "Point" or point.get("metric") not in metrics:
+            continue
+        counts = histograms.setdefault(point["metric"], {{}})
+        index = get_bucket_index(point["data"]["value"])
+        counts[index] = counts.get(index, 0) + 1
+print(json.dumps(histograms))
+"""
+# Pregenerated dataset is uploaded compressed in base64 chunks, remote shell gets every command
+# as a single argument, which is limited by 128 KiB
+PREGEN_JSON_CHUNK_SIZE = 96 * 1024
+
+reporter = get_reporter()
+_suppressed_reports_lock = threading.Lock()
+_suppressed_reports = {"depth": 0, "handlers": []}
 
 
 @dataclass
@@ -36,15 +101,49 @@ class LoadParams:
     obj_count: Optional[int] = None
     obj_size: Optional[int] = None
     registry_file: Optional[str] = None
+    latency_histograms: bool = False
+
+
+@dataclass
+class LatencyStats:
+    """Latency statistics of an operation in milliseconds, as reported by k6."""
+
+    avg: float = 0.0
+    p50: float = 0.0
+    p90: float = 0.0
+    p95: float = 0.0
+    p99: float = 0.0
+    max: float = 0.0
 
 
 @dataclass
 class LoadResults:
+    """Results of a load run.
+
+    Attributes:
+        data_sent: Rate of sent data in bytes per second.
+        data_received: Rate of received data in bytes per second.
+        read_ops: Rate of read operations per second.
+        write_ops: Rate of write operations per second.
+        total_ops: Rate of all requests per second (HTTP load).
+        delete_ops: Rate of delete operations per second.
+        latency: Latency statistics by operation type (write, read, delete, total).
+        errors: Number of failed requests by operation type.
+        iteration_rates: Iterations per second by scenario, "total" holds the overall rate.
+        latency_histograms: Mergeable latency histograms by operation type, they are collected
+            only if requested in load parameters.
+    """
+
     data_sent: float = 0.0
     data_received: float = 0.0
     read_ops: float = 0.0
     write_ops: float = 0.0
     total_ops: float = 0.0
+    delete_ops: float = 0.0
+    latency: dict[str, LatencyStats] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+    iteration_rates: dict[str, float] = field(default_factory=dict)
+    latency_histograms: dict[str, LatencyHistogram] = field(default_factory=dict)
 
 
 class K6:
@@ -64,30 +163,117 @@ class K6:
     def process_dir(self) -> str:
         return self._k6_process.process_dir
 
+    @property
+    def endpoints(self) -> list[str]:
+        return self.load_params.endpoint.split(",")
+
+    @property
+    def pregen_json_path(self) -> str:
+        return f"{self.k6_dir}/{self.load_params.load_type}_{self.load_params.out_file}"
+
     @allure.step("Prepare containers and objects")
-    def prepare(self) -> str:
+    def prepare(self, endpoint: Optional[str] = None) -> str:
+        """Creates containers and preloads objects with the preset script of the load type.
+
+        Args:
+            endpoint: Endpoint the preset sends requests to, the first endpoint of load
+                parameters is used by default.
+
+        Returns:
+            Output of the preset script.
+        """
+        command = self._get_preset_command(
+            endpoint or self.endpoints[0], self.load_params.containers_count, self.pregen_json_path
+        )
+        terminal = self.shell.exec(command)
+        return terminal.stdout.strip("\n")
+
+    @allure.step("Prepare shared dataset")
+    def prepare_shared_dataset(self, endpoints: Optional[list[str]] = None) -> dict:
+        """Prepares a dataset that is shared by several load nodes.
+
+        Containers are split between endpoints and the preset of every endpoint is run
+        concurrently on this load node, so preload traffic is spread over the storage nodes.
+        Pregenerated files of the presets are merged into one dataset.
+
+        Args:
+            endpoints: Endpoints to spread the preset over, endpoints of load parameters are
+                used by default.
+
+        Returns:
+            Merged content of pregenerated files.
+        """
+        endpoints = endpoints or self.endpoints
+        part_paths = []
+        presets = []
+        containers_counts = split_count(self.load_params.containers_count or 0, len(endpoints))
+        for index, (endpoint, containers_count) in enumerate(zip(endpoints, containers_counts)):
+            if not containers_count:
+                continue
+            part_path = f"{self.pregen_json_path}.part{index}"
+            part_paths.append(part_path)
+            preset = self._get_preset_command(endpoint, containers_count, part_path)
+            presets.append(f'{{ {preset} > {part_path}.log 2>&1; }} & pids="$pids $!"')
+        logs = " ".join(f"{part_path}.log" for part_path in part_paths)
+        assert presets, "No containers to prepare"
+        self.shell.exec(
+            f"pids=''; rc=0; {'; '.join(presets)}; "
+            f"for pid in $pids; do wait $pid || rc=1; done; cat {logs}; exit $rc"
+        )
+
+        datasets = [
+            json.loads(self.shell.exec(f"cat {part_path}").stdout) for part_path in part_paths
+        ]
+        self.shell.exec(f"rm -f {' '.join(part_paths)} {logs}")
+        return merge_pregen_datasets(datasets)
+
+    @allure.step("Upload pregenerated dataset")
+    def write_pregen_json(self, dataset: dict) -> None:
+        """Writes the dataset to the pregenerated file of the load node.
+
+        The dataset is compressed and uploaded in chunks that fit into a single shell command.
+        Shells attach every command to the report, so chunks are not reported; the file is
+        unpacked and moved into place by one reported command when all chunks are uploaded.
+
+        Args:
+            dataset: Content of the pregenerated file.
+        """
+        content = json.dumps(dataset).encode("utf-8")
+        encoded = base64.b64encode(gzip.compress(content)).decode("ascii")
+        tmp_path = f"{self.pregen_json_path}.tmp"
+        with _suppressed_shell_reports():
+            self.shell.exec(f": > {tmp_path}.gz")
+            for start in range(0, len(encoded), PREGEN_JSON_CHUNK_SIZE):
+                chunk = encoded[start : start + PREGEN_JSON_CHUNK_SIZE]
+                self.shell.exec(f"echo '{chunk}' | base64 -d >> {tmp_path}.gz")
+        self.shell.exec(
+            f"gunzip -c {tmp_path}.gz > {tmp_path} && rm {tmp_path}.gz && "
+            f"mv {tmp_path} {self.pregen_json_path}"
+        )
+        logger.info(
+            f"Uploaded {len(content)} bytes of dataset to {self.pregen_json_path} "
+            f"in {-(-len(encoded) // PREGEN_JSON_CHUNK_SIZE)} chunks"
+        )
+
+    def _get_preset_command(self, endpoint: str, containers_count: int, out_path: str) -> str:
         if self.load_params.load_type == "http" or self.load_params.load_type == "grpc":
-            command = (
+            return (
                 f"{self.k6_dir}/scenarios/preset/preset_grpc.py "
                 f"--size {self.load_params.obj_size}  "
-                f"--containers {self.load_params.containers_count} "
-                f"--out {self.k6_dir}/{self.load_params.load_type}_{self.load_params.out_file} "
-                f"--endpoint {self.load_params.endpoint.split(',')[0]} "
+                f"--containers {containers_count} "
+                f"--out {out_path} "
+                f"--endpoint {endpoint} "
                 f"--preload_obj {self.load_params.obj_count} "
             )
-            terminal = self.shell.exec(command)
-            return terminal.stdout.strip("\n")
         elif self.load_params.load_type == "s3":
-            command = (
+            return (
                 f"{self.k6_dir}/scenarios/preset/preset_s3.py --size {self.load_params.obj_size} "
-                f"--buckets {self.load_params.containers_count} "
-                f"--out {self.k6_dir}/{self.load_params.load_type}_{self.load_params.out_file} "
-                f"--endpoint {self.load_params.endpoint.split(',')[0]} "
+                f"--buckets {containers_count} "
+                f"--out {out_path} "
+                f"--endpoint {endpoint} "
                 f"--preload_obj {self.load_params.obj_count} "
                 f"--location load-1-1"
             )
-            terminal = self.shell.exec(command)
-            return terminal.stdout.strip("\n")
         else:
             raise AssertionError("Wrong K6 load type")
 
@@ -102,9 +288,7 @@ class K6:
             "REGISTRY_FILE": load_params.registry_file or None,
             "CLIENTS": load_params.clients or None,
             f"{self.load_params.load_type.upper()}_ENDPOINTS": self.load_params.endpoint,
-            "PREGEN_JSON": f"{self.k6_dir}/{self.load_params.load_type}_{self.load_params.out_file}"
-            if load_params.out_file
-            else None,
+            "PREGEN_JSON": self.pregen_json_path if load_params.out_file else None,
         }
         allure.attach(
             "\n".join(f"{param}: {value}" for param, value in env_vars.items()),
@@ -117,10 +301,19 @@ class K6:
 
     @allure.step("Start K6 on initiator")
     def start(self) -> None:
+        points_output = (
+            f"--out json={K6_POINTS_FILE} " if self.load_params.latency_histograms else ""
+        )
+        # Summary and points are written to the process directory, which is the working
+        # directory of k6
         command = (
             f"{self.k6_dir}/k6 run {self._generate_env_variables(self.load_params, self.k6_dir)} "
+            f"--summary-export {K6_SUMMARY_FILE} "
+            f"--summary-trend-stats '{K6_SUMMARY_TREND_STATS}' "
+            f"{points_output}"
             f"{self.k6_dir}/scenarios/{self.load_params.load_type}.js"
         )
+        self._k6_result = None
         self._k6_process = RemoteProcess.create(command, self.shell)
 
     @allure.step("Wait until K6 is finished")
@@ -190,6 +383,69 @@ class K6:
         return not self._k6_process.running()
 
     def parsing_results(self) -> LoadResults:
+        if self._k6_result is None:
+            summary = self._get_summary()
+            if summary is None:
+                logger.warning("K6 summary was not exported, parsing results from output")
+                self._k6_result = self._parse_output()
+            else:
+                self._k6_result = parse_k6_summary(summary, self.load_params.load_type)
+            if self.load_params.latency_histograms:
+                self._k6_result.latency_histograms = self._get_latency_histograms()
+        return self._k6_result
+
+    @allure.step("Parse K6 verification results")
+    def parsing_verify_results(self) -> dict[str, int]:
+        """Returns numbers of objects checked by verify scenario by verification status."""
+        summary = self._get_summary()
+        if summary is not None:
+            metrics = summary.get("metrics", {})
+            return {
+                status: int(metrics.get(counter, {}).get("count", 0))
+                for status, counter in VERIFY_COUNTERS.items()
+            }
+        logger.warning("K6 summary was not exported, parsing verification results from output")
+        output = self._k6_process.stdout(full=True)
+        counts = {}
+        for status, counter in VERIFY_COUNTERS.items():
+            match = re.search(rf"{counter}\W*(?P<count>\d+)", output)
+            counts[status] = int(match.group("count")) if match else 0
+        return counts
+
+    @allure.step("Get K6 latency histograms")
+    def _get_latency_histograms(self) -> dict[str, LatencyHistogram]:
+        operations = {
+            duration_metric: operation
+            for operation, (_, duration_metric, _) in LOAD_METRICS.get(
+                self.load_params.load_type, {}
+            ).items()
+        }
+        terminal = self.shell.exec(
+            f"python3 -c {shlex.quote(K6_HISTOGRAM_SCRIPT)} "
+            f"{self.process_dir}/{K6_POINTS_FILE} {','.join(operations)}",
+            CommandOptions(check=False),
+        )
+        if terminal.return_code != 0:
+            logger.warning(f"Could not build latency histograms: {terminal.stderr}")
+            return {}
+        return {
+            operations[metric]: LatencyHistogram(
+                counts={int(index): count for index, count in counts.items()}
+            )
+            for metric, counts in json.loads(terminal.stdout).items()
+        }
+
+    @allure.step("Get K6 summary")
+    def _get_summary(self) -> Optional[dict]:
+        terminal = self.shell.exec(
+            f"cat {self.process_dir}/{K6_SUMMARY_FILE}", CommandOptions(check=False)
+        )
+        if terminal.return_code != 0 or not terminal.stdout.strip():
+            return None
+        allure.attach(terminal.stdout, "K6 summary", allure.attachment_type.JSON)
+        return json.loads(terminal.stdout)
+
+    def _parse_output(self) -> LoadResults:
         output = self._k6_process.stdout(full=True).replace("\n", "")
         metric_regex_map = {
             "data_received": r"data_received\W*\d*.\d*.\w*\W*(?P<data_received>\d*)",
@@ -223,3 +479,111 @@ class K6:
     @allure.step("Log K6 output")
     def __log_k6_output(self) -> None:
         allure.attach(self._k6_process.stdout(full=True), "K6 output", allure.attachment_type.TEXT)
+
+
+@contextmanager
+def _suppressed_shell_reports() -> Iterator[None]:
+    # Shells of neofs-testlib report commands regardless of no_log option, so handlers of the
+    # reporter are detached while the context is active. Reporter is global, so the contexts of
+    # concurrent uploads are counted and handlers are restored when the last one exits
+    with _suppressed_reports_lock:
+        if not _suppressed_reports["depth"]:
+            _suppressed_reports["handlers"] = reporter.handlers
+            reporter.handlers = []
+        _suppressed_reports["depth"] += 1
+    try:
+        yield
+    finally:
+        with _suppressed_reports_lock:
+            _suppressed_reports["depth"] -= 1
+            if not _suppressed_reports["depth"]:
+                reporter.handlers = _suppressed_reports["handlers"]
+
+
+def parse_k6_summary(summary: dict, load_type: str) -> LoadResults:
+    """Builds load results from k6 summary exported with --summary-export.
+
+    Args:
+        summary: Parsed content of the summary file.
+        load_type: Type of the load (grpc, s3, http) that defines names of the metrics.
+
+    Returns:
+        Rates, latencies and errors of the load operations.
+    """
+    metrics = summary.get("metrics", {})
+    results = LoadResults(
+        data_sent=metrics.get("data_sent", {}).get("rate", 0.0),
+        data_received=metrics.get("data_received", {}).get("rate", 0.0),
+    )
+    for operation, (total_metric, duration_metric, errors_metric) in LOAD_METRICS.get(
+        load_type, {}
+    ).items():
+        if total_metric not in metrics:
+            continue
+        setattr(results, f"{operation}_ops", metrics[total_metric].get("rate", 0.0))
+        duration = metrics.get(duration_metric, {})
+        results.latency[operation] = LatencyStats(
+            avg=duration.get("avg", 0.0),
+            p50=duration.get("med", duration.get("p(50)", 0.0)),
+            p90=duration.get("p(90)", 0.0),
+            p95=duration.get("p(95)", 0.0),
+            p99=duration.get("p(99)", 0.0),
+            max=duration.get("max", 0.0),
+        )
+        errors = metrics.get(errors_metric, {})
+        # Counters have "count", rates (like http_req_failed) count true values as "passes"
+        results.errors[operation] = int(errors.get("count", errors.get("passes", 0)))
+
+    if "iterations" in metrics:
+        results.iteration_rates["total"] = metrics["iterations"].get("rate", 0.0)
+    for metric_name, metric in metrics.items():
+        match = SCENARIO_ITERATIONS_REGEX.match(metric_name)
+        if match:
+            results.iteration_rates[match.group("scenario")] = metric.get("rate", 0.0)
+    return results
+
+
+def split_count(count: int, parts: int) -> list[int]:
+    """Splits the count into the given number of parts that differ by one at most."""
+    return [count // parts + (1 if index < count % parts else 0) for index in range(parts)]
+
+
+def merge_pregen_datasets(datasets: list[dict]) -> dict:
+    """Merges pregenerated datasets, lists of containers and objects are concatenated.
+
+    Args:
+        datasets: Contents of pregenerated files.
+
+    Returns:
+        Merged dataset, scalar values (e.g. object size) are taken from the first dataset.
+    """
+    merged = {}
+    for dataset in datasets:
+        for key, value in dataset.items():
+            if isinstance(value, list):
+                merged.setdefault(key, []).extend(value)
+            else:
+                merged.setdefault(key, value)
+    return merged
+
+
+def split_pregen_dataset(dataset: dict, shards: int) -> list[dict]:
+    """Splits objects of the dataset into disjoint shards.
+
+    Every shard keeps all containers, so writers of every load node still use the whole
+    dataset, while readers and deleters of different load nodes never touch the same object.
+    Objects are dealt in turn, so every shard has objects of every container.
+
+    Args:
+        dataset: Content of pregenerated file.
+        shards: Number of shards.
+
+    Returns:
+        Dataset of every shard.
+    """
+    objects = dataset.get("objects", [])
+    if len(objects) < shards:
+        logger.warning(
+            f"Dataset has {len(objects)} objects only, some of {shards} shards are empty"
+        )
+    return [{**dataset, "objects": objects[index::shards]} for index in range(shards)]
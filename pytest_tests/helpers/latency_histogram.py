@@ -0,0 +1,154 @@
+import math
+from dataclasses import dataclass, field
+from typing import Iterable
+
+# Every power of two range is split into this number of linear buckets, so values are kept with
+# relative error below 1%, in the same way as HDR histograms do
+DEFAULT_SUB_BUCKETS = 128
+# Values below this one (in histogram units) are counted in the lowest bucket
+MIN_TRACKABLE_VALUE = 0.001
+
+
+@dataclass
+class LatencyHistogram:
+    """Log-linear histogram of latencies that can be merged without losing percentiles.
+
+    Bucket of a value is defined by its power of two and by its position inside the power of
+    two range, so histograms with the same number of sub-buckets collected on different hosts
+    can be merged by summing counts of the same buckets.
+
+    Attributes:
+        counts: Number of recorded values by bucket index.
+        sub_buckets: Number of linear buckets in every power of two range.
+    """
+
+    counts: dict[int, int] = field(default_factory=dict)
+    sub_buckets: int = DEFAULT_SUB_BUCKETS
+
+    @property
+    def count(self) -> int:
+        """Total number of recorded values."""
+        return sum(self.counts.values())
+
+    def record(self, value: float, count: int = 1) -> None:
+        """Records the value.
+
+        Args:
+            value: Value to record.
+            count: Number of times the value should be recorded.
+        """
+        index = get_bucket_index(value, self.sub_buckets)
+        self.counts[index] = self.counts.get(index, 0) + count
+
+    def record_all(self, values: Iterable[float]) -> None:
+        """Records every value of the sequence.
+
+        Args:
+            values: Values to record.
+        """
+        for value in values:
+            self.record(value)
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Adds values of another histogram to this one.
+
+        Args:
+            other: Histogram with the same number of sub-buckets.
+
+        Returns:
+            This histogram.
+        """
+        if other.sub_buckets != self.sub_buckets:
+            raise ValueError(
+                f"Cannot merge histograms with {other.sub_buckets} and {self.sub_buckets} "
+                f"sub-buckets"
+            )
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        return self
+
+    def percentile(self, percentile: float) -> float:
+        """Returns the value at the percentile.
+
+        As in HDR histograms, the highest value that is equivalent to the found bucket is
+        returned, so the result never understates the real percentile by more than 1%.
+
+        Args:
+            percentile: Percentile in range [0, 100].
+
+        Returns:
+            Value at the percentile, 0 for empty histogram.
+        """
+        total = self.count
+        if not total:
+            return 0.0
+        rank = max(math.ceil(total * percentile / 100), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return get_bucket_upper_bound(index, self.sub_buckets)
+        return get_bucket_upper_bound(max(self.counts), self.sub_buckets)
+
+    def to_dict(self) -> dict:
+        """Returns JSON-serializable representation of the histogram."""
+        return {
+            "sub_buckets": self.sub_buckets,
+            "counts": {str(index): count for index, count in sorted(self.counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        """Restores histogram from the representation returned by to_dict."""
+        return cls(
+            counts={int(index): count for index, count in data.get("counts", {}).items()},
+            sub_buckets=data.get("sub_buckets", DEFAULT_SUB_BUCKETS),
+        )
+
+
+def merge_histograms(histograms: Iterable[LatencyHistogram]) -> LatencyHistogram:
+    """Merges histograms into a new one.
+
+    Args:
+        histograms: Histograms with the same number of sub-buckets.
+
+    Returns:
+        Histogram with values of all histograms.
+    """
+    histograms = list(histograms)
+    merged = LatencyHistogram(
+        sub_buckets=histograms[0].sub_buckets if histograms else DEFAULT_SUB_BUCKETS
+    )
+    for histogram in histograms:
+        merged.merge(histogram)
+    return merged
+
+
+def get_bucket_index(value: float, sub_buckets: int = DEFAULT_SUB_BUCKETS) -> int:
+    """Returns index of the histogram bucket of the value.
+
+    Args:
+        value: Recorded value.
+        sub_buckets: Number of linear buckets in every power of two range.
+
+    Returns:
+        Index of the bucket.
+    """
+    value = max(value, MIN_TRACKABLE_VALUE)
+    exponent = math.floor(math.log2(value))
+    sub_bucket = min(int((value / 2**exponent - 1) * sub_buckets), sub_buckets - 1)
+    return exponent * sub_buckets + sub_bucket
+
+
+def get_bucket_upper_bound(index: int, sub_buckets: int = DEFAULT_SUB_BUCKETS) -> float:
+    """Returns the highest value that falls into the bucket.
+
+    Args:
+        index: Index of the bucket.
+        sub_buckets: Number of linear buckets in every power of two range.
+
+    Returns:
+        Upper bound of the bucket.
+    """
+    exponent, sub_bucket = divmod(index, sub_buckets)
+    return 2**exponent * (1 + (sub_bucket + 1) / sub_buckets)
@@ -0,0 +1,197 @@
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Optional
+
+import allure
+from neofs_testlib.hosting import Host, Hosting
+
+logger = logging.getLogger("NeoLogger")
+
+# Timestamp at the beginning of a log line, as services write it, e.g. 2023-05-10T12:00:00.123Z
+LINE_TIMESTAMP_REGEX = re.compile(
+    rb"^(\d{4}-\d{2}-\d{2})[T ](\d{2}:\d{2}:\d{2})(?:[.,](\d+))?\s?(Z|[+-]\d{2}:?\d{2})?"
+)
+
+
+@dataclass
+class LogChunk:
+    """Part of the cached log of a service that was fetched by a single dump.
+
+    Attributes:
+        since: Time from which the chunk was dumped.
+        until: Time until which the chunk was dumped.
+        start: Offset of the chunk in the cache file.
+        end: Offset of the end of the chunk in the cache file.
+    """
+
+    since: datetime
+    until: datetime
+    start: int
+    end: int
+
+
+@dataclass
+class ServiceLog:
+    """Local cache of the log of a service.
+
+    Attributes:
+        path: Path to the cache file.
+        chunks: Chunks of the log in the order they were dumped.
+    """
+
+    path: str
+    chunks: list[LogChunk] = field(default_factory=list)
+
+
+class HostLogCollector:
+    """Collects logs of all services of the cluster incrementally.
+
+    Every dump fetches logs of all hosts concurrently, and only since the previous dump of the
+    host, and appends them to local cache files of the services. Logs of a time window (e.g. of
+    a failed test) are then cut from the cache, so the cost of collection depends on volume of
+    the logs rather than on the number of windows.
+
+    Hosting API dumps all services of a host at once, so the cursor is kept per host, while
+    chunks are indexed per service.
+    """
+
+    def __init__(self, hosting: Hosting, cache_dir: str, since: Optional[datetime] = None):
+        self.hosting = hosting
+        self.cache_dir = cache_dir
+        self.service_logs: dict[str, ServiceLog] = {}
+        start_time = since or datetime.utcnow()
+        self._cursors = {host.config.address: start_time for host in hosting.hosts}
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @allure.step("Collect new logs of hosts")
+    def collect(self, until: Optional[datetime] = None) -> None:
+        """Fetches logs of all hosts written since the previous collection.
+
+        Args:
+            until: Time until which logs should be collected, in UTC.
+        """
+        until = until or datetime.utcnow()
+        with self._lock, tempfile.TemporaryDirectory(dir=self.cache_dir) as dump_dir:
+            hosts = [
+                host for host in self.hosting.hosts if self._cursors[host.config.address] < until
+            ]
+            with ThreadPoolExecutor(max_workers=len(hosts) or 1) as executor:
+                dumped = list(
+                    executor.map(lambda host: self._dump_host(host, dump_dir, until), hosts)
+                )
+            # Chunks are appended to cache files in a single thread and in the order of hosts
+            for host, host_dir in zip(hosts, dumped):
+                if host_dir is None:
+                    continue
+                since = self._cursors[host.config.address]
+                for file_name in sorted(os.listdir(host_dir)):
+                    self._append_chunk(file_name, os.path.join(host_dir, file_name), since, until)
+                self._cursors[host.config.address] = until
+
+    @allure.step("Store logs since {since} until {until} to {target_dir}")
+    def store_window(self, target_dir: str, since: datetime, until: datetime) -> None:
+        """Writes logs of every service in the time window to the directory.
+
+        New logs are collected first, then the window is cut from the cache. Chunks that are
+        inside the window are copied as is, while lines of chunks on the window boundaries are
+        filtered by their timestamps. Lines without timestamp follow the previous line, and
+        chunks without timestamps at all are kept entirely.
+
+        Args:
+            target_dir: Directory for log files.
+            since: Start of the window, in UTC.
+            until: End of the window, in UTC.
+        """
+        if until > min(self._cursors.values(), default=until):
+            self.collect(until)
+        os.makedirs(target_dir, exist_ok=True)
+        with self._lock:
+            service_logs = list(self.service_logs.items())
+        # Files are written even for services without logs in the window, so they replace files
+        # of previous windows in the same directory
+        for file_name, service_log in service_logs:
+            chunks = [
+                chunk
+                for chunk in service_log.chunks
+                if chunk.since < until and chunk.until > since and chunk.end > chunk.start
+            ]
+            with open(service_log.path, "rb") as cache_file, open(
+                os.path.join(target_dir, file_name), "wb"
+            ) as target_file:
+                for chunk in chunks:
+                    cache_file.seek(chunk.start)
+                    if chunk.since >= since and chunk.until <= until:
+                        _copy_bytes(cache_file, target_file, chunk.end - chunk.start)
+                    else:
+                        _copy_lines_in_window(cache_file, target_file, chunk.end, since, until)
+
+    def _dump_host(self, host: Host, dump_dir: str, until: datetime) -> Optional[str]:
+        address = host.config.address
+        host_dir = os.path.join(dump_dir, address.replace("/", "_"))
+        os.makedirs(host_dir)
+        try:
+            host.dump_logs(host_dir, since=self._cursors[address], until=until)
+        except Exception as ex:
+            logger.warning(f"Exception during logs collection from {address}: {ex}")
+            return None
+        return host_dir
+
+    def _append_chunk(self, file_name: str, dump_path: str, since: datetime, until: datetime):
+        service_log = self.service_logs.get(file_name)
+        if service_log is None:
+            service_log = ServiceLog(os.path.join(self.cache_dir, file_name))
+            self.service_logs[file_name] = service_log
+        with open(service_log.path, "ab") as cache_file, open(dump_path, "rb") as dump_file:
+            start = cache_file.tell()
+            shutil.copyfileobj(dump_file, cache_file)
+            service_log.chunks.append(LogChunk(since, until, start, cache_file.tell()))
+
+
+def get_line_timestamp(line: bytes) -> Optional[datetime]:
+    """Returns time of the log line in UTC, if the line starts with a timestamp."""
+    match = LINE_TIMESTAMP_REGEX.match(line)
+    if not match:
+        return None
+    date, time, fraction, zone = match.groups()
+    timestamp = f"{date.decode()}T{time.decode()}"
+    if fraction:
+        timestamp += "." + fraction.decode()[:6].ljust(6, "0")
+    if zone:
+        zone = zone.decode()
+        timestamp += "+00:00" if zone == "Z" else f"{zone[:3]}:{zone[-2:]}"
+    try:
+        parsed = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return None
+    if parsed.tzinfo:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _copy_bytes(source, target, size: int, buffer_size: int = 1024 * 1024) -> None:
+    while size > 0:
+        data = source.read(min(size, buffer_size))
+        if not data:
+            break
+        target.write(data)
+        size -= len(data)
+
+
+def _copy_lines_in_window(source, target, end: int, since: datetime, until: datetime) -> None:
+    line_time = None
+    while source.tell() < end:
+        # Lines are not read past the end of the chunk, even if the chunk ends without newline
+        line = source.readline(end - source.tell())
+        if not line:
+            break
+        line_time = get_line_timestamp(line) or line_time
+        if line_time is None or since <= line_time <= until:
+            target.write(line)
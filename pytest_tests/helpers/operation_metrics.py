@@ -0,0 +1,238 @@
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Optional, Union
+
+import allure
+from latency_histogram import LatencyHistogram, get_bucket_upper_bound
+
+logger = logging.getLogger("NeoLogger")
+
+# Directory where metrics are written at the end of session, they are only attached to Allure
+# report if it is not set
+OPERATION_METRICS_DIR = os.getenv("OPERATION_METRICS_DIR")
+OPERATION_METRICS_FILE = "operation_metrics"
+PROMETHEUS_METRIC = "neofs_testcases_operation_duration_milliseconds"
+PROMETHEUS_PAYLOAD_METRIC = "neofs_testcases_operation_payload_bytes_total"
+# Buckets of Prometheus histogram in milliseconds, log-linear buckets of the registry are
+# folded into them on export
+PROMETHEUS_BUCKETS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+@dataclass
+class OperationStats:
+    """Latency statistics of an operation on an endpoint with a given outcome.
+
+    Attributes:
+        histogram: Histogram of durations in milliseconds.
+        count: Number of calls.
+        duration_sum: Total duration of calls in milliseconds.
+        payload_bytes: Total payload size of calls in bytes.
+    """
+
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    count: int = 0
+    duration_sum: float = 0.0
+    payload_bytes: int = 0
+
+
+class OperationMetricsRegistry:
+    """In-process registry of latency histograms of operations.
+
+    Statistics are keyed by operation, endpoint and outcome. Recording a call takes a single
+    lock and updates counters of a histogram, so it is cheap enough for every request of tests.
+    """
+
+    def __init__(self):
+        self._stats: dict[tuple[str, str, str], OperationStats] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self, operation: str, endpoint: str, outcome: str, duration: float, payload_size: int = 0
+    ) -> None:
+        """Records a single call of the operation.
+
+        Args:
+            operation: Name of the operation.
+            endpoint: Endpoint the operation was sent to.
+            outcome: Outcome of the call, "ok" or "error".
+            duration: Duration of the call in milliseconds.
+            payload_size: Size of the payload in bytes.
+        """
+        key = (operation, endpoint, outcome)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = OperationStats()
+            stats.histogram.record(duration)
+            stats.count += 1
+            stats.duration_sum += duration
+            stats.payload_bytes += payload_size
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def to_dict(self) -> list[dict]:
+        """Returns JSON-serializable statistics with percentiles and histograms."""
+        with self._lock:
+            items = sorted(self._stats.items())
+        return [
+            {
+                "operation": operation,
+                "endpoint": endpoint,
+                "outcome": outcome,
+                "count": stats.count,
+                "avg": stats.duration_sum / stats.count,
+                "p50": stats.histogram.percentile(50),
+                "p90": stats.histogram.percentile(90),
+                "p99": stats.histogram.percentile(99),
+                "payload_bytes": stats.payload_bytes,
+                "histogram": stats.histogram.to_dict(),
+            }
+            for (operation, endpoint, outcome), stats in items
+        ]
+
+    def to_prometheus(self) -> str:
+        """Returns statistics in Prometheus text exposition format."""
+        with self._lock:
+            items = sorted(self._stats.items())
+        lines = [
+            f"# HELP {PROMETHEUS_METRIC} Duration of test operations in milliseconds.",
+            f"# TYPE {PROMETHEUS_METRIC} histogram",
+        ]
+        for (operation, endpoint, outcome), stats in items:
+            labels = (
+                f'operation="{operation}",endpoint="{_escape_label(endpoint)}",'
+                f'outcome="{outcome}"'
+            )
+            upper_bounds = sorted(
+                (get_bucket_upper_bound(index, stats.histogram.sub_buckets), count)
+                for index, count in stats.histogram.counts.items()
+            )
+            for bucket in PROMETHEUS_BUCKETS:
+                cumulative = sum(count for bound, count in upper_bounds if bound <= bucket)
+                lines.append(f'{PROMETHEUS_METRIC}_bucket{{{labels},le="{bucket}"}} {cumulative}')
+            lines.append(f'{PROMETHEUS_METRIC}_bucket{{{labels},le="+Inf"}} {stats.count}')
+            lines.append(f"{PROMETHEUS_METRIC}_sum{{{labels}}} {stats.duration_sum}")
+            lines.append(f"{PROMETHEUS_METRIC}_count{{{labels}}} {stats.count}")
+
+        lines.append(f"# HELP {PROMETHEUS_PAYLOAD_METRIC} Payload of test operations in bytes.")
+        lines.append(f"# TYPE {PROMETHEUS_PAYLOAD_METRIC} counter")
+        for (operation, endpoint, outcome), stats in items:
+            lines.append(
+                f'{PROMETHEUS_PAYLOAD_METRIC}{{operation="{operation}",'
+                f'endpoint="{_escape_label(endpoint)}",outcome="{outcome}"}} '
+                f"{stats.payload_bytes}"
+            )
+        return "\n".join(lines) + "\n"
+
+
+operation_metrics = OperationMetricsRegistry()
+
+
+def timed_operation(
+    operation: str,
+    endpoint_arg: str = "endpoint",
+    payload_arg: Optional[str] = None,
+    payload_result: Union[bool, Callable[[Any], Any]] = False,
+) -> Callable:
+    """Decorator that records duration and outcome of every call into the registry.
+
+    It should be applied above allure.step, so Allure still sees the original signature.
+
+    Args:
+        operation: Name of the operation.
+        endpoint_arg: Argument with endpoint of the call: an endpoint string or a boto3/AWS CLI
+            S3 client.
+        payload_arg: Argument with payload of the call: path to a file or bytes.
+        payload_result: Whether the function returns payload (path to a file or bytes), or
+            a function that takes payload out of the result, e.g. out of a tuple.
+
+    Returns:
+        Decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start_time = perf_counter()
+            outcome = "error"
+            result = None
+            try:
+                result = func(*args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                duration = (perf_counter() - start_time) * 1000
+                try:
+                    arguments = signature.bind_partial(*args, **kwargs).arguments
+                    if callable(payload_result):
+                        payload = payload_result(result) if outcome == "ok" else None
+                    else:
+                        payload = result if payload_result else arguments.get(payload_arg)
+                    operation_metrics.record(
+                        operation,
+                        get_endpoint(arguments.get(endpoint_arg)),
+                        outcome,
+                        duration,
+                        _get_payload_size(payload),
+                    )
+                except Exception as err:
+                    logger.debug(f"Could not record metrics of {operation}: {err}")
+
+        return wrapper
+
+    return decorator
+
+
+@allure.step("Export operation metrics")
+def export_operation_metrics(metrics_dir: Optional[str] = OPERATION_METRICS_DIR) -> None:
+    """Attaches operation metrics as JSON and Prometheus text and writes them to a directory.
+
+    Args:
+        metrics_dir: Directory for metric files, files are not written if it is not set.
+    """
+    metrics_json = json.dumps(operation_metrics.to_dict(), indent=2)
+    metrics_prometheus = operation_metrics.to_prometheus()
+    allure.attach(metrics_json, "Operation metrics", allure.attachment_type.JSON)
+    allure.attach(metrics_prometheus, "Operation metrics (Prometheus)", allure.attachment_type.TEXT)
+    if not metrics_dir:
+        return
+    os.makedirs(metrics_dir, exist_ok=True)
+    with open(os.path.join(metrics_dir, f"{OPERATION_METRICS_FILE}.json"), "w") as file:
+        file.write(metrics_json)
+    with open(os.path.join(metrics_dir, f"{OPERATION_METRICS_FILE}.prom"), "w") as file:
+        file.write(metrics_prometheus)
+
+
+def get_endpoint(value: Any) -> str:
+    """Returns endpoint of an endpoint string or a boto3/AWS CLI S3 client."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    # boto3 clients keep endpoint in metadata, AWS CLI client keeps it as an attribute
+    meta = getattr(value, "meta", None)
+    if meta is not None and getattr(meta, "endpoint_url", None):
+        return meta.endpoint_url
+    return getattr(value, "s3gate_endpoint", "") or ""
+
+
+def _get_payload_size(payload: Any) -> int:
+    if isinstance(payload, (bytes, bytearray)):
+        return len(payload)
+    if isinstance(payload, str) and os.path.isfile(payload):
+        return os.path.getsize(payload)
+    return 0
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import base64
+import codecs
 import uuid
-from typing import Optional
+from time import sleep
+from typing import Iterator, Optional
 
 import allure
 from neofs_testlib.shell import Shell
@@ -9,17 +12,38 @@ from neofs_testlib.shell.interfaces import CommandOptions
 from tenacity import retry, stop_after_attempt, wait_fixed
 
 
+class _OutputStream:
+    """Output file of remote process that is read incrementally by byte offset."""
+
+    def __init__(self, file_name: str):
+        self.file_name = file_name
+        self.offset = 0
+        self.text = ""
+        self.last_read_position = 0
+        # Chunks may end in the middle of multibyte character, so incremental decoder is used
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def append(self, data: bytes) -> str:
+        self.offset += len(data)
+        new_text = self._decoder.decode(data)
+        self.text += new_text
+        return new_text
+
+    def read_new(self) -> str:
+        new_text = self.text[self.last_read_position :]
+        self.last_read_position = len(self.text)
+        return new_text
+
+
 class RemoteProcess:
     def __init__(self, cmd: str, process_dir: str, shell: Shell):
         self.process_dir = process_dir
         self.cmd = cmd
-        self.stdout_last_line_number = 0
-        self.stderr_last_line_number = 0
         self.pid: Optional[str] = None
         self.proc_rc: Optional[int] = None
-        self.saved_stdout: Optional[str] = None
-        self.saved_stderr: Optional[str] = None
         self.shell = shell
+        self._stdout = _OutputStream("stdout")
+        self._stderr = _OutputStream("stderr")
 
     @classmethod
     @allure.step("Create remote process")
@@ -57,25 +81,12 @@ class RemoteProcess:
             full: returns full stdout that we have to this moment
 
         Returns:
-            Fresh stdout. By means of stdout_last_line_number only new stdout lines are returned.
-            If process is finished (proc_rc is not None) saved stdout is returned
+            Fresh stdout, i.e. output produced since the previous call, or full stdout.
+            Only new bytes are transferred from the host, and nothing is transferred after
+            the process has finished and its output has been read.
         """
-        if self.saved_stdout is not None:
-            cur_stdout = self.saved_stdout
-        else:
-            terminal = self.shell.exec(f"cat {self.process_dir}/stdout")
-            if self.proc_rc is not None:
-                self.saved_stdout = terminal.stdout
-            cur_stdout = terminal.stdout
-
-        if full:
-            return cur_stdout
-        whole_stdout = cur_stdout.split("\n")
-        if len(whole_stdout) > self.stdout_last_line_number:
-            resulted_stdout = "\n".join(whole_stdout[self.stdout_last_line_number :])
-            self.stdout_last_line_number = len(whole_stdout)
-            return resulted_stdout
-        return ""
+        self.poll()
+        return self._stdout.text if full else self._stdout.read_new()
 
     @allure.step("Get process stderr")
     def stderr(self, full: bool = False) -> str:
@@ -86,38 +97,79 @@ class RemoteProcess:
             full: returns full stderr that we have to this moment
 
         Returns:
-            Fresh stderr. By means of stderr_last_line_number only new stderr lines are returned.
-            If process is finished (proc_rc is not None) saved stderr is returned
+            Fresh stderr, i.e. output produced since the previous call, or full stderr.
         """
-        if self.saved_stderr is not None:
-            cur_stderr = self.saved_stderr
-        else:
-            terminal = self.shell.exec(f"cat {self.process_dir}/stderr")
-            if self.proc_rc is not None:
-                self.saved_stderr = terminal.stdout
-            cur_stderr = terminal.stdout
-        if full:
-            return cur_stderr
-        whole_stderr = cur_stderr.split("\n")
-        if len(whole_stderr) > self.stderr_last_line_number:
-            resulted_stderr = "\n".join(whole_stderr[self.stderr_last_line_number :])
-            self.stderr_last_line_number = len(whole_stderr)
-            return resulted_stderr
-        return ""
+        self.poll()
+        return self._stderr.text if full else self._stderr.read_new()
 
     @allure.step("Get process rc")
     def rc(self) -> Optional[int]:
+        if self.proc_rc is None:
+            self.poll()
+        return self.proc_rc
+
+    def poll(self) -> tuple[str, str]:
+        """
+        Fetches return code and new output of the process in a single command.
+
+        Return code is read before the sizes of output files, so when the process is reported
+        as finished, its output is read completely.
+
+        Returns:
+            Stdout and stderr produced since the previous poll.
+        """
         if self.proc_rc is not None:
-            return self.proc_rc
+            return "", ""
+
+        streams = (self._stdout, self._stderr)
+        size_commands = [
+            f"size_{stream.file_name}=$(stat -c %s {stream.file_name} 2>/dev/null || echo 0)"
+            for stream in streams
+        ]
+        # New bytes are base64-encoded, so they are transferred intact and are easy to separate
+        read_commands = [
+            f"tail -c +{stream.offset + 1} {stream.file_name} "
+            f"| head -c $((size_{stream.file_name} - {stream.offset})) | base64 -w0; echo"
+            for stream in streams
+        ]
+        # Without the process directory the process would look running forever, so the command
+        # fails instead
+        command = "; ".join(
+            [
+                f"cd {self.process_dir} || exit 1",
+                "rc=$(cat rc 2>/dev/null)",
+                *size_commands,
+                'echo "rc=$rc"',
+                *read_commands,
+            ]
+        )
+        terminal = self.shell.exec(command)
+        rc_line, *chunks = terminal.stdout.split("\n")
+        new_output = tuple(
+            stream.append(base64.b64decode(chunk.strip())) for stream, chunk in zip(streams, chunks)
+        )
+        rc = rc_line.strip().removeprefix("rc=")
+        if rc:
+            self.proc_rc = int(rc)
+        return new_output
 
-        terminal = self.shell.exec(f"cat {self.process_dir}/rc", CommandOptions(check=False))
-        if "No such file or directory" in terminal.stderr:
-            return None
-        elif terminal.stderr or terminal.return_code != 0:
-            raise AssertionError(f"cat process rc was not successfull: {terminal.stderr}")
+    def iter_stdout(self, interval: float = 1) -> Iterator[str]:
+        """
+        Yields new stdout of the process as it appears, until the process is finished.
 
-        self.proc_rc = int(terminal.stdout)
-        return self.proc_rc
+        Args:
+            interval: delay in seconds between polls of the process
+
+        Yields:
+            Pieces of stdout produced since the previous poll.
+        """
+        while True:
+            new_stdout, _ = self.poll()
+            if new_stdout:
+                yield new_stdout
+            if self.proc_rc is not None:
+                return
+            sleep(interval)
 
     @allure.step("Check if process is running")
     def running(self) -> bool:
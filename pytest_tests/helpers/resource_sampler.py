@@ -0,0 +1,450 @@
+import json
+import logging
+import os
+import shlex
+import threading
+import uuid
+from dataclasses import asdict, dataclass, field
+from time import monotonic
+from typing import Optional
+
+import allure
+from neofs_testlib.hosting import Hosting
+from neofs_testlib.shell import CommandOptions, Shell
+
+logger = logging.getLogger("NeoLogger")
+
+# Interval between samples in seconds, 0 disables sampling of regular tests
+RESOURCE_SAMPLE_INTERVAL = float(os.getenv("RESOURCE_SAMPLE_INTERVAL", "0"))
+# Interval that is used for load runs, which are sampled always
+LOAD_RESOURCE_SAMPLE_INTERVAL = 5.0
+CHART_WIDTH = 640
+CHART_HEIGHT = 240
+CHART_MARGIN = 40
+CHART_COLORS = ("blue", "orange", "green", "red", "purple", "brown", "gray", "olive", "cyan")
+
+# Prints CPU ticks, RSS pages, number of FDs and I/O bytes of every process. Fields of stat file
+# are counted after the command name, because the name may contain spaces
+PROC_SAMPLE_COMMAND = (
+    'echo "$(getconf CLK_TCK) $(getconf PAGESIZE)"; '
+    "for pid in {pids}; do "
+    "[ -r /proc/$pid/stat ] || continue; "
+    "stat=$(sed 's/.*) //' /proc/$pid/stat | cut -d' ' -f12,13,22); "
+    "fds=$(ls /proc/$pid/fd 2>/dev/null | wc -l); "
+    "io=$(awk '/^(read|write)_bytes/ {{printf \"%s \", $2}}' /proc/$pid/io 2>/dev/null); "
+    'echo "$pid $stat $fds ${{io:-0 0}}"; '
+    "done"
+)
+# Samples processes of a host in background until it is killed, every sample starts with a line
+# with the time of the sample, so the output is fetched and parsed once when sampling stops
+REMOTE_SAMPLE_COMMAND = 'echo "sample $(date +%s.%N)"; {sample}'
+REMOTE_SAMPLER_COMMAND = "while true; do {sample}; sleep {interval}; done"
+REMOTE_SAMPLE_PREFIX = "sample "
+
+
+@dataclass
+class ProcessTarget:
+    """Process to sample.
+
+    Attributes:
+        name: Name of the service the process belongs to.
+        pid: PID of the process.
+        shell: Shell of the host of the process, None for processes on the local host.
+    """
+
+    name: str
+    pid: int
+    shell: Optional[Shell] = None
+
+
+@dataclass
+class ResourceSample:
+    """Resource usage of a process at some moment.
+
+    Attributes:
+        time: Seconds since start of sampling.
+        cpu: CPU cores used on average since the previous sample.
+        rss: Resident set size in bytes.
+        fds: Number of open file descriptors.
+        read_bytes: Bytes read from storage since start of the process.
+        write_bytes: Bytes written to storage since start of the process.
+    """
+
+    time: float
+    cpu: float
+    rss: int
+    fds: int
+    read_bytes: int
+    write_bytes: int
+
+
+@dataclass
+class _ProcessCounters:
+    cpu_seconds: float
+    rss: int
+    fds: int
+    read_bytes: int
+    write_bytes: int
+
+
+@dataclass
+class ResourceSummary:
+    """Resource usage of a process over the sampled period.
+
+    Attributes:
+        cpu_avg: Average number of used CPU cores.
+        cpu_max: Maximum number of used CPU cores between two samples.
+        rss_max: Maximum resident set size in bytes.
+        rss_growth: Change of resident set size in bytes.
+        fds_max: Maximum number of open file descriptors.
+        fds_growth: Change of the number of open file descriptors.
+        read_bytes: Bytes read from storage.
+        write_bytes: Bytes written to storage.
+    """
+
+    cpu_avg: float = 0.0
+    cpu_max: float = 0.0
+    rss_max: int = 0
+    rss_growth: int = 0
+    fds_max: int = 0
+    fds_growth: int = 0
+    read_bytes: int = 0
+    write_bytes: int = 0
+
+
+@dataclass
+class ResourceSampler:
+    """Periodically samples /proc statistics of processes in the background.
+
+    Processes of a host with a shell are sampled by a single background loop that is started
+    over the host shell and writes samples to a file on the host. The file is fetched once when
+    sampling stops, so samples are not reported one by one. Processes without a shell are read
+    from /proc directly.
+
+    Attributes:
+        targets: Processes to sample.
+        interval: Interval between samples in seconds.
+        samples: Samples by process name.
+    """
+
+    targets: list[ProcessTarget]
+    interval: float = LOAD_RESOURCE_SAMPLE_INTERVAL
+    samples: dict[str, list[ResourceSample]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._previous: dict[str, tuple[float, _ProcessCounters]] = {}
+        self._start_time = 0.0
+        self._remote_samplers: list[_RemoteSampler] = []
+
+    def __enter__(self) -> "ResourceSampler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self._stop_event.clear()
+        self._start_time = monotonic()
+        targets_by_shell: dict[int, list[ProcessTarget]] = {}
+        for target in self.targets:
+            if target.shell is not None:
+                targets_by_shell.setdefault(id(target.shell), []).append(target)
+        for targets in targets_by_shell.values():
+            try:
+                self._remote_samplers.append(_RemoteSampler.start(targets, self.interval))
+            except Exception as err:
+                logger.warning(f"Could not sample resources of {[t.name for t in targets]}: {err}")
+        if any(target.shell is None for target in self.targets):
+            self._thread = threading.Thread(target=self._run, name="ResourceSampler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        for remote_sampler in self._remote_samplers:
+            try:
+                for sample_time, counters in remote_sampler.stop():
+                    self._record(counters, sample_time)
+            except Exception as err:
+                logger.warning(f"Could not fetch resource samples of {remote_sampler.names}: {err}")
+        self._remote_samplers = []
+
+    def summarize(self) -> dict[str, ResourceSummary]:
+        """Returns resource usage of every process over the sampled period."""
+        summaries = {}
+        for name, samples in self.samples.items():
+            if not samples:
+                continue
+            first, last = samples[0], samples[-1]
+            cpu_samples = [sample.cpu for sample in samples[1:]]
+            summaries[name] = ResourceSummary(
+                cpu_avg=sum(cpu_samples) / len(cpu_samples) if cpu_samples else 0.0,
+                cpu_max=max(cpu_samples, default=0.0),
+                rss_max=max(sample.rss for sample in samples),
+                rss_growth=last.rss - first.rss,
+                fds_max=max(sample.fds for sample in samples),
+                fds_growth=last.fds - first.fds,
+                read_bytes=last.read_bytes - first.read_bytes,
+                write_bytes=last.write_bytes - first.write_bytes,
+            )
+        return summaries
+
+    @allure.step("Attach resource usage")
+    def attach(self, name: str = "Resource usage") -> None:
+        """Attaches summary table, charts of RSS and FDs and raw samples to Allure report.
+
+        Args:
+            name: Prefix of attachment names.
+        """
+        if not self.samples:
+            logger.warning("No resource samples were collected")
+            return
+        rows = [
+            f"{'process':<24}{'CPU avg':>9}{'CPU max':>9}{'RSS max, MiB':>14}"
+            f"{'RSS growth':>12}{'FDs max':>9}{'FDs growth':>12}{'read, MiB':>11}{'write, MiB':>12}"
+        ]
+        for process, summary in self.summarize().items():
+            rows.append(
+                f"{process:<24}{summary.cpu_avg:>9.2f}{summary.cpu_max:>9.2f}"
+                f"{summary.rss_max / 1024 / 1024:>14.1f}"
+                f"{summary.rss_growth / 1024 / 1024:>+12.1f}{summary.fds_max:>9}"
+                f"{summary.fds_growth:>+12}{summary.read_bytes / 1024 / 1024:>11.1f}"
+                f"{summary.write_bytes / 1024 / 1024:>12.1f}"
+            )
+        allure.attach("\n".join(rows), f"{name} summary", allure.attachment_type.TEXT)
+        allure.attach(
+            self._get_chart("rss", 1024 * 1024, "RSS, MiB"),
+            f"{name} RSS",
+            allure.attachment_type.SVG,
+        )
+        allure.attach(
+            self._get_chart("fds", 1, "Open FDs"), f"{name} FDs", allure.attachment_type.SVG
+        )
+        allure.attach(
+            json.dumps(
+                {
+                    process: {
+                        metric: [sample[metric] for sample in map(asdict, samples)]
+                        for metric in ResourceSample.__dataclass_fields__
+                    }
+                    for process, samples in self.samples.items()
+                }
+            ),
+            f"{name} samples",
+            allure.attachment_type.JSON,
+        )
+
+    def _run(self) -> None:
+        local_targets = [target for target in self.targets if target.shell is None]
+        while True:
+            self._record(_read_local_counters(local_targets), monotonic() - self._start_time)
+            if self._stop_event.wait(self.interval):
+                # Take the last sample, so the whole period is covered
+                self._record(_read_local_counters(local_targets), monotonic() - self._start_time)
+                return
+
+    def _record(self, counters: dict[str, _ProcessCounters], sample_time: float) -> None:
+        for name, current in counters.items():
+            previous_time, previous = self._previous.get(name, (0.0, None))
+            elapsed = sample_time - previous_time
+            cpu = (current.cpu_seconds - previous.cpu_seconds) / elapsed if previous else 0.0
+            self.samples.setdefault(name, []).append(
+                ResourceSample(
+                    time=round(sample_time, 3),
+                    cpu=round(cpu, 3),
+                    rss=current.rss,
+                    fds=current.fds,
+                    read_bytes=current.read_bytes,
+                    write_bytes=current.write_bytes,
+                )
+            )
+            self._previous[name] = (sample_time, current)
+
+    def _get_chart(self, metric: str, scale: float, title: str) -> str:
+        series = {
+            process: [(sample.time, getattr(sample, metric) / scale) for sample in samples]
+            for process, samples in self.samples.items()
+        }
+        max_time = max((time for values in series.values() for time, _ in values), default=0) or 1
+        max_value = max((value for values in series.values() for _, value in values), default=0)
+        max_value = max_value or 1
+        plot_width = CHART_WIDTH - 2 * CHART_MARGIN
+        plot_height = CHART_HEIGHT - 2 * CHART_MARGIN
+        bottom = CHART_HEIGHT - CHART_MARGIN
+
+        elements = [
+            f'<line x1="{CHART_MARGIN}" y1="{bottom}" x2="{CHART_WIDTH - CHART_MARGIN}" '
+            f'y2="{bottom}" stroke="black"/>',
+            f'<line x1="{CHART_MARGIN}" y1="{CHART_MARGIN}" x2="{CHART_MARGIN}" y2="{bottom}" '
+            f'stroke="black"/>',
+            f'<text x="5" y="{CHART_MARGIN - 10}">{title} (max {max_value:.1f}), '
+            f"time up to {max_time:.0f} s</text>",
+        ]
+        for index, (process, values) in enumerate(sorted(series.items())):
+            color = CHART_COLORS[index % len(CHART_COLORS)]
+            points = " ".join(
+                f"{CHART_MARGIN + time / max_time * plot_width:.1f},"
+                f"{bottom - value / max_value * plot_height:.1f}"
+                for time, value in values
+            )
+            elements.append(
+                f'<polyline points="{points}" fill="none" stroke="{color}" stroke-width="1.5"/>'
+            )
+            elements.append(
+                f'<text x="{CHART_WIDTH - CHART_MARGIN + 5}" y="{CHART_MARGIN + index * 14}" '
+                f'fill="{color}" font-size="10">{process}</text>'
+            )
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{CHART_WIDTH + 120}" '
+            f'height="{CHART_HEIGHT}">{"".join(elements)}</svg>'
+        )
+
+
+def get_hosting_process_targets(hosting: Hosting) -> list[ProcessTarget]:
+    """Returns processes of all services of the hosted cluster.
+
+    Args:
+        hosting: Hosting of the cluster.
+
+    Returns:
+        Processes of services that are running.
+    """
+    targets = []
+    for host in hosting.hosts:
+        shell = host.get_shell()
+        for service_config in host.config.services:
+            try:
+                pid = int(host.get_service_pid(service_config.name))
+            except Exception as err:
+                logger.info(f"Could not get PID of {service_config.name}: {err}")
+                continue
+            targets.append(ProcessTarget(name=service_config.name, pid=pid, shell=shell))
+    return targets
+
+
+def get_neofs_env_process_targets(neofs_env) -> list[ProcessTarget]:
+    """Returns processes of all services of local NeoFSEnv.
+
+    Args:
+        neofs_env: Local environment.
+
+    Returns:
+        Processes of services that are running.
+    """
+    services = {
+        **{f"ir_{index}": node for index, node in enumerate(neofs_env.inner_ring_nodes)},
+        **{f"sn_{index}": node for index, node in enumerate(neofs_env.storage_nodes)},
+        "s3_gw": neofs_env.s3_gw,
+        "http_gw": neofs_env.http_gw,
+    }
+    return [
+        ProcessTarget(name=name, pid=service.process.pid)
+        for name, service in services.items()
+        if service is not None and getattr(service, "process", None) is not None
+    ]
+
+
+def _read_local_counters(targets: list[ProcessTarget]) -> dict[str, _ProcessCounters]:
+    clock_ticks = os.sysconf("SC_CLK_TCK")
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    counters = {}
+    for target in targets:
+        try:
+            with open(f"/proc/{target.pid}/stat", "r") as file:
+                fields = file.read().rsplit(")", 1)[1].split()
+            fds = len(os.listdir(f"/proc/{target.pid}/fd"))
+        except OSError:
+            continue
+        io = {}
+        try:
+            with open(f"/proc/{target.pid}/io", "r") as file:
+                io = dict(line.split(": ") for line in file.read().splitlines())
+        except OSError:
+            pass
+        counters[target.name] = _ProcessCounters(
+            cpu_seconds=(int(fields[11]) + int(fields[12])) / clock_ticks,
+            rss=int(fields[21]) * page_size,
+            fds=fds,
+            read_bytes=int(io.get("read_bytes", 0)),
+            write_bytes=int(io.get("write_bytes", 0)),
+        )
+    return counters
+
+
+class _RemoteSampler:
+    """Background loop that samples processes of a host into a file on the host."""
+
+    def __init__(
+        self, targets: list[ProcessTarget], sample_command: str, output_path: str, pid: str
+    ):
+        self.targets = targets
+        self.sample_command = sample_command
+        self.output_path = output_path
+        self.pid = pid
+
+    @property
+    def names(self) -> list[str]:
+        return [target.name for target in self.targets]
+
+    @classmethod
+    def start(cls, targets: list[ProcessTarget], interval: float) -> "_RemoteSampler":
+        sample_command = REMOTE_SAMPLE_COMMAND.format(
+            sample=PROC_SAMPLE_COMMAND.format(pids=" ".join(str(target.pid) for target in targets))
+        )
+        loop = REMOTE_SAMPLER_COMMAND.format(sample=sample_command, interval=interval)
+        output_path = f"/tmp/resource_samples_{uuid.uuid4()}"
+        terminal = targets[0].shell.exec(
+            f"nohup sh -c {shlex.quote(loop)} </dev/null >{output_path} 2>/dev/null & echo $!"
+        )
+        return cls(targets, sample_command, output_path, terminal.stdout.strip())
+
+    def stop(self) -> list[tuple[float, dict[str, _ProcessCounters]]]:
+        """Stops the loop and returns samples with their times in seconds since the first one.
+
+        The last sample is taken when the loop is stopped, so the whole period is covered.
+        """
+        terminal = self.targets[0].shell.exec(
+            f"kill {self.pid}; {{ {self.sample_command}; }} >>{self.output_path}; "
+            f"cat {self.output_path}; rm -f {self.output_path}",
+            CommandOptions(check=False),
+        )
+        return _parse_remote_samples(terminal.stdout, self.targets)
+
+
+def _parse_remote_samples(
+    output: str, targets: list[ProcessTarget]
+) -> list[tuple[float, dict[str, _ProcessCounters]]]:
+    names = {target.pid: target.name for target in targets}
+    samples = []
+    first_time = None
+    clock_ticks = page_size = None
+    for line in output.splitlines():
+        if line.startswith(REMOTE_SAMPLE_PREFIX):
+            sample_time = float(line.removeprefix(REMOTE_SAMPLE_PREFIX))
+            first_time = sample_time if first_time is None else first_time
+            samples.append((round(sample_time - first_time, 3), {}))
+            clock_ticks = page_size = None
+            continue
+        values = line.split()
+        if not samples or not all(value.isdigit() for value in values):
+            continue
+        if clock_ticks is None and len(values) == 2:
+            clock_ticks, page_size = (int(value) for value in values)
+            continue
+        # The last sample may be cut off when the loop is killed
+        if clock_ticks is None or len(values) != 7 or int(values[0]) not in names:
+            continue
+        pid, utime, stime, rss, fds, read_bytes, write_bytes = (int(value) for value in values)
+        samples[-1][1][names[pid]] = _ProcessCounters(
+            cpu_seconds=(utime + stime) / clock_ticks,
+            rss=rss * page_size,
+            fds=fds,
+            read_bytes=read_bytes,
+            write_bytes=write_bytes,
+        )
+    return samples
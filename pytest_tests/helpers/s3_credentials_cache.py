@@ -0,0 +1,159 @@
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Callable, Optional
+
+import allure
+import boto3
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+from file_helper import get_file_hash
+
+logger = logging.getLogger("NeoLogger")
+
+# Directory where issued credentials are kept between test sessions. Credentials are stored in
+# plain text, so persistence is disabled unless the directory is specified explicitly
+S3_CREDENTIALS_CACHE_DIR = os.getenv("S3_CREDENTIALS_CACHE_DIR")
+S3_CREDENTIALS_CHECK_TIMEOUT = 10
+
+_s3_credentials: dict[str, tuple] = {}
+
+
+def make_s3_credentials_key(
+    wallet_path: str,
+    gate_public_key: str,
+    bearer_rules_file: str,
+    policy: Optional[Any] = None,
+) -> str:
+    """Builds key of S3 credentials that are issued with the same parameters.
+
+    Files are identified by their content, so changes of a wallet, bearer rules or policy
+    file invalidate the credentials issued with the previous version.
+
+    Args:
+        wallet_path: Path to the wallet of credentials owner.
+        gate_public_key: Public key of S3 gate the credentials are issued for.
+        bearer_rules_file: Path to the bearer rules file.
+        policy: Container policy (or path to the policy file) of the credentials container.
+
+    Returns:
+        Hex-encoded hash of the parameters.
+    """
+    key_fields = [
+        os.path.abspath(wallet_path),
+        get_file_hash(wallet_path),
+        gate_public_key,
+        get_file_hash(bearer_rules_file),
+        _get_policy_fingerprint(policy),
+    ]
+    return hashlib.sha256(json.dumps(key_fields).encode("utf-8")).hexdigest()
+
+
+@allure.step("Get S3 credentials")
+def get_s3_credentials(
+    key: str,
+    env_id: str,
+    issue: Callable[[], tuple],
+    is_valid: Callable[[tuple], bool],
+) -> tuple:
+    """Returns S3 credentials issued earlier with the same parameters or issues new ones.
+
+    Credentials are kept for the whole test session and, if S3_CREDENTIALS_CACHE_DIR is set,
+    in a file of the environment, so they survive between sessions. Cached credentials are
+    used only if they still pass the validity check.
+
+    Args:
+        key: Key of the credentials, see make_s3_credentials_key.
+        env_id: Identity of the environment (e.g. its endpoints) the credentials belong to.
+        issue: Function that issues new credentials.
+        is_valid: Function that checks whether cached credentials are accepted by S3 gate.
+
+    Returns:
+        Credentials in the same form as they are returned by the issue function.
+    """
+    cache_key = f"{env_id}:{key}"
+    credentials = _s3_credentials.get(cache_key) or _load_s3_credentials(env_id).get(key)
+    if credentials and is_valid(credentials):
+        logger.info(f"Reusing S3 credentials {key}")
+        _s3_credentials[cache_key] = credentials
+        return credentials
+
+    credentials = tuple(issue())
+    _s3_credentials[cache_key] = credentials
+    _store_s3_credentials(env_id, key, credentials)
+    return credentials
+
+
+def are_s3_credentials_valid(
+    access_key_id: str, secret_access_key: str, s3gate_endpoint: str
+) -> bool:
+    """Checks that S3 gate accepts the credentials with a cheap ListBuckets request.
+
+    Args:
+        access_key_id: Access key ID of the credentials.
+        secret_access_key: Secret access key of the credentials.
+        s3gate_endpoint: Endpoint of S3 gate.
+
+    Returns:
+        True if the request succeeded.
+    """
+    s3_client = boto3.Session().client(
+        service_name="s3",
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+        config=Config(
+            connect_timeout=S3_CREDENTIALS_CHECK_TIMEOUT,
+            read_timeout=S3_CREDENTIALS_CHECK_TIMEOUT,
+            retries={"max_attempts": 1},
+        ),
+        endpoint_url=s3gate_endpoint,
+        verify=False,
+    )
+    try:
+        s3_client.list_buckets()
+    except (BotoCoreError, ClientError) as err:
+        logger.info(f"Cached S3 credentials are rejected: {err}")
+        return False
+    return True
+
+
+def _get_policy_fingerprint(policy: Optional[Any]) -> str:
+    if isinstance(policy, str) and os.path.isfile(policy):
+        return get_file_hash(policy)
+    return json.dumps(policy, sort_keys=True)
+
+
+def _get_cache_file_path(env_id: str) -> Optional[str]:
+    if not S3_CREDENTIALS_CACHE_DIR:
+        return None
+    env_hash = hashlib.sha256(env_id.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(S3_CREDENTIALS_CACHE_DIR, f"s3_credentials_{env_hash}.json")
+
+
+def _load_s3_credentials(env_id: str) -> dict[str, tuple]:
+    file_path = _get_cache_file_path(env_id)
+    if not file_path or not os.path.exists(file_path):
+        return {}
+    try:
+        with open(file_path, "r") as file:
+            return {key: tuple(value) for key, value in json.load(file).items()}
+    except (OSError, ValueError) as err:
+        logger.warning(f"Could not read S3 credentials cache {file_path}: {err}")
+        return {}
+
+
+def _store_s3_credentials(env_id: str, key: str, credentials: tuple) -> None:
+    file_path = _get_cache_file_path(env_id)
+    if not file_path:
+        return
+    cached_credentials = _load_s3_credentials(env_id)
+    cached_credentials[key] = credentials
+
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    # File is replaced atomically, so concurrent sessions never read partially written cache
+    tmp_file_path = f"{file_path}.{os.getpid()}.tmp"
+    with open(tmp_file_path, "w") as file:
+        json.dump(cached_credentials, file)
+    os.chmod(tmp_file_path, 0o600)
+    os.replace(tmp_file_path, file_path)
@@ -56,19 +56,16 @@ def check_objects_in_bucket(
     s3_client, bucket, expected_objects: list, unexpected_objects: Optional[list] = None
 ) -> None:
     unexpected_objects = unexpected_objects or []
-    bucket_objects = s3_gate_object.list_objects_s3(s3_client, bucket)
+    bucket_objects = set(s3_gate_object.iter_objects_s3(s3_client, bucket))
     assert len(bucket_objects) == len(
         expected_objects
-    ), f"Expected {len(expected_objects)} objects in the bucket"
-    for bucket_object in expected_objects:
-        assert (
-            bucket_object in bucket_objects
-        ), f"Expected object {bucket_object} in objects list {bucket_objects}"
+    ), f"Expected {len(expected_objects)} objects in the bucket, got {len(bucket_objects)}"
 
-    for bucket_object in unexpected_objects:
-        assert (
-            bucket_object not in bucket_objects
-        ), f"Expected object {bucket_object} not in objects list {bucket_objects}"
+    missing_objects = set(expected_objects) - bucket_objects
+    assert not missing_objects, f"Expected objects {sorted(missing_objects)} in the bucket"
+
+    present_objects = bucket_objects.intersection(unexpected_objects)
+    assert not present_objects, f"Expected objects {sorted(present_objects)} not in the bucket"
 
 
 @allure.step("Try to get object and got error")
@@ -0,0 +1,198 @@
+import hashlib
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
+LOCAL_FILE_HEADER_SIGNATURE = b"PK\x03\x04"
+DATA_DESCRIPTOR_SIGNATURE = b"PK\x07\x08"
+
+_LOCAL_FILE_HEADER = struct.Struct("<4sHHHHHIIIHH")
+_ZIP64_EXTRA_ID = 0x0001
+_FLAG_DATA_DESCRIPTOR = 0x08
+_METHOD_STORED = 0
+_METHOD_DEFLATED = 8
+
+
+@dataclass
+class ZipEntry:
+    """File read from ZIP archive stream.
+
+    Attributes:
+        name: Name of the file in the archive.
+        sha256: Hex-encoded SHA-256 hash of the uncompressed content.
+        size: Size of the uncompressed content in bytes.
+    """
+
+    name: str
+    sha256: str
+    size: int
+
+
+def iter_zip_entries(chunks: Iterable[bytes]) -> Iterator[ZipEntry]:
+    """Reads ZIP archive sequentially and hashes its files without saving them.
+
+    Files are parsed by their local headers as the chunks arrive, so the archive may be
+    consumed directly from network. Entries written in streaming mode (with data descriptor
+    and without sizes in the local header) are supported for stored and deflated files, as
+    they are produced by HTTP gate.
+
+    Args:
+        chunks: Consecutive pieces of the archive.
+
+    Yields:
+        Files of the archive in the order they are stored; the central directory is skipped.
+    """
+    reader = _ChunkReader(chunks)
+    while reader.peek(4) == LOCAL_FILE_HEADER_SIGNATURE:
+        (
+            _,
+            _,
+            flags,
+            method,
+            _,
+            _,
+            _,
+            compressed_size,
+            _,
+            name_length,
+            extra_length,
+        ) = _LOCAL_FILE_HEADER.unpack(reader.read(_LOCAL_FILE_HEADER.size))
+        name = reader.read(name_length).decode("utf-8")
+        extra = reader.read(extra_length)
+        if compressed_size == 0xFFFFFFFF:
+            compressed_size = _get_zip64_compressed_size(extra)
+
+        file_hash = hashlib.sha256()
+        size = 0
+
+        def consume(data: bytes) -> None:
+            nonlocal size
+            file_hash.update(data)
+            size += len(data)
+
+        has_descriptor = bool(flags & _FLAG_DATA_DESCRIPTOR)
+        if method == _METHOD_STORED and has_descriptor:
+            _read_stored_until_descriptor(reader, consume)
+        elif method == _METHOD_STORED:
+            reader.read_into(compressed_size, consume)
+        elif method == _METHOD_DEFLATED:
+            consumed = _read_deflated(reader, consume, None if has_descriptor else compressed_size)
+            if has_descriptor:
+                _skip_data_descriptor(reader, consumed)
+        else:
+            raise AssertionError(f"Unsupported compression method {method} of {name} in ZIP")
+
+        yield ZipEntry(name=name, sha256=file_hash.hexdigest(), size=size)
+
+
+class _ChunkReader:
+    """Buffer over the chunks that keeps only unread bytes."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self.buffer = bytearray()
+
+    def fill(self) -> bool:
+        for chunk in self._chunks:
+            if chunk:
+                self.buffer.extend(chunk)
+                return True
+        return False
+
+    def peek(self, size: int) -> bytes:
+        while len(self.buffer) < size and self.fill():
+            pass
+        return bytes(self.buffer[:size])
+
+    def take(self, size: int) -> bytes:
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+    def read(self, size: int) -> bytes:
+        data = self.peek(size)
+        if len(data) < size:
+            raise AssertionError("Unexpected end of ZIP stream")
+        return self.take(size)
+
+    def read_into(self, size: int, consume: Callable[[bytes], None]) -> None:
+        while size:
+            if not self.buffer and not self.fill():
+                raise AssertionError("Unexpected end of ZIP stream")
+            data = self.take(size)
+            consume(data)
+            size -= len(data)
+
+    def unread(self, data: bytes) -> None:
+        self.buffer[:0] = data
+
+
+def _get_zip64_compressed_size(extra: bytes) -> int:
+    offset = 0
+    while offset + 4 <= len(extra):
+        header_id, data_size = struct.unpack_from("<HH", extra, offset)
+        if header_id == _ZIP64_EXTRA_ID:
+            # Uncompressed size goes first, then compressed one
+            return struct.unpack_from("<Q", extra, offset + 12)[0]
+        offset += 4 + data_size
+    raise AssertionError("ZIP64 extra field is missing")
+
+
+def _read_stored_until_descriptor(reader: _ChunkReader, consume: Callable[[bytes], None]) -> None:
+    # Size of stored data is unknown, so the data ends at the first descriptor signature
+    # followed by CRC and size of the data read so far
+    crc = 0
+    size = 0
+
+    def consume_data(data: bytes) -> None:
+        nonlocal crc, size
+        crc = zlib.crc32(data, crc)
+        size += len(data)
+        consume(data)
+
+    signature_length = len(DATA_DESCRIPTOR_SIGNATURE)
+    while True:
+        index = reader.buffer.find(DATA_DESCRIPTOR_SIGNATURE)
+        if index == -1:
+            # Signature might be split between chunks, keep its possible beginning
+            if len(reader.buffer) >= signature_length:
+                consume_data(reader.take(len(reader.buffer) - signature_length + 1))
+            if not reader.fill():
+                raise AssertionError("Unexpected end of ZIP stream")
+            continue
+
+        consume_data(reader.take(index))
+        descriptor = reader.peek(24)
+        if len(descriptor) >= 16:
+            descriptor_crc, size_32 = struct.unpack_from("<II", descriptor, 4)
+            if descriptor_crc == crc and size_32 == size & 0xFFFFFFFF:
+                reader.take(24 if size > 0xFFFFFFFF else 16)
+                return
+        consume_data(reader.take(signature_length))
+
+
+def _read_deflated(
+    reader: _ChunkReader, consume: Callable[[bytes], None], compressed_size: int | None
+) -> int:
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+    consumed = 0
+    while not decompressor.eof:
+        if not reader.buffer and not reader.fill():
+            raise AssertionError("Unexpected end of ZIP stream")
+        data = reader.take(len(reader.buffer))
+        consume(decompressor.decompress(data))
+        consumed += len(data) - len(decompressor.unused_data)
+    reader.unread(decompressor.unused_data)
+    if compressed_size is not None and consumed != compressed_size:
+        raise AssertionError(f"Expected {compressed_size} compressed bytes, got {consumed}")
+    return consumed
+
+
+def _skip_data_descriptor(reader: _ChunkReader, compressed_size: int) -> None:
+    if reader.peek(4) == DATA_DESCRIPTOR_SIGNATURE:
+        reader.take(4)
+    reader.read(4)  # CRC-32
+    (size_32,) = struct.unpack("<I", reader.peek(4))
+    # ZIP64 descriptors have 8-byte sizes
+    reader.read(8 if compressed_size <= 0xFFFFFFFF and size_32 == compressed_size else 16)
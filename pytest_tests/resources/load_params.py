@@ -23,7 +23,43 @@ DELETERS = [int(d) for d in os.getenv("DELETERS", "0").split(",")]
 LOAD_TIME = [int(ld) for ld in os.getenv("LOAD_TIME", "200").split(",")]
 LOAD_TYPE = os.getenv("LOAD_TYPE", "grpc").split(",")
 LOAD_NODES_COUNT = [int(ldc) for ldc in os.getenv("LOAD_NODES_COUNT", "1").split(",")]
+# Prepare a single dataset and split its objects between load nodes instead of preparing a
+# separate dataset on every load node
+LOAD_SHARED_DATASET = os.getenv("LOAD_SHARED_DATASET", "false").lower() == "true"
+# Collect latency histograms from every metric point written by k6, which loads the load node
+# and its disk; summary percentiles of k6 are used otherwise
+LOAD_LATENCY_HISTOGRAMS = os.getenv("LOAD_LATENCY_HISTOGRAMS", "false").lower() == "true"
+# Fail load runs that regressed against the benchmark history, runs are only recorded otherwise
+LOAD_REGRESSION_CHECK = os.getenv("LOAD_REGRESSION_CHECK", "false").lower() == "true"
 STORAGE_NODE_COUNT = [int(s) for s in os.getenv("STORAGE_NODE_COUNT", "4").split(",")]
 CONTAINER_PLACEMENT_POLICY = os.getenv(
     "CONTAINER_PLACEMENT_POLICY", "REP 1 IN X CBF 1 SELECT 1  FROM * AS X"
 )
+
+# Load profile parameters: numbers of virtual users of every load node by stage, duration of a
+# stage in seconds, p99 latency SLO in milliseconds and share of readers among virtual users
+LOAD_PROFILE_STAGES = [
+    int(s) for s in os.getenv("LOAD_PROFILE_STAGES", "10,25,50,100,200").split(",")
+]
+LOAD_PROFILE_STAGE_TIME = int(os.getenv("LOAD_PROFILE_STAGE_TIME", "60"))
+LOAD_PROFILE_LATENCY_SLO = float(os.getenv("LOAD_PROFILE_LATENCY_SLO", "500"))
+LOAD_PROFILE_READ_RATIO = float(os.getenv("LOAD_PROFILE_READ_RATIO", "0"))
+
+# Built-in Python load generator parameters, used with local NeoFSEnv
+PYTHON_LOAD_TIME = int(os.getenv("PYTHON_LOAD_TIME", "30"))
+PYTHON_LOAD_WRITERS = int(os.getenv("PYTHON_LOAD_WRITERS", "4"))
+PYTHON_LOAD_READERS = int(os.getenv("PYTHON_LOAD_READERS", "4"))
+PYTHON_LOAD_DELETERS = int(os.getenv("PYTHON_LOAD_DELETERS", "1"))
+PYTHON_LOAD_OBJ_SIZE = int(os.getenv("PYTHON_LOAD_OBJ_SIZE", "1024"))
+
+# S3 gate micro-benchmark parameters, the benchmark is skipped unless it is enabled explicitly,
+# so it does not run along with functional S3 gate tests
+S3_BENCHMARK_ENABLED = os.getenv("S3_BENCHMARK_ENABLED", "false").lower() == "true"
+S3_BENCHMARK_CONCURRENCY = [
+    int(c) for c in os.getenv("S3_BENCHMARK_CONCURRENCY", "1,8,32").split(",")
+]
+S3_BENCHMARK_OBJ_SIZE = [
+    int(o) for o in os.getenv("S3_BENCHMARK_OBJ_SIZE", "4096,1048576").split(",")
+]
+S3_BENCHMARK_OBJ_COUNT = int(os.getenv("S3_BENCHMARK_OBJ_COUNT", "200"))
+S3_BENCHMARK_RESULTS_DIR = os.getenv("S3_BENCHMARK_RESULTS_DIR", "s3_benchmark")
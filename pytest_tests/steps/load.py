@@ -1,18 +1,32 @@
 import concurrent.futures
+import logging
 import re
-from dataclasses import asdict
+from dataclasses import dataclass, field
+from typing import Optional, Union
 
 import allure
 from common import STORAGE_NODE_SERVICE_NAME_REGEX
-from k6 import K6, LoadParams, LoadResults
+from k6 import K6, LatencyStats, LoadParams, LoadResults, split_pregen_dataset
+from latency_histogram import merge_histograms
 from neofs_testlib.cli.neofs_authmate import NeofsAuthmate
 from neofs_testlib.cli.neogo import NeoGo
 from neofs_testlib.hosting import Hosting
 from neofs_testlib.shell import CommandOptions, SSHShell
 from neofs_testlib.shell.interfaces import InteractiveInput
 
+logger = logging.getLogger("NeoLogger")
+
 NEOFS_AUTHMATE_PATH = "neofs-s3-authmate"
 STOPPED_HOSTS = []
+# Fields of load results that are rates and are summed over load nodes
+LOAD_RATE_FIELDS = (
+    "data_sent",
+    "data_received",
+    "read_ops",
+    "write_ops",
+    "total_ops",
+    "delete_ops",
+)
 
 
 @allure.title("Get services endpoints")
@@ -94,8 +108,8 @@ def init_s3_client(
 
 
 @allure.title("Prepare objects")
-def prepare_objects(k6_instance: K6):
-    k6_instance.prepare()
+def prepare_objects(k6_instance: K6, endpoint: Optional[str] = None):
+    k6_instance.prepare(endpoint)
 
 
 @allure.title("Prepare K6 instances and objects")
@@ -106,16 +120,47 @@ def prepare_k6_instances(
     load_params: LoadParams,
     ssh_port: int,
     prepare: bool = True,
+    shared_dataset: bool = False,
 ) -> list[K6]:
+    """Creates K6 instances on load nodes and prepares containers and objects for them.
+
+    Presets of load nodes are run concurrently and every load node sends its preset traffic to
+    its own endpoint. With a shared dataset, the preset is run once (spread over all endpoints)
+    and every load node gets a disjoint slice of its objects.
+
+    Args:
+        load_nodes: Addresses of load nodes.
+        login: SSH login of load nodes.
+        pkey: Path to SSH private key of load nodes.
+        load_params: Parameters of the load.
+        ssh_port: SSH port of load nodes.
+        prepare: Whether containers and objects should be prepared.
+        shared_dataset: Whether load nodes should share a single dataset.
+
+    Returns:
+        K6 instance of every load node.
+    """
     k6_load_objects = []
     for load_node in load_nodes:
         ssh_client = SSHShell(port=ssh_port, host=load_node, login=login, private_key_path=pkey)
         k6_load_object = K6(load_params, ssh_client)
         k6_load_objects.append(k6_load_object)
-    for k6_load_object in k6_load_objects:
-        if prepare:
+    if not prepare:
+        return k6_load_objects
+
+    endpoints = load_params.endpoint.split(",")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(k6_load_objects)) as executor:
+        if shared_dataset:
+            with allure.step("Prepare shared dataset"):
+                dataset = k6_load_objects[0].prepare_shared_dataset(endpoints)
+                shards = split_pregen_dataset(dataset, len(k6_load_objects))
+                list(executor.map(K6.write_pregen_json, k6_load_objects, shards))
+        else:
             with allure.step("Prepare objects"):
-                prepare_objects(k6_load_object)
+                node_endpoints = [
+                    endpoints[index % len(endpoints)] for index in range(len(k6_load_objects))
+                ]
+                list(executor.map(prepare_objects, k6_load_objects, node_endpoints))
     return k6_load_objects
 
 
@@ -129,34 +174,227 @@ def run_k6_load(k6_instance: K6) -> LoadResults:
         return k6_instance.parsing_results()
 
 
+@dataclass
+class AggregatedLoadResults:
+    """Results of a load run on several load nodes.
+
+    Attributes:
+        total: Results of the whole cluster: rates and errors are summed over load nodes and
+            latency percentiles are calculated from merged histograms.
+        per_node: Results of every load node by its host.
+    """
+
+    total: LoadResults
+    per_node: dict[str, LoadResults] = field(default_factory=dict)
+
+
 @allure.title("MultiNode K6 Run")
-def multi_node_k6_run(k6_instances: list) -> dict:
-    results = []
-    avg_results = {}
+def multi_node_k6_run(k6_instances: list) -> AggregatedLoadResults:
     with concurrent.futures.ThreadPoolExecutor() as executor:
-        futures = []
-        for k6_instance in k6_instances:
-            futures.append(executor.submit(run_k6_load, k6_instance))
+        futures = {
+            executor.submit(run_k6_load, k6_instance): _get_load_node_name(k6_instance, index)
+            for index, k6_instance in enumerate(k6_instances)
+        }
+        per_node = {
+            futures[future]: future.result() for future in concurrent.futures.as_completed(futures)
+        }
+    results = aggregate_load_results(per_node)
+    _attach_load_results(results)
+    return results
+
+
+def aggregate_load_results(per_node: dict[str, LoadResults]) -> AggregatedLoadResults:
+    """Combines results of load nodes into results of the whole cluster.
+
+    Rates, errors and iteration rates are summed, as every load node produces its own share of
+    the load. Latency percentiles can not be combined from percentiles of the nodes, so they
+    are calculated from merged latency histograms; if some node has no histogram, the maximum
+    of node percentiles is reported as an upper bound.
+
+    Args:
+        per_node: Results of every load node.
+
+    Returns:
+        Total and per-node results.
+    """
+    node_results = list(per_node.values())
+    total = LoadResults()
+    for rate_field in LOAD_RATE_FIELDS:
+        setattr(total, rate_field, sum(getattr(result, rate_field) for result in node_results))
+    for result in node_results:
+        for operation, errors in result.errors.items():
+            total.errors[operation] = total.errors.get(operation, 0) + errors
+        for scenario, rate in result.iteration_rates.items():
+            total.iteration_rates[scenario] = total.iteration_rates.get(scenario, 0.0) + rate
+
+    operations = {operation for result in node_results for operation in result.latency}
+    for operation in sorted(operations):
+        latencies = [
+            result.latency[operation] for result in node_results if operation in result.latency
+        ]
+        histograms = [
+            result.latency_histograms[operation]
+            for result in node_results
+            if operation in result.latency_histograms
+        ]
+        if histograms and len(histograms) == len(latencies):
+            merged = merge_histograms(histograms)
+            total.latency_histograms[operation] = merged
+            counts = [histogram.count for histogram in histograms]
+            total.latency[operation] = LatencyStats(
+                avg=sum(latency.avg * count for latency, count in zip(latencies, counts))
+                / max(sum(counts), 1),
+                p50=merged.percentile(50),
+                p90=merged.percentile(90),
+                p95=merged.percentile(95),
+                p99=merged.percentile(99),
+                max=max(latency.max for latency in latencies),
+            )
+            continue
+
+        logger.warning(f"No latency histograms of {operation}, percentiles are upper bounds")
+        total.latency[operation] = LatencyStats(
+            avg=sum(latency.avg for latency in latencies) / len(latencies),
+            **{
+                stat: max(getattr(latency, stat) for latency in latencies)
+                for stat in ("p50", "p90", "p95", "p99", "max")
+            },
+        )
+    return AggregatedLoadResults(total=total, per_node=per_node)
+
+
+@dataclass
+class VerificationResults:
+    """Results of verification of objects written by load on several load nodes.
+
+    Every load node verifies objects of its own registry, so counts of the nodes are disjoint
+    and are summed.
+
+    Attributes:
+        verified: Number of objects with expected payload.
+        invalid: Number of objects that are missing or have unexpected payload.
+        skipped: Number of objects that were not verified, e.g. because they were not written.
+        per_node: Counts of every load node by status.
+        failed_nodes: Errors of load nodes where verification did not finish.
+    """
+
+    verified: int = 0
+    invalid: int = 0
+    skipped: int = 0
+    per_node: dict[str, dict[str, int]] = field(default_factory=dict)
+    failed_nodes: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def passed(self) -> bool:
+        return not self.invalid and not self.failed_nodes
+
+
+@allure.title("Run K6 verify")
+def run_k6_verify(k6_instance: K6, timeout: int) -> dict[str, int]:
+    with allure.step("Executing verification"):
+        k6_instance.start()
+        k6_instance.wait_until_finished(timeout)
+    with allure.step("Printing results"):
+        k6_instance.get_k6_results()
+        return k6_instance.parsing_verify_results()
+
+
+@allure.title("MultiNode K6 Verify")
+def multi_node_k6_verify(k6_instances: list[K6], timeout: int) -> VerificationResults:
+    """Runs verify scenario on all load nodes concurrently and sums their results.
+
+    Args:
+        k6_instances: K6 instances with verify load parameters.
+        timeout: Maximum time of verification on a single load node in seconds.
+
+    Returns:
+        Summed and per-node verification results.
+    """
+    results = VerificationResults()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(len(k6_instances), 1)) as executor:
+        futures = {
+            executor.submit(run_k6_verify, k6_instance, timeout): _get_load_node_name(
+                k6_instance, index
+            )
+            for index, k6_instance in enumerate(k6_instances)
+        }
         for future in concurrent.futures.as_completed(futures):
-            results.append(asdict(future.result()))
-    for k6_result in results:
-        for key in k6_result:
+            node = futures[future]
             try:
-                avg_results[key] += k6_result[key] / len(results)
-            except KeyError:
-                avg_results[key] = k6_result[key] / len(results)
-    return avg_results
+                counts = future.result()
+            except Exception as err:
+                logger.error(f"Verification on {node} failed: {err}")
+                results.failed_nodes[node] = str(err)
+                continue
+            results.per_node[node] = counts
+            for status, count in counts.items():
+                setattr(results, status, getattr(results, status) + count)
+    _attach_verification_results(results)
+    return results
 
 
 @allure.title("Compare results")
-def compare_load_results(result: dict, result_new: dict):
+def compare_load_results(
+    result: Union[AggregatedLoadResults, LoadResults, dict],
+    result_new: Union[AggregatedLoadResults, LoadResults, dict],
+    tolerance: float = 0.25,
+):
+    result = get_load_metrics(result)
+    result_new = get_load_metrics(result_new)
     for key in result:
-        if result[key] != 0 and result_new[key] != 0:
-            if (abs(result[key] - result_new[key]) / min(result[key], result_new[key])) < 0.25:
+        if result[key] != 0 and result_new.get(key, 0) != 0:
+            if (abs(result[key] - result_new[key]) / min(result[key], result_new[key])) < tolerance:
                 continue
             else:
-                raise AssertionError(f"Difference in {key} values more than 25%")
-        elif result[key] == 0 and result_new[key] == 0:
+                raise AssertionError(f"Difference in {key} values more than {tolerance:.0%}")
+        elif result[key] == 0 and result_new.get(key, 0) == 0:
             continue
         else:
             raise AssertionError(f"Unexpected zero value in {key}")
+
+
+def get_load_metrics(result: Union[AggregatedLoadResults, LoadResults, dict]) -> dict:
+    """Returns rates and latency percentiles of load results by metric name."""
+    if isinstance(result, dict):
+        return result
+    if isinstance(result, AggregatedLoadResults):
+        result = result.total
+    metrics = {rate_field: getattr(result, rate_field) for rate_field in LOAD_RATE_FIELDS}
+    for operation, latency in result.latency.items():
+        for stat in ("p50", "p90", "p95", "p99"):
+            metrics[f"{operation}_latency_{stat}"] = getattr(latency, stat)
+    return metrics
+
+
+def _get_load_node_name(k6_instance: K6, index: int) -> str:
+    return getattr(k6_instance.shell, "host", None) or f"load-node-{index}"
+
+
+def _attach_load_results(results: AggregatedLoadResults) -> None:
+    rows = [
+        f"{'node':<24}{'write/s':>10}{'read/s':>10}{'delete/s':>10}{'total/s':>10}{'errors':>8}"
+    ]
+    for node, result in [*results.per_node.items(), ("TOTAL", results.total)]:
+        rows.append(
+            f"{node:<24}{result.write_ops:>10.1f}{result.read_ops:>10.1f}"
+            f"{result.delete_ops:>10.1f}{result.total_ops:>10.1f}{sum(result.errors.values()):>8}"
+        )
+    for operation, latency in results.total.latency.items():
+        rows.append(
+            f"{operation} latency, ms: avg {latency.avg:.2f}, p50 {latency.p50:.2f}, "
+            f"p90 {latency.p90:.2f}, p95 {latency.p95:.2f}, p99 {latency.p99:.2f}, "
+            f"max {latency.max:.2f}"
+        )
+    allure.attach("\n".join(rows), "Load results", allure.attachment_type.TEXT)
+
+
+def _attach_verification_results(results: VerificationResults) -> None:
+    rows = [f"{'node':<24}{'verified':>10}{'invalid':>10}{'skipped':>10}"]
+    for node, counts in results.per_node.items():
+        rows.append(
+            f"{node:<24}{counts['verified']:>10}{counts['invalid']:>10}{counts['skipped']:>10}"
+        )
+    rows.append(f"{'TOTAL':<24}{results.verified:>10}{results.invalid:>10}{results.skipped:>10}")
+    rows.extend(f"{node}: {error}" for node, error in results.failed_nodes.items())
+    rows.append("PASSED" if results.passed else "FAILED")
+    allure.attach("\n".join(rows), "Verification results", allure.attachment_type.TEXT)
@@ -0,0 +1,365 @@
+import hashlib
+import itertools
+import json
+import logging
+import os
+import random
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from time import monotonic, perf_counter, sleep
+from typing import Optional
+
+import allure
+from common import ASSETS_DIR, NEOFS_CLI_EXEC, WALLET_CONFIG
+from http_gate_client import get_http_gate_client
+from k6 import LatencyStats, LoadParams, LoadResults
+from latency_histogram import LatencyHistogram
+from neofs_testlib.cli import NeofsCli
+from neofs_testlib.shell import Shell
+
+logger = logging.getLogger("NeoLogger")
+
+LOAD_OPERATIONS = ("write", "read", "delete")
+# Readers and deleters wait for this time (in seconds) when there are no written objects yet
+IDLE_INTERVAL = 0.05
+
+
+class LoadClient(ABC):
+    """Client that performs single object operations of the load generator.
+
+    Clients that can delete objects set `supports_delete` and implement `delete(key)`, the load
+    generator does not accept deleters for other clients.
+    """
+
+    supports_delete: bool = False
+
+    @abstractmethod
+    def put(self, payload: bytes, payload_path: str) -> str:
+        """Uploads the object and returns its key.
+
+        Args:
+            payload: Payload of the object.
+            payload_path: Path to the file with the same payload, for clients that upload files.
+        """
+
+    @abstractmethod
+    def get(self, key: str) -> bytes:
+        """Downloads payload of the object by its key."""
+
+
+class GrpcLoadClient(LoadClient):
+    """Load client that uses gRPC API of storage nodes through neofs-cli.
+
+    Requests are spread over the endpoints in turn.
+    """
+
+    supports_delete = True
+
+    def __init__(
+        self,
+        wallet: str,
+        cid: str,
+        shell: Shell,
+        endpoints: list[str],
+        wallet_config: Optional[str] = None,
+    ):
+        self.wallet = wallet
+        self.cid = cid
+        self.endpoints = endpoints
+        self.cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
+        self._requests = itertools.count()
+
+    def put(self, payload: bytes, payload_path: str) -> str:
+        result = self.cli.object.put(
+            rpc_endpoint=self._next_endpoint(),
+            wallet=self.wallet,
+            file=payload_path,
+            cid=self.cid,
+            no_progress=True,
+        )
+        # The penultimate line of the output holds ID of the object, as in neofs_verbs
+        return result.stdout.strip().split("\n")[-2].split(":")[1].strip()
+
+    def get(self, key: str) -> bytes:
+        file_path = os.path.join(os.getcwd(), ASSETS_DIR, f"load_{uuid.uuid4()}")
+        self.cli.object.get(
+            rpc_endpoint=self._next_endpoint(),
+            wallet=self.wallet,
+            cid=self.cid,
+            oid=key,
+            file=file_path,
+            no_progress=True,
+        )
+        try:
+            with open(file_path, "rb") as file:
+                return file.read()
+        finally:
+            os.remove(file_path)
+
+    def delete(self, key: str) -> None:
+        self.cli.object.delete(
+            rpc_endpoint=self._next_endpoint(), wallet=self.wallet, cid=self.cid, oid=key
+        )
+
+    def _next_endpoint(self) -> str:
+        return self.endpoints[next(self._requests) % len(self.endpoints)]
+
+
+class HttpLoadClient(LoadClient):
+    """Load client that uploads and downloads objects through HTTP gate.
+
+    HTTP gate cannot delete objects, so the client does not support deleters.
+    """
+
+    def __init__(self, cid: str, endpoint: str):
+        self.cid = cid
+        self.endpoint = endpoint
+        self.session = get_http_gate_client(endpoint).session
+
+    def put(self, payload: bytes, payload_path: str) -> str:
+        response = self.session.post(
+            f"{self.endpoint}/upload/{self.cid}",
+            files={"upload_file": (os.path.basename(payload_path), payload)},
+        )
+        response.raise_for_status()
+        return response.json()["object_id"]
+
+    def get(self, key: str) -> bytes:
+        response = self.session.get(f"{self.endpoint}/get/{self.cid}/{key}")
+        response.raise_for_status()
+        return response.content
+
+
+class S3LoadClient(LoadClient):
+    """Load client that uses S3 gate through boto3 client."""
+
+    supports_delete = True
+
+    def __init__(self, s3_client, bucket: str):
+        self.s3_client = s3_client
+        self.bucket = bucket
+
+    def put(self, payload: bytes, payload_path: str) -> str:
+        key = f"load-{uuid.uuid4()}"
+        self.s3_client.put_object(Bucket=self.bucket, Key=key, Body=payload)
+        return key
+
+    def get(self, key: str) -> bytes:
+        return self.s3_client.get_object(Bucket=self.bucket, Key=key)["Body"].read()
+
+    def delete(self, key: str) -> None:
+        self.s3_client.delete_object(Bucket=self.bucket, Key=key)
+
+
+class ObjectRegistry:
+    """Thread-safe registry of objects written by the load and hashes of their payload."""
+
+    def __init__(self):
+        self._objects: dict[str, str] = {}
+        self._keys: list[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._objects
+
+    def add(self, key: str, payload_hash: str) -> None:
+        with self._lock:
+            self._objects[key] = payload_hash
+            self._keys.append(key)
+
+    def get_random(self) -> Optional[tuple[str, str]]:
+        with self._lock:
+            if not self._keys:
+                return None
+            key = random.choice(self._keys)
+            return key, self._objects[key]
+
+    def pop_random(self) -> Optional[tuple[str, str]]:
+        with self._lock:
+            if not self._keys:
+                return None
+            index = random.randrange(len(self._keys))
+            # Swap with the last key, so removal does not shift the list
+            self._keys[index], self._keys[-1] = self._keys[-1], self._keys[index]
+            key = self._keys.pop()
+            return key, self._objects.pop(key)
+
+    def save(self, file_path: str) -> None:
+        """Writes keys and payload hashes of the objects to JSON lines file."""
+        with self._lock:
+            objects = list(self._objects.items())
+        with open(file_path, "w") as file:
+            for key, payload_hash in objects:
+                file.write(json.dumps({"key": key, "sha256": payload_hash}) + "\n")
+
+
+@dataclass
+class _OperationStats:
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    count: int = 0
+    errors: int = 0
+    bytes: int = 0
+    latency_sum: float = 0.0
+    latency_max: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def record(self, latency: float, payload_size: int) -> None:
+        with self.lock:
+            self.histogram.record(latency)
+            self.count += 1
+            self.bytes += payload_size
+            self.latency_sum += latency
+            self.latency_max = max(self.latency_max, latency)
+
+    def record_error(self) -> None:
+        with self.lock:
+            self.errors += 1
+
+
+class LoadGenerator:
+    """Load generator that runs writers, readers and deleters on a pool of threads.
+
+    It needs neither k6 nor load nodes, so it can load a local NeoFSEnv. Parameters of the
+    load are taken from the same LoadParams as for k6: writers, readers, deleters, obj_size,
+    load_time and registry_file, and results are returned as the same LoadResults.
+
+    Readers and deleters work with objects written during the run, readers also check payload
+    hash of every object and count mismatches as errors.
+    """
+
+    def __init__(self, load_params: LoadParams, client: LoadClient):
+        assert not load_params.deleters or client.supports_delete, (
+            f"{type(client).__name__} can not delete objects, "
+            f"but the load has {load_params.deleters} deleters"
+        )
+        self.load_params = load_params
+        self.client = client
+        self.registry = ObjectRegistry()
+        self._stats = {operation: _OperationStats() for operation in LOAD_OPERATIONS}
+
+    @allure.step("Run Python load")
+    def run(self) -> LoadResults:
+        workers = {
+            "write": self.load_params.writers or 0,
+            "read": self.load_params.readers or 0,
+            "delete": self.load_params.deleters or 0,
+        }
+        assert sum(workers.values()), "Load has no writers, readers or deleters"
+        deadline = monotonic() + self.load_params.load_time
+        worker_functions = {
+            "write": self._write_worker,
+            "read": self._read_worker,
+            "delete": self._delete_worker,
+        }
+
+        start_time = perf_counter()
+        with ThreadPoolExecutor(max_workers=sum(workers.values())) as executor:
+            futures = [
+                executor.submit(worker_functions[operation], deadline)
+                for operation, count in workers.items()
+                for _ in range(count)
+            ]
+            for future in futures:
+                future.result()
+        duration = perf_counter() - start_time
+
+        if self.load_params.registry_file:
+            self.registry.save(self.load_params.registry_file)
+        results = self._get_results(duration)
+        logger.info(f"Python load results: {results}")
+        return results
+
+    def _write_worker(self, deadline: float) -> None:
+        payload = os.urandom(self.load_params.obj_size or 0)
+        payload_hash = hashlib.sha256(payload).hexdigest()
+        payload_path = os.path.join(os.getcwd(), ASSETS_DIR, f"load_payload_{uuid.uuid4()}")
+        with open(payload_path, "wb") as file:
+            file.write(payload)
+        try:
+            while monotonic() < deadline:
+                start_time = perf_counter()
+                try:
+                    key = self.client.put(payload, payload_path)
+                except Exception as err:
+                    logger.warning(f"Load write failed: {err}")
+                    self._stats["write"].record_error()
+                    continue
+                self._record("write", start_time, len(payload))
+                self.registry.add(key, payload_hash)
+        finally:
+            os.remove(payload_path)
+
+    def _read_worker(self, deadline: float) -> None:
+        while monotonic() < deadline:
+            written_object = self.registry.get_random()
+            if written_object is None:
+                # Nothing is written yet, so there is nothing to read
+                sleep(IDLE_INTERVAL)
+                continue
+            key, payload_hash = written_object
+            start_time = perf_counter()
+            try:
+                payload = self.client.get(key)
+            except Exception as err:
+                if key not in self.registry:
+                    # The object was deleted by a deleter while it was read
+                    continue
+                logger.warning(f"Load read of {key} failed: {err}")
+                self._stats["read"].record_error()
+                continue
+            if hashlib.sha256(payload).hexdigest() != payload_hash:
+                logger.warning(f"Load read of {key} returned unexpected payload")
+                self._stats["read"].record_error()
+                continue
+            self._record("read", start_time, len(payload))
+
+    def _delete_worker(self, deadline: float) -> None:
+        while monotonic() < deadline:
+            written_object = self.registry.pop_random()
+            if written_object is None:
+                sleep(IDLE_INTERVAL)
+                continue
+            key, _ = written_object
+            start_time = perf_counter()
+            try:
+                self.client.delete(key)
+            except Exception as err:
+                logger.warning(f"Load delete of {key} failed: {err}")
+                self._stats["delete"].record_error()
+                continue
+            self._record("delete", start_time, 0)
+
+    def _record(self, operation: str, start_time: float, payload_size: int) -> None:
+        # Latencies are kept in milliseconds, as k6 reports them
+        self._stats[operation].record((perf_counter() - start_time) * 1000, payload_size)
+
+    def _get_results(self, duration: float) -> LoadResults:
+        results = LoadResults(
+            data_sent=self._stats["write"].bytes / duration,
+            data_received=self._stats["read"].bytes / duration,
+        )
+        for operation, stats in self._stats.items():
+            results.errors[operation] = stats.errors
+            if not stats.count:
+                continue
+            setattr(results, f"{operation}_ops", stats.count / duration)
+            results.iteration_rates[operation] = (stats.count + stats.errors) / duration
+            results.latency_histograms[operation] = stats.histogram
+            results.latency[operation] = LatencyStats(
+                avg=stats.latency_sum / stats.count,
+                p50=stats.histogram.percentile(50),
+                p90=stats.histogram.percentile(90),
+                p95=stats.histogram.percentile(95),
+                p99=stats.histogram.percentile(99),
+                max=stats.latency_max,
+            )
+        results.iteration_rates["total"] = sum(results.iteration_rates.values())
+        if self.load_params.load_type == "http":
+            results.total_ops = results.write_ops + results.read_ops
+        return results
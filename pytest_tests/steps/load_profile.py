@@ -0,0 +1,252 @@
+import dataclasses
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
+
+import allure
+from k6 import K6
+from load import AggregatedLoadResults, multi_node_k6_run
+
+logger = logging.getLogger("NeoLogger")
+
+# Stage is not worth the added load if throughput grows by less than this share
+MIN_THROUGHPUT_GAIN = 0.05
+# Stage is not sustainable if this share of requests fails
+MAX_ERROR_RATE = 0.01
+CHART_WIDTH = 640
+CHART_HEIGHT = 360
+CHART_MARGIN = 50
+
+
+@dataclass
+class CapacityPoint:
+    """Result of a single stage of a load profile.
+
+    Attributes:
+        virtual_users: Number of virtual users of every load node.
+        ops: Rate of all operations of the cluster per second.
+        latency_p99: The worst p99 latency of operations in milliseconds.
+        error_rate: Share of failed requests.
+        sustainable: Whether the stage meets the latency SLO and error limit.
+    """
+
+    virtual_users: int
+    ops: float
+    latency_p99: float
+    error_rate: float
+    sustainable: bool
+
+
+@dataclass
+class CapacityProfile:
+    """Capacity curve of the cluster.
+
+    Attributes:
+        latency_slo: Latency SLO of the profile in milliseconds.
+        points: Results of stages ordered by the number of virtual users.
+        knee: The stage with maximum sustainable rate, None if no stage is sustainable.
+    """
+
+    latency_slo: float
+    points: list[CapacityPoint] = field(default_factory=list)
+    knee: Optional[CapacityPoint] = None
+
+
+@allure.step("Find load capacity")
+def find_load_capacity(
+    k6_instances: list[K6],
+    stages: list[int],
+    latency_slo: float,
+    stage_time: int,
+    read_ratio: float = 0.0,
+    refine_steps: int = 2,
+) -> CapacityProfile:
+    """Steps the number of virtual users and finds the maximum sustainable rate.
+
+    Stages are run in ascending order until one of them breaks the latency SLO, fails too many
+    requests or does not increase throughput noticeably, i.e. the knee of the capacity curve
+    is passed. Then the interval between the last good stage and the failed one is bisected to
+    find the knee more precisely.
+
+    Args:
+        k6_instances: K6 instances of load nodes with prepared datasets.
+        stages: Numbers of virtual users of every load node.
+        latency_slo: Maximum p99 latency of any operation in milliseconds.
+        stage_time: Duration of every stage in seconds.
+        read_ratio: Share of virtual users that read objects, the rest of them write.
+        refine_steps: Number of bisection steps after the knee is passed.
+
+    Returns:
+        Capacity profile with all measured stages.
+    """
+    profile = CapacityProfile(latency_slo=latency_slo)
+    best = None
+    failed_users = None
+    for virtual_users in sorted(stages):
+        point = _run_stage(k6_instances, virtual_users, stage_time, read_ratio, latency_slo)
+        profile.points.append(point)
+        if _is_improvement(point, best):
+            best = point
+        else:
+            failed_users = virtual_users
+            break
+
+    for _ in range(refine_steps):
+        if best is None or failed_users is None or failed_users - best.virtual_users < 2:
+            break
+        virtual_users = (best.virtual_users + failed_users) // 2
+        point = _run_stage(k6_instances, virtual_users, stage_time, read_ratio, latency_slo)
+        profile.points.append(point)
+        if _is_improvement(point, best):
+            best = point
+        else:
+            failed_users = virtual_users
+
+    profile.points.sort(key=lambda capacity_point: capacity_point.virtual_users)
+    profile.knee = best
+    attach_capacity_profile(profile)
+    return profile
+
+
+@allure.step("Attach capacity profile")
+def attach_capacity_profile(profile: CapacityProfile) -> None:
+    """Attaches the capacity curve to Allure report as a table and a chart.
+
+    Args:
+        profile: Capacity profile to attach.
+    """
+    rows = [f"{'VUs':>8}{'ops/s':>12}{'p99, ms':>12}{'errors':>10}{'sustainable':>13}"]
+    for point in profile.points:
+        marker = " <- knee" if point is profile.knee else ""
+        rows.append(
+            f"{point.virtual_users:>8}{point.ops:>12.1f}{point.latency_p99:>12.2f}"
+            f"{point.error_rate:>10.2%}{str(point.sustainable):>13}{marker}"
+        )
+    if profile.knee:
+        rows.append(
+            f"Maximum sustainable rate: {profile.knee.ops:.1f} ops/s with "
+            f"{profile.knee.virtual_users} VUs per load node (p99 SLO {profile.latency_slo} ms)"
+        )
+    else:
+        rows.append(f"No stage meets p99 SLO {profile.latency_slo} ms")
+    allure.attach("\n".join(rows), "Capacity profile", allure.attachment_type.TEXT)
+    if profile.points:
+        allure.attach(get_capacity_chart(profile), "Capacity chart", allure.attachment_type.SVG)
+
+
+def get_capacity_chart(profile: CapacityProfile) -> str:
+    """Draws throughput and p99 latency of the stages as an SVG chart.
+
+    Throughput is drawn with the left axis, latency with the right one and the latency SLO
+    with a dashed line.
+
+    Args:
+        profile: Capacity profile with at least one point.
+
+    Returns:
+        SVG document.
+    """
+    max_users = max(point.virtual_users for point in profile.points) or 1
+    max_ops = max(point.ops for point in profile.points) or 1
+    max_latency = max(max(point.latency_p99 for point in profile.points), profile.latency_slo)
+    plot_width = CHART_WIDTH - 2 * CHART_MARGIN
+    plot_height = CHART_HEIGHT - 2 * CHART_MARGIN
+
+    def x(virtual_users: float) -> float:
+        return CHART_MARGIN + virtual_users / max_users * plot_width
+
+    def y(value: float, max_value: float) -> float:
+        return CHART_HEIGHT - CHART_MARGIN - value / (max_value or 1) * plot_height
+
+    def polyline(values: list[tuple[float, float]], color: str, max_value: float) -> str:
+        points = " ".join(f"{x(users):.1f},{y(value, max_value):.1f}" for users, value in values)
+        return f'<polyline points="{points}" fill="none" stroke="{color}" stroke-width="2"/>'
+
+    bottom = CHART_HEIGHT - CHART_MARGIN
+    right = CHART_WIDTH - CHART_MARGIN
+    slo_y = y(profile.latency_slo, max_latency)
+    elements = [
+        f'<line x1="{CHART_MARGIN}" y1="{bottom}" x2="{right}" y2="{bottom}" stroke="black"/>',
+        f'<line x1="{CHART_MARGIN}" y1="{CHART_MARGIN}" x2="{CHART_MARGIN}" y2="{bottom}" '
+        f'stroke="black"/>',
+        f'<line x1="{right}" y1="{CHART_MARGIN}" x2="{right}" y2="{bottom}" stroke="black"/>',
+        f'<line x1="{CHART_MARGIN}" y1="{slo_y:.1f}" x2="{right}" y2="{slo_y:.1f}" '
+        f'stroke="red" stroke-dasharray="4"/>',
+        polyline([(point.virtual_users, point.ops) for point in profile.points], "blue", max_ops),
+        polyline(
+            [(point.virtual_users, point.latency_p99) for point in profile.points],
+            "orange",
+            max_latency,
+        ),
+        f'<text x="{CHART_WIDTH / 2}" y="{CHART_HEIGHT - 10}" text-anchor="middle">'
+        f"VUs per load node (max {max_users})</text>",
+        f'<text x="5" y="{CHART_MARGIN - 10}" fill="blue">ops/s (max {max_ops:.0f})</text>',
+        f'<text x="{right}" y="{CHART_MARGIN - 10}" fill="orange" text-anchor="middle">'
+        f"p99, ms (max {max_latency:.0f})</text>",
+    ]
+    if profile.knee:
+        elements.append(
+            f'<circle cx="{x(profile.knee.virtual_users):.1f}" '
+            f'cy="{y(profile.knee.ops, max_ops):.1f}" r="5" fill="green"/>'
+        )
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{CHART_WIDTH}" '
+        f'height="{CHART_HEIGHT}">{"".join(elements)}</svg>'
+    )
+
+
+def get_capacity_point(
+    results: AggregatedLoadResults, virtual_users: int, stage_time: int, latency_slo: float
+) -> CapacityPoint:
+    """Summarizes results of a load stage.
+
+    Args:
+        results: Results of the stage.
+        virtual_users: Number of virtual users of every load node.
+        stage_time: Duration of the stage in seconds.
+        latency_slo: Maximum p99 latency of any operation in milliseconds.
+
+    Returns:
+        Point of the capacity curve.
+    """
+    total = results.total
+    ops = total.write_ops + total.read_ops + total.delete_ops + total.total_ops
+    latency_p99 = max((latency.p99 for latency in total.latency.values()), default=0.0)
+    errors = sum(total.errors.values())
+    requests = ops * stage_time + errors
+    error_rate = errors / requests if requests else 0.0
+    return CapacityPoint(
+        virtual_users=virtual_users,
+        ops=ops,
+        latency_p99=latency_p99,
+        error_rate=error_rate,
+        sustainable=latency_p99 <= latency_slo and error_rate <= MAX_ERROR_RATE,
+    )
+
+
+def _run_stage(
+    k6_instances: list[K6],
+    virtual_users: int,
+    stage_time: int,
+    read_ratio: float,
+    latency_slo: float,
+) -> CapacityPoint:
+    readers = round(virtual_users * read_ratio)
+    with allure.step(f"Run load stage with {virtual_users} VUs per load node"):
+        for k6_instance in k6_instances:
+            k6_instance.load_params = dataclasses.replace(
+                k6_instance.load_params,
+                writers=virtual_users - readers,
+                readers=readers,
+                load_time=stage_time,
+            )
+        results = multi_node_k6_run(k6_instances)
+    point = get_capacity_point(results, virtual_users, stage_time, latency_slo)
+    logger.info(f"Load stage result: {point}")
+    return point
+
+
+def _is_improvement(point: CapacityPoint, best: Optional[CapacityPoint]) -> bool:
+    if not point.sustainable:
+        return False
+    return best is None or point.ops >= best.ops * (1 + MIN_THROUGHPUT_GAIN)
@@ -21,6 +21,11 @@ from common import NEOFS_AUTHMATE_EXEC
 from neofs_testlib.shell import Shell
 from pytest import FixtureRequest
 from python_keywords.container import list_containers
+from s3_credentials_cache import (
+    are_s3_credentials_valid,
+    get_s3_credentials,
+    make_s3_credentials_key,
+)
 
 # Disable warnings on self-signed certificate which the
 # boto library produces on requests to S3-gate in dev-env
@@ -34,6 +39,12 @@ CREDENTIALS_CREATE_TIMEOUT = "1m"
 MAX_REQUEST_ATTEMPTS = 1
 RETRY_MODE = "standard"
 
+# Connection pool of boto3 client must be at least as large as the number of threads that use
+# the client concurrently, otherwise connections are dropped and reopened on every request
+MAX_POOL_CONNECTIONS = 64
+CONNECT_TIMEOUT = 60
+READ_TIMEOUT = 60
+
 
 class TestS3GateBase(ClusterTestBase):
     s3_client: Any = None
@@ -46,8 +57,18 @@ class TestS3GateBase(ClusterTestBase):
         wallet = default_wallet
         s3_bearer_rules_file = f"{os.getcwd()}/robot/resources/files/s3_bearer_rules.json"
         policy = None if isinstance(request.param, str) else request.param[1]
-        (cid, bucket, access_key_id, secret_access_key, owner_private_key,) = init_s3_credentials(
-            wallet, cluster, s3_bearer_rules_file=s3_bearer_rules_file, policy=policy
+        credentials_key = make_s3_credentials_key(
+            wallet, cluster.s3gates[0].get_wallet_public_key(), s3_bearer_rules_file, policy
+        )
+        (cid, bucket, access_key_id, secret_access_key, owner_private_key,) = get_s3_credentials(
+            credentials_key,
+            env_id=f"{cluster.default_s3_gate_endpoint} {cluster.default_rpc_endpoint}",
+            issue=lambda: init_s3_credentials(
+                wallet, cluster, s3_bearer_rules_file=s3_bearer_rules_file, policy=policy
+            ),
+            is_valid=lambda credentials: are_s3_credentials_valid(
+                credentials[2], credentials[3], cluster.default_s3_gate_endpoint
+            ),
         )
         containers_list = list_containers(
             wallet, shell=client_shell, endpoint=self.cluster.default_rpc_endpoint
@@ -82,34 +103,9 @@ class TestS3GateBase(ClusterTestBase):
             self.delete_all_object_in_bucket(bucket)
 
     def delete_all_object_in_bucket(self, bucket):
-        versioning_status = s3_gate_bucket.get_bucket_versioning_status(self.s3_client, bucket)
-        if versioning_status == s3_gate_bucket.VersioningStatus.ENABLED.value:
-            # From versioned bucket we should delete all versions and delete markers of all objects
-            objects_versions = s3_gate_object.list_objects_versions_s3(self.s3_client, bucket)
-            if objects_versions:
-                s3_gate_object.delete_object_versions_s3_without_dm(
-                    self.s3_client, bucket, objects_versions
-                )
-            objects_delete_markers = s3_gate_object.list_objects_delete_markers_s3(
-                self.s3_client, bucket
-            )
-            if objects_delete_markers:
-                s3_gate_object.delete_object_versions_s3_without_dm(
-                    self.s3_client, bucket, objects_delete_markers
-                )
-
-        else:
-            # From non-versioned bucket it's sufficient to delete objects by key
-            objects = s3_gate_object.list_objects_s3(self.s3_client, bucket)
-            if objects:
-                s3_gate_object.delete_objects_s3(self.s3_client, bucket, objects)
-            objects_delete_markers = s3_gate_object.list_objects_delete_markers_s3(
-                self.s3_client, bucket
-            )
-            if objects_delete_markers:
-                s3_gate_object.delete_object_versions_s3_without_dm(
-                    self.s3_client, bucket, objects_delete_markers
-                )
+        # Versions and delete markers are removed in one pass for both versioned and
+        # non-versioned buckets
+        s3_gate_object.delete_all_objects_s3(self.s3_client, bucket)
 
         # Delete the bucket itself
         s3_gate_bucket.delete_bucket_s3(self.s3_client, bucket)
@@ -165,15 +161,49 @@ def init_s3_credentials(
 
 
 @allure.step("Configure S3 client (boto3)")
-def configure_boto3_client(access_key_id: str, secret_access_key: str, s3gate_endpoint: str):
+def configure_boto3_client(
+    access_key_id: str,
+    secret_access_key: str,
+    s3gate_endpoint: str,
+    max_pool_connections: int = MAX_POOL_CONNECTIONS,
+    connect_timeout: float = CONNECT_TIMEOUT,
+    read_timeout: float = READ_TIMEOUT,
+    tcp_keepalive: Optional[bool] = None,
+    max_attempts: int = MAX_REQUEST_ATTEMPTS,
+):
+    """
+    Creates boto3 S3 client.
+
+    Connections of the client are kept alive in the pool and reused by subsequent requests.
+
+    Args:
+        access_key_id: access key ID of S3 credentials
+        secret_access_key: secret access key of S3 credentials
+        s3gate_endpoint: endpoint of S3 gate
+        max_pool_connections: maximum number of connections kept in the pool
+        connect_timeout: timeout in seconds to establish connection
+        read_timeout: timeout in seconds to read from connection
+        tcp_keepalive: whether TCP keep-alive probes should be enabled for connections,
+            system default is used if not specified
+        max_attempts: number of attempts per request
+
+    Returns:
+        Configured S3 client.
+    """
     try:
         session = boto3.Session()
-        config = Config(
-            retries={
-                "max_attempts": MAX_REQUEST_ATTEMPTS,
+        config_params = {
+            "retries": {
+                "max_attempts": max_attempts,
                 "mode": RETRY_MODE,
-            }
-        )
+            },
+            "max_pool_connections": max_pool_connections,
+            "connect_timeout": connect_timeout,
+            "read_timeout": read_timeout,
+        }
+        if tcp_keepalive is not None:
+            config_params["tcp_keepalive"] = tcp_keepalive
+        config = Config(**config_params)
 
         s3_client = session.client(
             service_name="s3",
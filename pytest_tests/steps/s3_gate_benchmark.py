@@ -0,0 +1,216 @@
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import Callable, Sequence
+
+import allure
+from common import ASSETS_DIR
+
+logger = logging.getLogger("NeoLogger")
+
+# Number of keys that are listed per ListObjectsV2 request and deleted per DeleteObjects one
+S3_BENCHMARK_PAGE_SIZE = 100
+
+
+@dataclass
+class S3BenchmarkResult:
+    """Result of a single benchmarked S3 operation.
+
+    Attributes:
+        operation: Name of the operation, e.g. PUT or DeleteObjects.
+        object_size: Size of objects in bytes.
+        concurrency: Number of concurrent requests.
+        requests: Number of successful requests.
+        errors: Number of failed requests.
+        duration: Wall time of the whole run in seconds.
+        ops_per_second: Successful requests per second.
+        throughput: Transferred payload in MiB per second, 0 for operations without payload.
+        latency_avg: Average latency of successful requests in milliseconds.
+        latency_p50: Median latency in milliseconds.
+        latency_p90: 90th percentile of latency in milliseconds.
+        latency_p99: 99th percentile of latency in milliseconds.
+        latency_max: Maximum latency in milliseconds.
+    """
+
+    operation: str
+    object_size: int
+    concurrency: int
+    requests: int
+    errors: int
+    duration: float
+    ops_per_second: float
+    throughput: float
+    latency_avg: float
+    latency_p50: float
+    latency_p90: float
+    latency_p99: float
+    latency_max: float
+
+
+def run_s3_benchmark(
+    operation: str,
+    request: Callable[[int], None],
+    count: int,
+    concurrency: int,
+    object_size: int = 0,
+    payload_size: int = 0,
+) -> S3BenchmarkResult:
+    """Runs S3 requests on a pool of threads and measures their latency and throughput.
+
+    Args:
+        operation: Name of the operation.
+        request: Function that makes a single request, it gets index of the request.
+        count: Total number of requests.
+        concurrency: Number of concurrent requests.
+        object_size: Size of benchmarked objects in bytes.
+        payload_size: Number of payload bytes transferred by a single request.
+
+    Returns:
+        Measured statistics of the requests.
+    """
+
+    def timed_request(index: int) -> float:
+        start_time = perf_counter()
+        request(index)
+        return perf_counter() - start_time
+
+    latencies = []
+    errors = 0
+    start_time = perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(timed_request, index) for index in range(count)]
+        for future in futures:
+            try:
+                latencies.append(future.result())
+            except Exception as err:
+                errors += 1
+                logger.warning(f"{operation} request failed: {err}")
+    duration = perf_counter() - start_time
+
+    latencies.sort()
+    result = S3BenchmarkResult(
+        operation=operation,
+        object_size=object_size,
+        concurrency=concurrency,
+        requests=len(latencies),
+        errors=errors,
+        duration=duration,
+        ops_per_second=len(latencies) / duration,
+        throughput=len(latencies) * payload_size / duration / 1024 / 1024,
+        latency_avg=sum(latencies) / len(latencies) * 1000 if latencies else 0,
+        latency_p50=get_percentile(latencies, 50) * 1000,
+        latency_p90=get_percentile(latencies, 90) * 1000,
+        latency_p99=get_percentile(latencies, 99) * 1000,
+        latency_max=latencies[-1] * 1000 if latencies else 0,
+    )
+    logger.info(f"S3 benchmark result: {result}")
+    return result
+
+
+def get_percentile(sorted_values: Sequence[float], percentile: float) -> float:
+    """Returns percentile of the values using nearest-rank method.
+
+    Args:
+        sorted_values: Values sorted in ascending order.
+        percentile: Percentile in range (0, 100].
+
+    Returns:
+        Value at the percentile, 0 for empty sequence.
+    """
+    if not sorted_values:
+        return 0
+    rank = -(-len(sorted_values) * percentile // 100)
+    return sorted_values[max(int(rank), 1) - 1]
+
+
+@allure.step("Run S3 benchmark")
+def run_s3_operations_benchmark(
+    s3_client, bucket: str, object_size: int, count: int, concurrency: int
+) -> list[S3BenchmarkResult]:
+    """Benchmarks PUT, GET, HEAD, LIST and DeleteObjects operations of S3 gate.
+
+    Objects uploaded by PUT are used by the following operations and are removed by
+    DeleteObjects in the end, so the bucket is left empty.
+
+    Args:
+        s3_client: boto3 S3 client, its connection pool should fit the concurrency.
+        bucket: Name of the bucket to benchmark in.
+        object_size: Size of objects in bytes.
+        count: Number of objects.
+        concurrency: Number of concurrent requests.
+
+    Returns:
+        Results of every operation.
+    """
+    payload = os.urandom(object_size)
+    keys = [f"benchmark-{object_size}-{index}" for index in range(count)]
+    batches = [
+        keys[start : start + S3_BENCHMARK_PAGE_SIZE]
+        for start in range(0, count, S3_BENCHMARK_PAGE_SIZE)
+    ]
+
+    def put(index: int) -> None:
+        s3_client.put_object(Bucket=bucket, Key=keys[index], Body=payload)
+
+    def get(index: int) -> None:
+        body = s3_client.get_object(Bucket=bucket, Key=keys[index])["Body"]
+        for _ in body.iter_chunks(1024 * 1024):
+            pass
+
+    def head(index: int) -> None:
+        s3_client.head_object(Bucket=bucket, Key=keys[index])
+
+    def list_page(index: int) -> None:
+        params = {"Bucket": bucket, "MaxKeys": S3_BENCHMARK_PAGE_SIZE}
+        if index % len(batches):
+            params["StartAfter"] = batches[index % len(batches) - 1][-1]
+        s3_client.list_objects_v2(**params)
+
+    def delete_batch(index: int) -> None:
+        response = s3_client.delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": key} for key in batches[index]], "Quiet": True},
+        )
+        assert not response.get("Errors"), f"Failed to delete objects: {response['Errors']}"
+
+    return [
+        run_s3_benchmark("PUT", put, count, concurrency, object_size, object_size),
+        run_s3_benchmark("GET", get, count, concurrency, object_size, object_size),
+        run_s3_benchmark("HEAD", head, count, concurrency, object_size),
+        run_s3_benchmark("LIST", list_page, count, concurrency, object_size),
+        run_s3_benchmark("DeleteObjects", delete_batch, len(batches), concurrency, object_size),
+    ]
+
+
+@allure.step("Save S3 benchmark results")
+def save_s3_benchmark_results(results: list[S3BenchmarkResult], results_dir: str, name: str) -> str:
+    """Writes benchmark results to JSON file and attaches them to Allure report.
+
+    Args:
+        results: Results of benchmarked operations.
+        results_dir: Directory for result files, relative to assets directory.
+        name: Name of the results file without extension.
+
+    Returns:
+        Path to the results file.
+    """
+    results_path = os.path.join(os.getcwd(), ASSETS_DIR, results_dir)
+    os.makedirs(results_path, exist_ok=True)
+    file_path = os.path.join(results_path, f"{name}.json")
+    with open(file_path, "w") as file:
+        json.dump([asdict(result) for result in results], file, indent=2)
+
+    header = f"{'operation':<14}{'ops/s':>10}{'MiB/s':>10}{'p50, ms':>10}{'p90, ms':>10}"
+    header += f"{'p99, ms':>10}{'errors':>8}"
+    rows = [
+        f"{result.operation:<14}{result.ops_per_second:>10.1f}{result.throughput:>10.2f}"
+        f"{result.latency_p50:>10.2f}{result.latency_p90:>10.2f}{result.latency_p99:>10.2f}"
+        f"{result.errors:>8}"
+        for result in results
+    ]
+    allure.attach("\n".join([header, *rows]), name, allure.attachment_type.TEXT)
+    allure.attach.file(file_path, f"{name}.json", allure.attachment_type.JSON)
+    return file_path
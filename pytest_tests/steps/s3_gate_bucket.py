@@ -1,21 +1,28 @@
 import json
 import logging
+import re
 import uuid
 from enum import Enum
-from time import sleep
-from typing import Optional
+from time import monotonic, sleep
+from typing import Callable, Optional
 
 import allure
 from botocore.exceptions import ClientError
 from cli_helpers import log_command_execution
+from operation_metrics import get_endpoint, operation_metrics, timed_operation
 
 logger = logging.getLogger("NeoLogger")
 
-# Artificial delay that we add after object deletion and container creation
-# Delay is added because sometimes immediately after deletion object still appears
-# to be existing (probably because tombstone object takes some time to replicate)
+# Immediately after container creation or object deletion S3 gate may still report the previous
+# state (probably because tombstone object takes some time to replicate), so after such changes
+# we poll the gate with exponential backoff until it reports the expected state
 # TODO: remove after https://github.com/nspcc-dev/neofs-s3-gw/issues/610 is fixed
-S3_SYNC_WAIT_TIME = 5
+S3_SYNC_TIMEOUT = 30
+S3_SYNC_POLL_INTERVAL = 0.05
+S3_SYNC_MAX_POLL_INTERVAL = 1
+
+# AWS CLI reports failed requests as "An error occurred (404) when calling ..."
+AWS_CLI_ERROR_STATUS_REGEX = re.compile(r"An error occurred \((\d{3})\)")
 
 
 class VersioningStatus(Enum):
@@ -23,6 +30,7 @@ class VersioningStatus(Enum):
     SUSPENDED = "Suspended"
 
 
+@timed_operation("s3.create_bucket", endpoint_arg="s3_client")
 @allure.step("Create bucket S3")
 def create_bucket_s3(
     s3_client,
@@ -55,7 +63,11 @@ def create_bucket_s3(
 
         s3_bucket = s3_client.create_bucket(**params)
         log_command_execution(f"Created S3 bucket {bucket_name}", s3_bucket)
-        sleep(S3_SYNC_WAIT_TIME)
+        wait_for_s3_sync(
+            s3_client,
+            "bucket creation",
+            lambda: get_s3_status(lambda: s3_client.head_bucket(Bucket=bucket_name)) == 200,
+        )
         return bucket_name
     except ClientError as err:
         raise Exception(
@@ -83,12 +95,17 @@ def list_buckets_s3(s3_client):
         ) from err
 
 
+@timed_operation("s3.delete_bucket", endpoint_arg="s3_client")
 @allure.step("Delete bucket S3")
 def delete_bucket_s3(s3_client, bucket: str):
     try:
         response = s3_client.delete_bucket(Bucket=bucket)
         log_command_execution("S3 Delete bucket result", response)
-        sleep(S3_SYNC_WAIT_TIME)
+        wait_for_s3_sync(
+            s3_client,
+            "bucket deletion",
+            lambda: get_s3_status(lambda: s3_client.head_bucket(Bucket=bucket)) == 404,
+        )
         return response
 
     except ClientError as err:
@@ -99,6 +116,7 @@ def delete_bucket_s3(s3_client, bucket: str):
         ) from err
 
 
+@timed_operation("s3.head_bucket", endpoint_arg="s3_client")
 @allure.step("Head bucket S3")
 def head_bucket(s3_client, bucket: str):
     try:
@@ -114,6 +132,68 @@ def head_bucket(s3_client, bucket: str):
         ) from err
 
 
+def wait_for_s3_sync(
+    s3_client,
+    change: str,
+    is_synced: Callable[[], bool],
+    timeout: float = S3_SYNC_TIMEOUT,
+    interval: float = S3_SYNC_POLL_INTERVAL,
+) -> float:
+    """
+    Polls S3 gate with exponential backoff until it reflects the change.
+
+    Time it took the gate to reflect the change is recorded to operation metrics as
+    "s3.sync.<change>" operation, so it is reported along with other metrics at the end of session.
+
+    Args:
+        s3_client: boto3 or AWS CLI client of the gate
+        change: kind of the change, used to group observed latencies
+        is_synced: probe that returns True when the gate reflects the change
+        timeout: time in seconds to wait for the change
+        interval: delay in seconds before the second probe, doubled after every probe
+
+    Returns:
+        Time in seconds it took the gate to reflect the change.
+    """
+    operation = f"s3.sync.{change.replace(' ', '_')}"
+    endpoint = get_endpoint(s3_client)
+    start_time = monotonic()
+    while not is_synced():
+        elapsed = monotonic() - start_time
+        if elapsed >= timeout:
+            operation_metrics.record(operation, endpoint, "error", elapsed * 1000)
+            raise AssertionError(f"S3 gate did not reflect {change} in {timeout}s")
+        sleep(min(interval, timeout - elapsed))
+        interval = min(interval * 2, S3_SYNC_MAX_POLL_INTERVAL)
+
+    latency = monotonic() - start_time
+    operation_metrics.record(operation, endpoint, "ok", latency * 1000)
+    logger.info(f"S3 gate reflected {change} in {latency:.3f}s")
+    return latency
+
+
+def get_s3_status(request: Callable[[], dict]) -> int:
+    """
+    Makes request to S3 gate and returns HTTP status of the response instead of raising errors.
+
+    Args:
+        request: call of S3 client method, either boto3 or AWS CLI one
+
+    Returns:
+        HTTP status code of the response.
+    """
+    try:
+        response = request()
+    except ClientError as err:
+        return err.response["ResponseMetadata"]["HTTPStatusCode"]
+    except RuntimeError as err:
+        match = AWS_CLI_ERROR_STATUS_REGEX.search(str(err))
+        if not match:
+            raise
+        return int(match.group(1))
+    return response.get("ResponseMetadata", {}).get("HTTPStatusCode", 200)
+
+
 @allure.step("Set bucket versioning status")
 def set_bucket_versioning(s3_client, bucket_name: str, status: VersioningStatus) -> None:
     try:
@@ -1,16 +1,24 @@
+import base64
+import hashlib
 import logging
 import os
 import uuid
-from time import sleep
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import suppress
+from dataclasses import dataclass
+from time import perf_counter, sleep
+from typing import Callable, Iterator, Optional
 
 import allure
 import pytest
 import urllib3
 from aws_cli_client import AwsCliClient
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from cli_helpers import log_command_execution
-from s3_gate_bucket import S3_SYNC_WAIT_TIME
+from file_helper import get_file_hash
+from operation_metrics import timed_operation
+from s3_gate_bucket import get_s3_status, wait_for_s3_sync
 
 ##########################################################
 # Disabling warnings on self-signed certificate which the
@@ -31,7 +39,43 @@ ACL_COPY = [
 
 ASSETS_DIR = os.getenv("ASSETS_DIR", "TemporaryDir/")
 
-
+# DeleteObjects request accepts up to 1000 keys
+S3_DELETE_BATCH_SIZE = 1000
+S3_CLEANUP_WORKERS = 8
+S3_CLEANUP_PASSES = 3
+
+# Every part of multipart upload except the last one must be at least 5 MiB
+S3_MULTIPART_PART_SIZE = 8 * 1024 * 1024
+S3_MULTIPART_WORKERS = 8
+S3_MULTIPART_RETRIES = 3
+S3_MULTIPART_RETRY_DELAY = 1
+
+# Size of chunks in which object payload is streamed to files and hashers
+S3_CHUNK_SIZE = 1024 * 1024
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=64 * 1024 * 1024,
+    multipart_chunksize=S3_MULTIPART_PART_SIZE,
+    max_concurrency=S3_MULTIPART_WORKERS,
+    io_chunksize=S3_CHUNK_SIZE,
+)
+
+# Request parameters that continue listing and the response fields they are taken from
+S3_PAGINATION_TOKENS = {
+    "list_objects": {"Marker": "NextMarker"},
+    "list_objects_v2": {"ContinuationToken": "NextContinuationToken"},
+    "list_object_versions": {
+        "KeyMarker": "NextKeyMarker",
+        "VersionIdMarker": "NextVersionIdMarker",
+    },
+}
+S3_PAGE_SIZE_PARAMS = {
+    "list_objects": "MaxKeys",
+    "list_objects_v2": "MaxKeys",
+    "list_object_versions": "MaxKeys",
+}
+
+
+@timed_operation("s3.list_objects_v2", endpoint_arg="s3_client")
 @allure.step("List objects S3 v2")
 def list_objects_s3_v2(s3_client, bucket: str, full_output: bool = False) -> list:
     try:
@@ -51,6 +95,7 @@ def list_objects_s3_v2(s3_client, bucket: str, full_output: bool = False) -> lis
         ) from err
 
 
+@timed_operation("s3.list_objects", endpoint_arg="s3_client")
 @allure.step("List objects S3")
 def list_objects_s3(s3_client, bucket: str, full_output: bool = False) -> list:
     try:
@@ -100,21 +145,156 @@ def list_objects_delete_markers_s3(s3_client, bucket: str, full_output: bool = F
         ) from err
 
 
+def paginate_s3(
+    s3_client, operation: str, page_size: Optional[int] = None, **params
+) -> Iterator[tuple[dict, float]]:
+    """
+    Lazily requests pages of S3 listing operation until the listing is complete.
+
+    Args:
+        s3_client: S3 client
+        operation: name of listing method of the client, one of S3_PAGINATION_TOKENS
+        page_size: maximum number of entries per page, the gate's default if omitted
+        params: parameters of the listing request, e.g. Bucket and Prefix
+
+    Yields:
+        Response for every page and the time the page took in seconds.
+    """
+    tokens = S3_PAGINATION_TOKENS[operation]
+    if page_size:
+        params[S3_PAGE_SIZE_PARAMS[operation]] = page_size
+    page = 0
+    while True:
+        start = perf_counter()
+        try:
+            response = getattr(s3_client, operation)(**params)
+        except ClientError as err:
+            raise Exception(
+                f'Error Message: {err.response["Error"]["Message"]}\n'
+                f'Http status code: {err.response["ResponseMetadata"]["HTTPStatusCode"]}'
+            ) from err
+        latency = perf_counter() - start
+        page += 1
+        logger.info(f"S3 {operation} page {page} received in {latency:.3f}s")
+        yield response, latency
+
+        if not response.get("IsTruncated"):
+            return
+        for param, field in tokens.items():
+            params[param] = response.get(field)
+        if operation == "list_objects" and not params["Marker"]:
+            # NextMarker is returned only if delimiter is set, otherwise the last key is used
+            params["Marker"] = response["Contents"][-1]["Key"]
+
+
+def iter_objects_s3(
+    s3_client,
+    bucket: str,
+    full_output: bool = False,
+    page_size: Optional[int] = None,
+    **params,
+) -> Iterator:
+    """
+    Iterates over all objects in the bucket using ListObjects with Marker pagination.
+
+    Args:
+        s3_client: S3 client
+        bucket: name of the bucket
+        full_output: yield object descriptions instead of keys
+        page_size: maximum number of keys per page
+        params: additional listing parameters, e.g. Prefix
+
+    Yields:
+        Object keys or descriptions.
+    """
+    for response, _ in paginate_s3(s3_client, "list_objects", page_size, Bucket=bucket, **params):
+        for obj in response.get("Contents", []):
+            yield obj if full_output else obj["Key"]
+
+
+def iter_objects_s3_v2(
+    s3_client,
+    bucket: str,
+    full_output: bool = False,
+    page_size: Optional[int] = None,
+    **params,
+) -> Iterator:
+    """
+    Iterates over all objects in the bucket using ListObjectsV2 with ContinuationToken.
+
+    Args:
+        s3_client: S3 client
+        bucket: name of the bucket
+        full_output: yield object descriptions instead of keys
+        page_size: maximum number of keys per page
+        params: additional listing parameters, e.g. Prefix
+
+    Yields:
+        Object keys or descriptions.
+    """
+    for response, _ in paginate_s3(
+        s3_client, "list_objects_v2", page_size, Bucket=bucket, **params
+    ):
+        for obj in response.get("Contents", []):
+            yield obj if full_output else obj["Key"]
+
+
+def iter_objects_versions_s3(
+    s3_client, bucket: str, page_size: Optional[int] = None, **params
+) -> Iterator[dict]:
+    """
+    Iterates over all object versions in the bucket using KeyMarker/VersionIdMarker.
+
+    Args:
+        s3_client: S3 client
+        bucket: name of the bucket
+        page_size: maximum number of versions and delete markers per page
+        params: additional listing parameters, e.g. Prefix
+
+    Yields:
+        Object versions.
+    """
+    for response, _ in paginate_s3(
+        s3_client, "list_object_versions", page_size, Bucket=bucket, **params
+    ):
+        yield from response.get("Versions", [])
+
+
+def iter_objects_delete_markers_s3(
+    s3_client, bucket: str, page_size: Optional[int] = None, **params
+) -> Iterator[dict]:
+    """
+    Iterates over all delete markers in the bucket using KeyMarker/VersionIdMarker.
+
+    Args:
+        s3_client: S3 client
+        bucket: name of the bucket
+        page_size: maximum number of versions and delete markers per page
+        params: additional listing parameters, e.g. Prefix
+
+    Yields:
+        Delete markers.
+    """
+    for response, _ in paginate_s3(
+        s3_client, "list_object_versions", page_size, Bucket=bucket, **params
+    ):
+        yield from response.get("DeleteMarkers", [])
+
+
+@timed_operation("s3.put_object", endpoint_arg="s3_client", payload_arg="filepath")
 @allure.step("Put object S3")
 def put_object_s3(s3_client, bucket: str, filepath: str, **kwargs):
     filename = os.path.basename(filepath)
 
-    if isinstance(s3_client, AwsCliClient):
-        file_content = filepath
-    else:
-        with open(filepath, "rb") as put_file:
-            file_content = put_file.read()
-
     try:
-        params = {"Body": file_content, "Bucket": bucket, "Key": filename}
-        if kwargs:
-            params = {**params, **kwargs}
-        response = s3_client.put_object(**params)
+        if isinstance(s3_client, AwsCliClient):
+            params = {"Body": filepath, "Bucket": bucket, "Key": filename, **kwargs}
+            response = s3_client.put_object(**params)
+        else:
+            # File object is passed as is, so boto3 streams it instead of reading into memory
+            with open(filepath, "rb") as put_file:
+                params = {"Body": put_file, "Bucket": bucket, "Key": filename, **kwargs}
+                response = s3_client.put_object(**params)
         log_command_execution("S3 Put object result", response)
         return response.get("VersionId")
     except ClientError as err:
@@ -124,6 +304,51 @@ def put_object_s3(s3_client, bucket: str, filepath: str, **kwargs):
         ) from err
 
 
+@allure.step("Upload object S3")
+def upload_object_s3(
+    s3_client,
+    bucket: str,
+    filepath: str,
+    object_key: Optional[str] = None,
+    transfer_config: TransferConfig = S3_TRANSFER_CONFIG,
+    **extra_args,
+) -> None:
+    """
+    Uploads the file with boto3 managed transfer.
+
+    The file is streamed from disk, and files larger than multipart threshold of the transfer
+    config are uploaded as concurrent parts. AWS CLI client has no managed transfer API, so
+    the file is put with PutObject for it.
+
+    Args:
+        s3_client: S3 client
+        bucket: name of the bucket
+        filepath: path to the file to upload
+        object_key: key of the object, name of the file by default
+        transfer_config: boto3 transfer settings (part size, concurrency, threshold)
+        extra_args: additional PutObject/CreateMultipartUpload parameters, e.g. Metadata
+    """
+    object_key = object_key or os.path.basename(filepath)
+    try:
+        if isinstance(s3_client, AwsCliClient):
+            response = s3_client.put_object(
+                Body=filepath, Bucket=bucket, Key=object_key, **extra_args
+            )
+            log_command_execution("S3 Put object result", response)
+            return
+        with open(filepath, "rb") as put_file:
+            s3_client.upload_fileobj(
+                put_file, bucket, object_key, ExtraArgs=extra_args, Config=transfer_config
+            )
+        logger.info(f"Uploaded {filepath} to {bucket}/{object_key}")
+    except ClientError as err:
+        raise Exception(
+            f'Error Message: {err.response["Error"]["Message"]}\n'
+            f'Http status code: {err.response["ResponseMetadata"]["HTTPStatusCode"]}'
+        ) from err
+
+
+@timed_operation("s3.head_object", endpoint_arg="s3_client")
 @allure.step("Head object S3")
 def head_object_s3(s3_client, bucket: str, object_key: str, version_id: Optional[str] = None):
     try:
@@ -141,6 +366,7 @@ def head_object_s3(s3_client, bucket: str, object_key: str, version_id: Optional
         ) from err
 
 
+@timed_operation("s3.delete_object", endpoint_arg="s3_client")
 @allure.step("Delete object S3")
 def delete_object_s3(
     s3_client, bucket: str, object_key: str, version_id: Optional[str] = None
@@ -151,7 +377,11 @@ def delete_object_s3(
             params["VersionId"] = version_id
         response = s3_client.delete_object(**params)
         log_command_execution("S3 Delete object result", response)
-        sleep(S3_SYNC_WAIT_TIME)
+        wait_for_s3_sync(
+            s3_client,
+            "object deletion",
+            lambda: get_s3_status(lambda: s3_client.head_object(**params)) >= 400,
+        )
         return response
 
     except ClientError as err:
@@ -166,7 +396,12 @@ def delete_objects_s3(s3_client, bucket: str, object_keys: list):
     try:
         response = s3_client.delete_objects(Bucket=bucket, Delete=_make_objs_dict(object_keys))
         log_command_execution("S3 Delete objects result", response)
-        sleep(S3_SYNC_WAIT_TIME)
+        deleted_keys = {deleted["Key"] for deleted in response.get("Deleted", [])}
+        wait_for_s3_sync(
+            s3_client,
+            "objects deletion",
+            lambda: deleted_keys.isdisjoint(iter_objects_s3(s3_client, bucket)),
+        )
         return response
 
     except ClientError as err:
@@ -221,6 +456,63 @@ def delete_object_versions_s3_without_dm(s3_client, bucket: str, object_versions
         ) from err
 
 
+@allure.step("Delete all objects in bucket S3")
+def delete_all_objects_s3(s3_client, bucket: str, max_workers: int = S3_CLEANUP_WORKERS) -> int:
+    """
+    Deletes all object versions and delete markers from the bucket.
+
+    Versions and delete markers are listed page by page with list_object_versions, which also
+    returns objects of unversioned buckets (with "null" version), and every page is deleted
+    with DeleteObjects in batches of up to 1000 keys on a pool of workers. Listing is repeated
+    until it returns nothing, so entries that became visible during cleanup are removed as well.
+
+    Args:
+        s3_client: S3 client
+        bucket: name of the bucket
+        max_workers: maximum number of concurrent DeleteObjects requests
+
+    Returns:
+        Number of deleted versions and delete markers.
+    """
+    deleted = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for _ in range(S3_CLEANUP_PASSES):
+            futures = [
+                executor.submit(_delete_object_versions_batch, s3_client, bucket, batch)
+                for batch in _iter_object_versions_batches(s3_client, bucket)
+            ]
+            if not futures:
+                logger.info(f"Deleted {deleted} versions and delete markers from {bucket}")
+                return deleted
+            deleted += sum(future.result() for future in futures)
+    raise AssertionError(f"Bucket {bucket} is not empty after {S3_CLEANUP_PASSES} cleanup passes")
+
+
+def _iter_object_versions_batches(s3_client, bucket: str) -> Iterator[list[dict]]:
+    for response, _ in paginate_s3(s3_client, "list_object_versions", Bucket=bucket):
+        entries = [
+            {"Key": entry["Key"], "VersionId": entry["VersionId"]}
+            for entry in response.get("Versions", []) + response.get("DeleteMarkers", [])
+        ]
+        for start in range(0, len(entries), S3_DELETE_BATCH_SIZE):
+            yield entries[start : start + S3_DELETE_BATCH_SIZE]
+
+
+def _delete_object_versions_batch(s3_client, bucket: str, entries: list[dict]) -> int:
+    try:
+        response = s3_client.delete_objects(
+            Bucket=bucket, Delete={"Objects": entries, "Quiet": True}
+        )
+    except ClientError as err:
+        raise Exception(
+            f'Error Message: {err.response["Error"]["Message"]}\n'
+            f'Http status code: {err.response["ResponseMetadata"]["HTTPStatusCode"]}'
+        ) from err
+    errors = response.get("Errors", [])
+    assert not errors, f"Failed to delete objects from {bucket}: {errors}"
+    return len(entries)
+
+
 @allure.step("Put object ACL")
 def put_object_acl_s3(
     s3_client,
@@ -301,6 +593,7 @@ def copy_object_s3(
         ) from err
 
 
+@timed_operation("s3.get_object", endpoint_arg="s3_client", payload_result=True)
 @allure.step("Get object S3")
 def get_object_s3(
     s3_client,
@@ -327,10 +620,8 @@ def get_object_s3(
 
         if not isinstance(s3_client, AwsCliClient):
             with open(f"{filename}", "wb") as get_file:
-                chunk = response["Body"].read(1024)
-                while chunk:
+                for chunk in response["Body"].iter_chunks(S3_CHUNK_SIZE):
                     get_file.write(chunk)
-                    chunk = response["Body"].read(1024)
         return response if full_output else filename
 
     except ClientError as err:
@@ -340,6 +631,232 @@ def get_object_s3(
         ) from err
 
 
+@allure.step("Get object hash S3")
+def get_object_hash_s3(
+    s3_client,
+    bucket: str,
+    object_key: str,
+    version_id: Optional[str] = None,
+    range: Optional[list] = None,
+) -> str:
+    """
+    Reads the object (or its range) and hashes it in chunks without saving it to disk.
+
+    AWS CLI client can only save objects to files, so for it the object is downloaded
+    and the file is hashed.
+
+    Args:
+        s3_client: S3 client
+        bucket: name of the bucket
+        object_key: key of the object
+        version_id: version of the object, the latest one by default
+        range: first and last bytes of the range to read, both inclusive
+
+    Returns:
+        Hex-encoded SHA-256 hash of the read data.
+    """
+    if isinstance(s3_client, AwsCliClient):
+        file_path = get_object_s3(s3_client, bucket, object_key, version_id, range)
+        file_hash = get_file_hash(file_path)
+        os.remove(file_path)
+        return file_hash
+
+    params = {"Bucket": bucket, "Key": object_key}
+    if version_id:
+        params["VersionId"] = version_id
+    if range:
+        params["Range"] = f"bytes={range[0]}-{range[1]}"
+
+    try:
+        start_time = perf_counter()
+        response = s3_client.get_object(**params)
+        object_hash = hashlib.sha256()
+        size = 0
+        for chunk in response["Body"].iter_chunks(S3_CHUNK_SIZE):
+            object_hash.update(chunk)
+            size += len(chunk)
+        duration = perf_counter() - start_time
+    except ClientError as err:
+        raise Exception(
+            f'Error Message: {err.response["Error"]["Message"]}\n'
+            f'Http status code: {err.response["ResponseMetadata"]["HTTPStatusCode"]}'
+        ) from err
+
+    logger.info(
+        f"Read {size} bytes of {bucket}/{object_key} in {duration:.3f}s, "
+        f"{size / duration / 1024 / 1024:.2f} MiB/s"
+    )
+    return object_hash.hexdigest()
+
+
+@dataclass
+class S3SegmentedDownload:
+    """
+    Object read from S3 gate by concurrent segments.
+
+    Attributes:
+        sha256: hex-encoded SHA-256 hash of the reassembled object
+        size: size of the object in bytes
+        duration: time of the download in seconds
+        segment_latencies: latency of every segment request in seconds, in segments order
+        file_path: path to the file with the object, if it was saved
+    """
+
+    sha256: str
+    size: int
+    duration: float
+    segment_latencies: list[float]
+    file_path: Optional[str] = None
+
+    @property
+    def throughput(self) -> float:
+        """Download throughput in bytes per second."""
+        return self.size / self.duration if self.duration else 0.0
+
+
+@allure.step("Get object S3 by segments")
+def get_object_segmented_s3(
+    s3_client,
+    bucket: str,
+    object_key: str,
+    version_id: Optional[str] = None,
+    segment_size: int = S3_MULTIPART_PART_SIZE,
+    use_parts: bool = True,
+    file_path: Optional[str] = None,
+    max_workers: int = S3_MULTIPART_WORKERS,
+) -> S3SegmentedDownload:
+    """
+    Reads the object with concurrent ranged GET requests and hashes it in order.
+
+    Objects uploaded with multipart upload are read by their parts (GET with PartNumber), so
+    segments match the part boundaries; other objects are read by ranges of fixed size.
+    Segments are hashed as soon as all preceding segments have arrived and, if the file path
+    is specified, are written to their offsets in the file.
+
+    Args:
+        s3_client: S3 client
+        bucket: name of the bucket
+        object_key: key of the object
+        version_id: version of the object, the latest one by default
+        segment_size: size of ranges the object is read by when it is not read by parts
+        use_parts: whether multipart objects should be read by their parts
+        file_path: path to save the object to, the object is only hashed if not specified
+        max_workers: maximum number of concurrent requests
+
+    Returns:
+        Hash, size and timings of the download.
+    """
+    params = {"Bucket": bucket, "Key": object_key}
+    if version_id:
+        params["VersionId"] = version_id
+
+    start_time = perf_counter()
+    # AWS CLI client does not support PartNumber parameter
+    use_parts = use_parts and not isinstance(s3_client, AwsCliClient)
+    head = None
+    if use_parts:
+        with suppress(ClientError):
+            head = s3_client.head_object(**params, PartNumber=1)
+        # Parts can only be placed in the object if the gate reports their Content-Range
+        if head and head.get("PartsCount", 0) > 1 and not head.get("ContentRange"):
+            logger.info(f"S3 gate did not report Content-Range of {object_key} part")
+            head = None
+    try:
+        # Gate may not support reading by parts, then the object is read by ranges
+        head = head or s3_client.head_object(**params)
+    except ClientError as err:
+        raise Exception(
+            f'Error Message: {err.response["Error"]["Message"]}\n'
+            f'Http status code: {err.response["ResponseMetadata"]["HTTPStatusCode"]}'
+        ) from err
+
+    parts_count = head.get("PartsCount", 0)
+    content_range = head.get("ContentRange")
+    if parts_count > 1 and content_range:
+        segments = [{"PartNumber": part_num} for part_num in range(1, parts_count + 1)]
+        # Size of the first part is returned by HEAD, the total one is in its Content-Range
+        size = int(content_range.rsplit("/", 1)[1])
+    else:
+        size = head["ContentLength"]
+        segments = [
+            {"Range": f"bytes={offset}-{min(offset + segment_size, size) - 1}"}
+            for offset in range(0, size, segment_size)
+        ]
+
+    def get_segment(segment: dict) -> tuple[int, bytes, float]:
+        segment_start_time = perf_counter()
+        offset, data = _get_object_segment(s3_client, params, segment)
+        return offset, data, perf_counter() - segment_start_time
+
+    object_hash = hashlib.sha256()
+    received = {}
+    next_offset = 0
+    latencies = {}
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644) if file_path else None
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(get_segment, segment): i for i, segment in enumerate(segments)
+            }
+            for future in as_completed(futures):
+                offset, data, latencies[futures[future]] = future.result()
+                if fd is not None:
+                    os.pwrite(fd, data, offset)
+                received[offset] = data
+                # Hash contiguous segments and release them
+                while next_offset in received:
+                    data = received.pop(next_offset)
+                    object_hash.update(data)
+                    next_offset += len(data)
+    finally:
+        if fd is not None:
+            os.close(fd)
+    assert next_offset == size and not received, (
+        f"Segments of {bucket}/{object_key} do not cover the object: "
+        f"read {next_offset} of {size} bytes"
+    )
+
+    download = S3SegmentedDownload(
+        sha256=object_hash.hexdigest(),
+        size=size,
+        duration=perf_counter() - start_time,
+        segment_latencies=[latencies[i] for i in range(len(segments))],
+        file_path=file_path,
+    )
+    logger.info(
+        f"Read {size} bytes of {bucket}/{object_key} by {len(segments)} segments in "
+        f"{download.duration:.3f}s, {download.throughput / 1024 / 1024:.2f} MiB/s, "
+        f"max segment latency {max(download.segment_latencies, default=0):.3f}s"
+    )
+    return download
+
+
+def _get_object_segment(s3_client, params: dict, segment: dict) -> tuple[int, bytes]:
+    if isinstance(s3_client, AwsCliClient):
+        segment_path = os.path.join(os.getcwd(), ASSETS_DIR, str(uuid.uuid4()))
+        try:
+            response = s3_client.get_object(**params, **segment, file_path=segment_path)
+            with open(segment_path, "rb") as segment_file:
+                data = segment_file.read()
+        finally:
+            if os.path.exists(segment_path):
+                os.remove(segment_path)
+    else:
+        try:
+            response = s3_client.get_object(**params, **segment)
+        except ClientError as err:
+            raise Exception(
+                f'Error Message: {err.response["Error"]["Message"]}\n'
+                f'Http status code: {err.response["ResponseMetadata"]["HTTPStatusCode"]}'
+            ) from err
+        data = b"".join(response["Body"].iter_chunks(S3_CHUNK_SIZE))
+
+    content_range = response.get("ContentRange")
+    # Response for the whole object has no Content-Range
+    offset = int(content_range.split(" ")[1].split("-")[0]) if content_range else 0
+    return offset, data
+
+
 @allure.step("Create multipart upload S3")
 def create_multipart_upload_s3(s3_client, bucket_name: str, object_key: str) -> str:
     try:
@@ -472,6 +989,266 @@ def complete_multipart_upload_s3(
         ) from err
 
 
+@allure.step("Upload multipart S3")
+def upload_multipart_s3(
+    s3_client,
+    bucket_name: str,
+    object_key: str,
+    filepath: str,
+    offset: int = 0,
+    size: Optional[int] = None,
+    part_size: int = S3_MULTIPART_PART_SIZE,
+    max_workers: int = S3_MULTIPART_WORKERS,
+    retries: int = S3_MULTIPART_RETRIES,
+    upload_id: Optional[str] = None,
+    first_part_num: int = 1,
+    complete: bool = True,
+) -> tuple[str, list[tuple[int, str]]]:
+    """
+    Uploads the file (or its range) as parts of multipart upload on a pool of workers.
+
+    Every part is read from its offset in the source file, so no part files are created for
+    boto3 client. MD5 of each part is calculated while the part is read and is sent as
+    Content-MD5, so the gate verifies the part. Failed parts are retried individually.
+
+    Args:
+        s3_client: S3 client
+        bucket_name: name of the bucket
+        object_key: key of the uploaded object
+        filepath: path to the source file
+        offset: offset in the source file to start upload from
+        size: number of bytes to upload, by default the rest of the file
+        part_size: size of every part except the last one, at least 5 MiB
+        max_workers: maximum number of concurrent UploadPart requests
+        retries: number of attempts to upload every part
+        upload_id: ID of existing multipart upload, a new one is created if not specified
+        first_part_num: number of the first uploaded part
+        complete: whether the upload should be completed with the uploaded parts
+
+    Returns:
+        ID of the multipart upload and (part number, ETag) pairs of the uploaded parts.
+    """
+    if size is None:
+        size = os.path.getsize(filepath) - offset
+    part_ranges = _split_into_part_ranges(offset, size, part_size, first_part_num)
+
+    def upload_part(upload_id: str, part_num: int, start: int, length: int) -> str:
+        return _upload_file_part(
+            s3_client, bucket_name, object_key, upload_id, part_num, filepath, start, length
+        )
+
+    return _run_multipart_upload(
+        s3_client,
+        bucket_name,
+        object_key,
+        upload_id,
+        part_ranges,
+        upload_part,
+        max_workers,
+        retries,
+        complete,
+    )
+
+
+@allure.step("Upload multipart copy S3")
+def upload_multipart_copy_s3(
+    s3_client,
+    bucket_name: str,
+    object_key: str,
+    copy_source: str,
+    source_size: int,
+    part_size: int = S3_MULTIPART_PART_SIZE,
+    max_workers: int = S3_MULTIPART_WORKERS,
+    retries: int = S3_MULTIPART_RETRIES,
+    upload_id: Optional[str] = None,
+    first_part_num: int = 1,
+    complete: bool = True,
+) -> tuple[str, list[tuple[int, str]]]:
+    """
+    Copies the object on server side as ranged parts of multipart upload on a pool of workers.
+
+    Args:
+        s3_client: S3 client
+        bucket_name: name of the bucket
+        object_key: key of the new object
+        copy_source: source object in "bucket/key" form
+        source_size: size of the source object in bytes
+        part_size: size of every part except the last one, at least 5 MiB
+        max_workers: maximum number of concurrent UploadPartCopy requests
+        retries: number of attempts to copy every part
+        upload_id: ID of existing multipart upload, a new one is created if not specified
+        first_part_num: number of the first copied part
+        complete: whether the upload should be completed with the copied parts
+
+    Returns:
+        ID of the multipart upload and (part number, ETag) pairs of the copied parts.
+    """
+    part_ranges = _split_into_part_ranges(0, source_size, part_size, first_part_num)
+
+    def copy_part(upload_id: str, part_num: int, start: int, length: int) -> str:
+        try:
+            response = s3_client.upload_part_copy(
+                UploadId=upload_id,
+                Bucket=bucket_name,
+                Key=object_key,
+                PartNumber=part_num,
+                CopySource=copy_source,
+                CopySourceRange=f"bytes={start}-{start + length - 1}",
+            )
+        except ClientError as err:
+            raise Exception(
+                f'Error Message: {err.response["Error"]["Message"]}\n'
+                f'Http status code: {err.response["ResponseMetadata"]["HTTPStatusCode"]}'
+            ) from err
+        etag = response.get("CopyPartResult", {}).get("ETag")
+        assert etag, f"Expected ETag in response:\n{response}"
+        return etag
+
+    return _run_multipart_upload(
+        s3_client,
+        bucket_name,
+        object_key,
+        upload_id,
+        part_ranges,
+        copy_part,
+        max_workers,
+        retries,
+        complete,
+    )
+
+
+def _split_into_part_ranges(
+    offset: int, size: int, part_size: int, first_part_num: int
+) -> list[tuple[int, int, int]]:
+    return [
+        (part_num, start, min(part_size, offset + size - start))
+        for part_num, start in enumerate(range(offset, offset + size, part_size), first_part_num)
+    ]
+
+
+def _run_multipart_upload(
+    s3_client,
+    bucket_name: str,
+    object_key: str,
+    upload_id: Optional[str],
+    part_ranges: list[tuple[int, int, int]],
+    upload_part: Callable[[str, int, int, int], str],
+    max_workers: int,
+    retries: int,
+    complete: bool,
+) -> tuple[str, list[tuple[int, str]]]:
+    created = upload_id is None
+    if created:
+        upload_id = create_multipart_upload_s3(s3_client, bucket_name, object_key)
+
+    start_time = perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_with_part_retries, upload_part, retries, upload_id, *part_range)
+            for part_range in part_ranges
+        ]
+        try:
+            parts = [
+                (part_num, future.result())
+                for (part_num, _, _), future in zip(part_ranges, futures)
+            ]
+        except Exception:
+            for future in futures:
+                future.cancel()
+            if created:
+                abort_multipart_uploads_s3(s3_client, bucket_name, object_key, upload_id)
+            raise
+    duration = perf_counter() - start_time
+
+    size = sum(length for _, _, length in part_ranges)
+    logger.info(
+        f"Uploaded {len(parts)} parts ({size} bytes) of {object_key} in {duration:.2f}s, "
+        f"{size / duration / 1024 / 1024:.2f} MiB/s"
+    )
+    if complete:
+        complete_multipart_upload_s3(s3_client, bucket_name, object_key, upload_id, parts)
+    return upload_id, parts
+
+
+def _with_part_retries(
+    upload_part: Callable[[str, int, int, int], str],
+    retries: int,
+    upload_id: str,
+    part_num: int,
+    start: int,
+    length: int,
+) -> str:
+    for attempt in range(1, retries + 1):
+        try:
+            return upload_part(upload_id, part_num, start, length)
+        except Exception as err:
+            if attempt == retries:
+                raise
+            logger.warning(f"Attempt {attempt} to upload part {part_num} failed: {err}")
+            sleep(S3_MULTIPART_RETRY_DELAY * attempt)
+
+
+def _upload_file_part(
+    s3_client,
+    bucket_name: str,
+    object_key: str,
+    upload_id: str,
+    part_num: int,
+    filepath: str,
+    start: int,
+    length: int,
+) -> str:
+    part_hash = hashlib.md5()
+    if isinstance(s3_client, AwsCliClient):
+        # AWS CLI reads part body from file, so the part is copied into temporary one
+        body = os.path.join(os.getcwd(), ASSETS_DIR, f"{uuid.uuid4()}_part_{part_num}")
+        with open(filepath, "rb") as source, open(body, "wb") as part_file:
+            source.seek(start)
+            for chunk in _read_chunks(source, length):
+                part_hash.update(chunk)
+                part_file.write(chunk)
+    else:
+        # Part is read into preallocated buffer that is passed to boto3 as is, so only one copy
+        # of the part is kept in memory
+        body = bytearray(length)
+        with open(filepath, "rb") as source, memoryview(body) as view:
+            source.seek(start)
+            for offset in range(0, length, S3_CHUNK_SIZE):
+                chunk = view[offset : offset + S3_CHUNK_SIZE]
+                if source.readinto(chunk) != len(chunk):
+                    raise AssertionError(f"Unexpected end of {filepath}")
+                part_hash.update(chunk)
+
+    try:
+        response = s3_client.upload_part(
+            UploadId=upload_id,
+            Bucket=bucket_name,
+            Key=object_key,
+            PartNumber=part_num,
+            Body=body,
+            ContentMD5=base64.b64encode(part_hash.digest()).decode("utf-8"),
+        )
+    except ClientError as err:
+        raise Exception(
+            f'Error Message: {err.response["Error"]["Message"]}\n'
+            f'Http status code: {err.response["ResponseMetadata"]["HTTPStatusCode"]}'
+        ) from err
+    finally:
+        if isinstance(s3_client, AwsCliClient):
+            os.remove(body)
+    assert response.get("ETag"), f"Expected ETag in response:\n{response}"
+    return response.get("ETag")
+
+
+def _read_chunks(file, length: int, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+    while length > 0:
+        chunk = file.read(min(chunk_size, length))
+        if not chunk:
+            raise AssertionError(f"Unexpected end of {file.name}")
+        length -= len(chunk)
+        yield chunk
+
+
 @allure.step("Put object retention")
 def put_object_retention(
     s3_client,
@@ -210,7 +210,7 @@ class TestStorageGroup(ClusterTestBase):
         set_eacl(
             self.main_wallet,
             cid,
-            create_eacl(cid, eacl_deny, shell=self.shell),
+            create_eacl(cid, eacl_deny),
             shell=self.shell,
             endpoint=self.cluster.default_rpc_endpoint,
         )
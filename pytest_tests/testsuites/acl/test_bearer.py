@@ -1,3 +1,4 @@
+import json
 import os
 import uuid
 from collections import namedtuple
@@ -20,7 +21,7 @@ from python_keywords.acl import (
     form_bearertoken_file,
     set_eacl,
     sign_bearer,
-    wait_for_cache_expired,
+    wait_for_eacl_propagation,
 )
 from python_keywords.container import create_container
 from python_keywords.container_access import (
@@ -28,6 +29,13 @@ from python_keywords.container_access import (
     check_full_access_to_container,
     check_no_access_to_container,
 )
+from python_keywords.eacl_encoding import (
+    encode_bearer_token,
+    encode_bearer_token_body,
+    sign_bearer_token,
+    split_bearer_token,
+    verify_bearer_token_signature,
+)
 from python_keywords.neofs_verbs import put_object_to_random_node
 from wellknown_acl import PUBLIC_ACL
 
@@ -60,9 +68,11 @@ class TestACLBearer(ClusterTestBase):
             eacl = [
                 EACLRule(access=EACLAccess.DENY, role=role, operation=op) for op in EACLOperation
             ]
-            eacl_file = create_eacl(cid, eacl, shell=self.shell)
+            eacl_file = create_eacl(cid, eacl)
             set_eacl(user_wallet.wallet_path, cid, eacl_file, shell=self.shell, endpoint=endpoint)
-            wait_for_cache_expired()
+            wait_for_eacl_propagation(
+                user_wallet.wallet_path, cid, self.shell, self.cluster.get_storage_rpc_endpoints()
+            )
 
         with allure.step(f"Create bearer token for {role.value} with all operations allowed"):
             bearer = form_bearertoken_file(
@@ -107,9 +117,11 @@ class TestACLBearer(ClusterTestBase):
             eacl = [
                 EACLRule(access=EACLAccess.ALLOW, role=role, operation=op) for op in EACLOperation
             ]
-            eacl_file = create_eacl(cid, eacl, shell=self.shell)
+            eacl_file = create_eacl(cid, eacl)
             set_eacl(user_wallet.wallet_path, cid, eacl_file, shell=self.shell, endpoint=endpoint)
-            wait_for_cache_expired()
+            wait_for_eacl_propagation(
+                user_wallet.wallet_path, cid, self.shell, self.cluster.get_storage_rpc_endpoints()
+            )
 
         with allure.step(
             f"Check {role.value} without token has access to all operations with container"
@@ -172,11 +184,13 @@ class TestACLBearer(ClusterTestBase):
         set_eacl(
             user_wallet.wallet_path,
             cid,
-            eacl_table_path=create_eacl(cid, eacl_deny, shell=self.shell),
+            eacl_table_path=create_eacl(cid, eacl_deny),
             shell=self.shell,
             endpoint=endpoint,
         )
-        wait_for_cache_expired()
+        wait_for_eacl_propagation(
+            user_wallet.wallet_path, cid, self.shell, self.cluster.get_storage_rpc_endpoints()
+        )
 
         with allure.step("Check rule consistency without bearer"):
             check_custom_access_to_container(
@@ -270,7 +284,7 @@ class TestACLBearer(ClusterTestBase):
                 owner=get_last_address_from_wallet(user_wallet.wallet_path, WALLET_PASS),
                 out=path_to_bearer,
                 rpc_endpoint=self.cluster.default_rpc_endpoint,
-                eacl=create_eacl(cid, eacl, shell=self.shell),
+                eacl=create_eacl(cid, eacl),
                 lifetime=1 if expiration_flag == "lifetime" else None,
                 expire_at=current_epoch + 1 if expiration_flag == "expire_at" else None,
             )
@@ -425,6 +439,79 @@ class TestACLBearer(ClusterTestBase):
                 cluster=self.cluster,
             )
 
+    @allure.title("Check bearer token signed locally matches token signed via cli")
+    def test_bearer_token_signed_locally(
+        self, wallets, client_shell: Shell, cluster: Cluster, file_path: str
+    ):
+        user_wallet = wallets.get_wallet()
+        (container,) = self._create_containers_with_objects(
+            containers_count=1,
+            objects_count=0,
+            user_wallet=user_wallet,
+            client_shell=client_shell,
+            cluster=cluster,
+            file_path=file_path,
+        )
+        bearer_path = os.path.join(
+            os.getcwd(), ASSETS_DIR, TEST_FILES_DIR, f"bearer_token_{str(uuid.uuid4())}"
+        )
+
+        with allure.step("Create unsigned bearer token"):
+            unsigned_bearer = form_bearertoken_file(
+                user_wallet.wallet_path,
+                container.cid,
+                [
+                    EACLRule(operation=op, access=EACLAccess.ALLOW, role=EACLRole.USER)
+                    for op in EACLOperation
+                ],
+                shell=self.shell,
+                endpoint=self.cluster.default_rpc_endpoint,
+                sign=False,
+            )
+            with open(unsigned_bearer, "r", encoding="utf-8") as file:
+                token = json.load(file)
+
+        with allure.step("Sign bearer token locally and via cli"):
+            local_token = sign_bearer_token(token, user_wallet.wallet_path, WALLET_PASS)
+            local_body = encode_bearer_token_body(local_token["body"])
+            cli_bearer = f"{bearer_path}_cli"
+            sign_bearer(
+                shell=self.shell,
+                wallet_path=user_wallet.wallet_path,
+                eacl_rules_file_from=unsigned_bearer,
+                eacl_rules_file_to=cli_bearer,
+                json=False,
+            )
+            with open(cli_bearer, "rb") as file:
+                cli_body, cli_key, cli_signature = split_bearer_token(file.read())
+
+        with allure.step("Check bodies of the tokens are encoded the same way"):
+            assert local_body == cli_body, "Bearer token body signed locally differs from cli one"
+
+        with allure.step("Check signatures of the tokens"):
+            assert verify_bearer_token_signature(
+                cli_body, cli_key, cli_signature
+            ), "Signature of bearer token signed via cli is invalid"
+            assert verify_bearer_token_signature(
+                *split_bearer_token(encode_bearer_token(local_token))
+            ), "Signature of bearer token signed locally is invalid"
+
+        with allure.step("Check cli reads the token signed locally"):
+            local_bearer = f"{bearer_path}_local"
+            with open(local_bearer, "wb") as file:
+                file.write(encode_bearer_token(local_token))
+            resigned_bearer = f"{bearer_path}_resigned"
+            sign_bearer(
+                shell=self.shell,
+                wallet_path=user_wallet.wallet_path,
+                eacl_rules_file_from=local_bearer,
+                eacl_rules_file_to=resigned_bearer,
+                json=False,
+            )
+            with open(resigned_bearer, "rb") as file:
+                resigned_body, _, _ = split_bearer_token(file.read())
+            assert resigned_body == local_body, "Bearer token body changed after cli round-trip"
+
     def _create_containers_with_objects(
         self,
         containers_count: int,
@@ -11,7 +11,7 @@ from python_keywords.acl import (
     EACLRule,
     create_eacl,
     set_eacl,
-    wait_for_cache_expired,
+    wait_for_eacl_propagation,
     get_eacl,
 )
 from python_keywords.container import create_container
@@ -87,11 +87,13 @@ class TestEACLContainer(ClusterTestBase):
             set_eacl(
                 user_wallet.wallet_path,
                 cid,
-                create_eacl(cid, eacl_deny, shell=self.shell),
+                create_eacl(cid, eacl_deny),
                 shell=self.shell,
                 endpoint=self.cluster.default_rpc_endpoint,
             )
-            wait_for_cache_expired()
+            wait_for_eacl_propagation(
+                user_wallet.wallet_path, cid, self.shell, self.cluster.get_storage_rpc_endpoints()
+            )
 
         with allure.step(f"Check only {not_deny_role_str} has full access to container"):
             with allure.step(
@@ -126,11 +128,13 @@ class TestEACLContainer(ClusterTestBase):
             set_eacl(
                 user_wallet.wallet_path,
                 cid,
-                create_eacl(cid, eacl_deny, shell=self.shell),
+                create_eacl(cid, eacl_deny),
                 shell=self.shell,
                 endpoint=self.cluster.default_rpc_endpoint,
             )
-            wait_for_cache_expired()
+            wait_for_eacl_propagation(
+                user_wallet.wallet_path, cid, self.shell, self.cluster.get_storage_rpc_endpoints()
+            )
 
         with allure.step("Check all have full access to eACL public container"):
             check_full_access_to_container(
@@ -174,11 +178,13 @@ class TestEACLContainer(ClusterTestBase):
             set_eacl(
                 user_wallet.wallet_path,
                 cid,
-                create_eacl(cid, eacl, shell=self.shell),
+                create_eacl(cid, eacl),
                 shell=self.shell,
                 endpoint=self.cluster.default_rpc_endpoint,
             )
-            wait_for_cache_expired()
+            wait_for_eacl_propagation(
+                user_wallet.wallet_path, cid, self.shell, self.cluster.get_storage_rpc_endpoints()
+            )
 
         with allure.step("Check only owner and allowed other have full access to public container"):
             with allure.step("Check other has not access to operations with container"):
@@ -234,11 +240,13 @@ class TestEACLContainer(ClusterTestBase):
             set_eacl(
                 user_wallet.wallet_path,
                 cid,
-                create_eacl(cid, eacl_deny, shell=self.shell),
+                create_eacl(cid, eacl_deny),
                 shell=self.shell,
                 endpoint=self.cluster.default_rpc_endpoint,
             )
-            wait_for_cache_expired()
+            wait_for_eacl_propagation(
+                user_wallet.wallet_path, cid, self.shell, self.cluster.get_storage_rpc_endpoints()
+            )
 
         with allure.step("Drop object to check replication"):
             drop_object(storage_node, cid=cid, oid=oid)
@@ -272,12 +280,13 @@ class TestEACLContainer(ClusterTestBase):
                             EACLRule(access=EACLAccess.DENY, role=EACLRole.SYSTEM, operation=op)
                             for op in EACLOperation
                         ],
-                        shell=self.shell,
                     ),
                     shell=self.shell,
                     endpoint=endpoint,
                 )
-            wait_for_cache_expired()
+            wait_for_eacl_propagation(
+                user_wallet.wallet_path, cid, self.shell, self.cluster.get_storage_rpc_endpoints()
+            )
             with allure.step("The eACL must be empty"):
                 assert get_eacl(user_wallet.wallet_path, cid, self.shell, endpoint) is None
 
@@ -292,12 +301,13 @@ class TestEACLContainer(ClusterTestBase):
                             EACLRule(access=EACLAccess.ALLOW, role=EACLRole.SYSTEM, operation=op)
                             for op in EACLOperation
                         ],
-                        shell=self.shell,
                     ),
                     shell=self.shell,
                     endpoint=endpoint,
                 )
-            wait_for_cache_expired()
+            wait_for_eacl_propagation(
+                user_wallet.wallet_path, cid, self.shell, self.cluster.get_storage_rpc_endpoints()
+            )
             with allure.step("The eACL must be empty"):
                 assert get_eacl(user_wallet.wallet_path, cid, self.shell, endpoint) is None
 
@@ -323,12 +333,13 @@ class TestEACLContainer(ClusterTestBase):
                         EACLRule(access=EACLAccess.ALLOW, role=EACLRole.USER, operation=op)
                         for op in EACLOperation
                     ],
-                    shell=self.shell,
                 ),
                 shell=self.shell,
                 endpoint=endpoint,
             )
-            wait_for_cache_expired()
+            wait_for_eacl_propagation(
+                user_wallet.wallet_path, cid, self.shell, self.cluster.get_storage_rpc_endpoints()
+            )
 
         old_eacl = get_eacl(user_wallet.wallet_path, cid, self.shell, endpoint)
 
@@ -343,12 +354,13 @@ class TestEACLContainer(ClusterTestBase):
                             EACLRule(access=EACLAccess.DENY, role=EACLRole.SYSTEM, operation=op)
                             for op in EACLOperation
                         ],
-                        shell=self.shell,
                     ),
                     shell=self.shell,
                     endpoint=endpoint,
                 )
-        wait_for_cache_expired()
+        wait_for_eacl_propagation(
+            user_wallet.wallet_path, cid, self.shell, self.cluster.get_storage_rpc_endpoints()
+        )
         with allure.step("The eACL should not be changed"):
             assert get_eacl(user_wallet.wallet_path, cid, self.shell, endpoint) is old_eacl
 
@@ -508,7 +520,7 @@ class TestEACLContainer(ClusterTestBase):
                 set_eacl(
                     wallet_path=not_owner_wallet,
                     cid=cid,
-                    eacl_table_path=create_eacl(cid, eacl, shell=self.shell),
+                    eacl_table_path=create_eacl(cid, eacl),
                     shell=self.shell,
                     endpoint=self.cluster.default_rpc_endpoint,
                 )
@@ -13,7 +13,7 @@ from python_keywords.acl import (
     create_eacl,
     form_bearertoken_file,
     set_eacl,
-    wait_for_cache_expired,
+    wait_for_eacl_propagation,
 )
 from python_keywords.container import create_container, delete_container
 from python_keywords.container_access import (
@@ -153,11 +153,13 @@ class TestEACLFilters(ClusterTestBase):
             set_eacl(
                 user_wallet.wallet_path,
                 cid,
-                create_eacl(cid, eacl_deny, shell=self.shell),
+                create_eacl(cid, eacl_deny),
                 shell=self.shell,
                 endpoint=self.cluster.default_rpc_endpoint,
             )
-            wait_for_cache_expired()
+            wait_for_eacl_propagation(
+                user_wallet.wallet_path, cid, self.shell, self.cluster.get_storage_rpc_endpoints()
+            )
 
         # Filter denies requests where "check_key {match_type} ATTRIBUTE", so when match_type
         # is STRING_EQUAL, then requests with "check_key=OTHER_ATTRIBUTE" will be allowed while
@@ -269,11 +271,13 @@ class TestEACLFilters(ClusterTestBase):
             set_eacl(
                 user_wallet.wallet_path,
                 cid,
-                create_eacl(cid, eacl_deny, shell=self.shell),
+                create_eacl(cid, eacl_deny),
                 shell=self.shell,
                 endpoint=self.cluster.default_rpc_endpoint,
             )
-            wait_for_cache_expired()
+            wait_for_eacl_propagation(
+                user_wallet.wallet_path, cid, self.shell, self.cluster.get_storage_rpc_endpoints()
+            )
 
         allow_objects = (
             objects_with_other_header
@@ -457,11 +461,13 @@ class TestEACLFilters(ClusterTestBase):
             set_eacl(
                 user_wallet.wallet_path,
                 cid,
-                create_eacl(cid, eacl, shell=self.shell),
+                create_eacl(cid, eacl),
                 shell=self.shell,
                 endpoint=self.cluster.default_rpc_endpoint,
             )
-            wait_for_cache_expired()
+            wait_for_eacl_propagation(
+                user_wallet.wallet_path, cid, self.shell, self.cluster.get_storage_rpc_endpoints()
+            )
 
         if match_type == EACLMatchType.STRING_EQUAL:
             allow_objects = objects_with_header
@@ -11,6 +11,7 @@ import allure
 import pytest
 import yaml
 from typing import Optional
+from benchmark_history import get_cluster_topology, set_benchmark_environment
 from binary_version_helper import get_local_binaries_versions, get_remote_binaries_versions
 from cluster import Cluster
 from common import (
@@ -27,7 +28,7 @@ from common import (
 )
 from env_properties import save_env_properties
 from k6 import LoadParams
-from load import get_services_endpoints, prepare_k6_instances
+from load import get_services_endpoints, multi_node_k6_verify, prepare_k6_instances
 from load_params import (
     BACKGROUND_LOAD_MAX_TIME,
     BACKGROUND_OBJ_SIZE,
@@ -37,13 +38,16 @@ from load_params import (
     LOAD_NODE_SSH_USER,
     LOAD_NODES,
 )
+from log_collector import HostLogCollector
 from neofs_testlib.hosting import Hosting
 from neofs_testlib.reporter import AllureHandler, get_reporter
 from neofs_testlib.shell import LocalShell, Shell
 from neofs_testlib.utils.wallet import init_wallet
+from operation_metrics import export_operation_metrics
 from payment_neogo import deposit_gas, transfer_gas
 from python_keywords.neofs_verbs import get_netmap_netinfo
 from python_keywords.node_management import storage_node_healthcheck
+from resource_sampler import RESOURCE_SAMPLE_INTERVAL, ResourceSampler, get_hosting_process_targets
 
 from helpers.wallet import WalletFactory
 
@@ -152,6 +156,7 @@ def check_binary_versions(request, hosting: Hosting, client_shell: Shell):
 
     all_versions = {**local_versions, **remote_versions}
     save_env_properties(request.config, all_versions)
+    set_benchmark_environment(all_versions, get_cluster_topology(hosting))
 
 
 @pytest.fixture(scope="session")
@@ -183,21 +188,44 @@ def artifacts_directory(temp_directory: str) -> None:
             remove_dir(full_path)
 
 
+@pytest.fixture(scope="session")
+def log_collector(temp_directory, hosting: Hosting) -> HostLogCollector:
+    yield HostLogCollector(hosting, os.path.join(temp_directory, "logs_cache"))
+
+
 @pytest.fixture(scope="session", autouse=True)
 @allure.title("Collect full logs")
-def collect_full_tests_logs(temp_directory, hosting: Hosting):
+def collect_full_tests_logs(temp_directory, log_collector: HostLogCollector):
     test_name = "full_logs"
     start_time = datetime.utcnow()
     yield
     end_time = datetime.utcnow()
     logs_dir = os.path.join(temp_directory, "logs")
-    store_logs(hosting, logs_dir, test_name, start_time, end_time)
+    store_logs(log_collector, logs_dir, test_name, start_time, end_time)
     check_logs(logs_dir)
 
 
+@pytest.fixture(scope="session", autouse=True)
+@allure.title("Export operation metrics")
+def operation_metrics_export():
+    yield
+    export_operation_metrics()
+
+
+@pytest.fixture(scope="function", autouse=True)
+@allure.title("Sample resources of services")
+def sample_service_resources(hosting: Hosting):
+    if not RESOURCE_SAMPLE_INTERVAL:
+        yield
+        return
+    with ResourceSampler(get_hosting_process_targets(hosting), RESOURCE_SAMPLE_INTERVAL) as sampler:
+        yield
+    sampler.attach()
+
+
 @pytest.fixture(scope="function", autouse=True)
 @allure.title("Collect logs for failed tests")
-def collect_test_logs(request, temp_directory, hosting: Hosting):
+def collect_test_logs(request, temp_directory, log_collector: HostLogCollector):
     test_name = request.node.nodeid.translate(str.maketrans(":[]/", "____"))
     hash_suffix = hashlib.md5(test_name.encode()).hexdigest()
     file_name = test_name[:200] + "_" + hash_suffix  # limit total length to 255
@@ -210,7 +238,7 @@ def collect_test_logs(request, temp_directory, hosting: Hosting):
     if report["setup"].failed or ("call" in report and report["call"].failed):
         with allure.step(f"Stop collecting logs for {file_name}, logs path: {logs_dir} "):
             end_time = datetime.utcnow()
-            store_logs(hosting, logs_dir, file_name, start_time, end_time)
+            store_logs(log_collector, logs_dir, file_name, start_time, end_time)
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -278,6 +306,7 @@ def background_grpc_load(client_shell: Shell, hosting: Hosting):
         login=LOAD_NODE_SSH_USER,
         pkey=LOAD_NODE_SSH_PRIVATE_KEY_PATH,
         load_params=load_params,
+        ssh_port=2222,
     )
     with allure.step("Run background load"):
         for k6_load_instance in k6_load_instances:
@@ -299,12 +328,16 @@ def background_grpc_load(client_shell: Shell, hosting: Hosting):
             login=LOAD_NODE_SSH_USER,
             pkey=LOAD_NODE_SSH_PRIVATE_KEY_PATH,
             load_params=verify_params,
+            ssh_port=2222,
             prepare=False,
         )
         with allure.step("Run verify background load data"):
-            for k6_verify_instance in k6_verify_instances:
-                k6_verify_instance.start()
-                k6_verify_instance.wait_until_finished(BACKGROUND_LOAD_MAX_TIME)
+            verify_results = multi_node_k6_verify(k6_verify_instances, BACKGROUND_LOAD_MAX_TIME)
+        assert verify_results.passed, (
+            f"Background load verification failed: verified = {verify_results.verified}, "
+            f"invalid = {verify_results.invalid}, skipped = {verify_results.skipped}, "
+            f"failed nodes = {verify_results.failed_nodes}"
+        )
 
 
 @pytest.fixture(scope="function")
@@ -344,23 +377,28 @@ def check_logs(logs_dir: str):
 
 
 def store_logs(
-    hosting: Hosting, logs_dir: str, file_name: str, start_time: datetime, end_time: datetime
+    log_collector: HostLogCollector,
+    logs_dir: str,
+    file_name: str,
+    start_time: datetime,
+    end_time: datetime,
 ) -> None:
     os.makedirs(logs_dir, exist_ok=True)
-    dump_logs(hosting, logs_dir, start_time, end_time)
+    dump_logs(log_collector, logs_dir, start_time, end_time)
     attach_logs(logs_dir, os.path.join(os.getcwd(), ASSETS_DIR, file_name))
 
 
-def dump_logs(hosting: Hosting, logs_dir: str, since: datetime, until: datetime) -> None:
-    # Dump logs to temp directory (because they might be too large to keep in RAM)
+def dump_logs(
+    log_collector: HostLogCollector, logs_dir: str, since: datetime, until: datetime
+) -> None:
+    # Dump logs to temp directory (because they might be too large to keep in RAM). Only logs
+    # written since the previous dump are fetched from hosts, the window is cut from local cache
     os.makedirs(logs_dir, exist_ok=True)
-
-    for host in hosting.hosts:
-        with allure.step(f"Dump logs from host {host.config.address} to {logs_dir}"):
-            try:
-                host.dump_logs(logs_dir, since=since, until=until)
-            except Exception as ex:
-                logger.warning(f"Exception during logs collection: {ex}")
+    with allure.step(f"Dump logs from hosts to {logs_dir}"):
+        try:
+            log_collector.store_window(logs_dir, since, until)
+        except Exception as ex:
+            logger.warning(f"Exception during logs collection: {ex}")
 
 
 def attach_logs(logs_dir: str, test_name: str) -> None:
@@ -1,5 +1,8 @@
+from dataclasses import asdict
+
 import allure
 import pytest
+from benchmark_history import assert_no_benchmark_regressions, record_benchmark_run
 from cluster_test_base import ClusterTestBase
 from common import (
     HTTP_GATE_SERVICE_NAME_REGEX,
@@ -8,6 +11,7 @@ from common import (
 )
 from k6 import LoadParams
 from load import (
+    get_load_metrics,
     get_services_endpoints,
     init_s3_client,
     multi_node_k6_run,
@@ -19,10 +23,17 @@ from load_params import (
     CONTAINER_PLACEMENT_POLICY,
     CONTAINERS_COUNT,
     DELETERS,
+    LOAD_LATENCY_HISTOGRAMS,
     LOAD_NODE_SSH_PRIVATE_KEY_PATH,
     LOAD_NODE_SSH_USER,
     LOAD_NODES,
     LOAD_NODES_COUNT,
+    LOAD_PROFILE_LATENCY_SLO,
+    LOAD_PROFILE_READ_RATIO,
+    LOAD_PROFILE_STAGE_TIME,
+    LOAD_PROFILE_STAGES,
+    LOAD_REGRESSION_CHECK,
+    LOAD_SHARED_DATASET,
     LOAD_TIME,
     LOAD_TYPE,
     OBJ_COUNT,
@@ -32,7 +43,9 @@ from load_params import (
     STORAGE_NODE_COUNT,
     WRITERS,
 )
+from load_profile import find_load_capacity
 from neofs_testlib.hosting import Hosting
+from resource_sampler import ResourceSampler, get_hosting_process_targets
 
 ENDPOINTS_ATTRIBUTES = {
     "http": {"regex": HTTP_GATE_SERVICE_NAME_REGEX, "endpoint_attribute": "endpoint"},
@@ -112,6 +125,7 @@ class TestLoad(ClusterTestBase):
             deleters=deleters,
             load_time=load_time,
             load_type=load_type,
+            latency_histograms=LOAD_LATENCY_HISTOGRAMS,
         )
         load_nodes_list = LOAD_NODES[:load_nodes_count]
         k6_load_instances = prepare_k6_instances(
@@ -120,6 +134,58 @@ class TestLoad(ClusterTestBase):
             pkey=LOAD_NODE_SSH_PRIVATE_KEY_PATH,
             load_params=load_params,
             ssh_port=2222,
+            shared_dataset=LOAD_SHARED_DATASET,
         )
         with allure.step("Run load"):
-            multi_node_k6_run(k6_load_instances)
+            with ResourceSampler(get_hosting_process_targets(hosting)) as sampler:
+                results = multi_node_k6_run(k6_load_instances)
+            sampler.attach()
+        benchmark_name = f"load_{load_type}"
+        _, regressions = record_benchmark_run(
+            benchmark_name, get_load_metrics(results), asdict(load_params)
+        )
+        if LOAD_REGRESSION_CHECK:
+            assert_no_benchmark_regressions({benchmark_name: regressions})
+
+    @pytest.mark.parametrize("obj_size, out_file", list(zip(OBJ_SIZE, OUT_FILE)))
+    @pytest.mark.parametrize("load_type", LOAD_TYPE)
+    @pytest.mark.benchmark
+    def test_load_capacity(self, obj_size, out_file, load_type, hosting: Hosting):
+        allure.dynamic.title(
+            f"Load capacity - load_type = {load_type}, obj_size = {obj_size}, "
+            f"p99 SLO = {LOAD_PROFILE_LATENCY_SLO} ms"
+        )
+        with allure.step("Get endpoints"):
+            endpoints_list = get_services_endpoints(
+                hosting=hosting,
+                service_name_regex=ENDPOINTS_ATTRIBUTES[load_type]["regex"],
+                endpoint_attribute=ENDPOINTS_ATTRIBUTES[load_type]["endpoint_attribute"],
+            )
+        load_params = LoadParams(
+            endpoint=",".join(endpoints_list),
+            obj_size=obj_size,
+            containers_count=CONTAINERS_COUNT[0],
+            out_file=out_file,
+            obj_count=OBJ_COUNT[0],
+            deleters=0,
+            load_type=load_type,
+            latency_histograms=LOAD_LATENCY_HISTOGRAMS,
+        )
+        k6_load_instances = prepare_k6_instances(
+            load_nodes=LOAD_NODES[: LOAD_NODES_COUNT[0]],
+            login=LOAD_NODE_SSH_USER,
+            pkey=LOAD_NODE_SSH_PRIVATE_KEY_PATH,
+            load_params=load_params,
+            ssh_port=2222,
+            shared_dataset=LOAD_SHARED_DATASET,
+        )
+        with ResourceSampler(get_hosting_process_targets(hosting)) as sampler:
+            profile = find_load_capacity(
+                k6_load_instances,
+                stages=LOAD_PROFILE_STAGES,
+                latency_slo=LOAD_PROFILE_LATENCY_SLO,
+                stage_time=LOAD_PROFILE_STAGE_TIME,
+                read_ratio=LOAD_PROFILE_READ_RATIO,
+            )
+        sampler.attach()
+        assert profile.knee, f"No load stage meets p99 SLO {LOAD_PROFILE_LATENCY_SLO} ms"
@@ -1,6 +1,6 @@
 import logging
 import random
-from time import sleep
+from time import sleep, time
 from typing import Optional, Tuple
 
 import allure
@@ -471,13 +471,18 @@ class TestNodeManagement(ClusterTestBase):
         self, wallet: str, cid: str, oid: str, expected_copies: int = 2
     ) -> None:
         nodes = self.cluster.storage_nodes
+        copies = get_simple_object_copies(wallet, cid, oid, self.shell, nodes)
         for _ in range(2):
-            copies = get_simple_object_copies(wallet, cid, oid, self.shell, nodes)
             if copies == expected_copies:
-                break
+                return
             self.tick_epochs_and_wait(1)
-            sleep(parse_time(NEOFS_CONTRACT_CACHE_TIMEOUT))
-        else:
+            # Poll copies until nodes pick up the new state instead of waiting for the whole
+            # cache timeout
+            deadline = time() + parse_time(NEOFS_CONTRACT_CACHE_TIMEOUT)
+            while copies != expected_copies and time() < deadline:
+                sleep(1)
+                copies = get_simple_object_copies(wallet, cid, oid, self.shell, nodes)
+        if copies != expected_copies:
             raise AssertionError(f"There are no {expected_copies} copies during time")
 
     @allure.step("Wait for object to be dropped")
@@ -15,7 +15,7 @@ from python_keywords.acl import (
     form_bearertoken_file,
     set_eacl,
     sign_bearer,
-    wait_for_cache_expired,
+    wait_for_eacl_propagation,
 )
 from wellknown_acl import PUBLIC_ACL
 
@@ -53,11 +53,13 @@ class Test_http_bearer(ClusterTestBase):
             set_eacl(
                 self.wallet,
                 user_container,
-                create_eacl(user_container, eacl, shell=self.shell),
+                create_eacl(user_container, eacl),
                 shell=self.shell,
                 endpoint=self.cluster.default_rpc_endpoint,
             )
-            wait_for_cache_expired()
+            wait_for_eacl_propagation(
+                self.wallet, user_container, self.shell, self.cluster.get_storage_rpc_endpoints()
+            )
 
     @pytest.fixture(scope="class")
     def bearer_token_no_limit_for_others(self, user_container: str) -> str:
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import os
@@ -7,6 +8,7 @@ import pytest
 from cluster import Cluster
 from epoch import get_epoch, tick_epoch
 from file_helper import generate_file, generate_file_with_content, get_file_hash
+from http_gate_client import AsyncHttpGateClient, HttpGateDownload, get_http_gate_client
 from python_keywords.container import create_container
 from python_keywords.http_gate import (
     attr_into_header,
@@ -14,10 +16,12 @@ from python_keywords.http_gate import (
     get_object_by_attr_and_verify_hashes,
     get_via_http_curl,
     get_via_http_gate,
-    get_via_zip_http_gate,
+    get_via_http_gate_segmented,
     try_to_get_object_and_expect_error,
     upload_via_http_gate,
     upload_via_http_gate_curl,
+    verify_ranges_via_http_gate,
+    verify_zip_via_http_gate,
 )
 from python_keywords.neofs_verbs import put_object_to_random_node
 from utility import wait_for_gc_pass_on_storage_nodes
@@ -39,6 +43,7 @@ OBJECT_NOT_FOUND_ERROR = "not found"
 class TestHttpGate(ClusterTestBase):
     PLACEMENT_RULE_1 = "REP 1 IN X CBF 1 SELECT 1 FROM * AS X"
     PLACEMENT_RULE_2 = "REP 2 IN X CBF 2 SELECT 2 FROM * AS X"
+    CONCURRENT_OBJECTS = 10
 
     @pytest.fixture(scope="class", autouse=True)
     @allure.title("[Class/Autouse]: Prepare wallet and deposit")
@@ -455,14 +460,16 @@ class TestHttpGate(ClusterTestBase):
             endpoint=self.cluster.default_http_gate_endpoint,
         )
 
-        dir_path = get_via_zip_http_gate(
-            cid=cid, prefix=common_prefix, endpoint=self.cluster.default_http_gate_endpoint
+        verify_zip_via_http_gate(
+            cid=cid,
+            prefix=common_prefix,
+            endpoint=self.cluster.default_http_gate_endpoint,
+            expected_hashes={
+                f"{common_prefix}/file1": get_file_hash(file_path_simple),
+                f"{common_prefix}/file2": get_file_hash(file_path_large),
+            },
         )
 
-        with allure.step("Verify hashes"):
-            assert get_file_hash(f"{dir_path}/file1") == get_file_hash(file_path_simple)
-            assert get_file_hash(f"{dir_path}/file2") == get_file_hash(file_path_large)
-
     @pytest.mark.long
     @allure.title("Test Put over HTTP/Curl, Get over HTTP/Curl for large object")
     def test_put_http_get_http_large_file(self, complex_object_size):
@@ -548,3 +555,121 @@ class TestHttpGate(ClusterTestBase):
                 endpoint=self.cluster.default_http_gate_endpoint,
                 object_getter=get_via_http_curl,
             )
+
+    @allure.title("Test concurrent Put and Get over HTTP with pooled connections")
+    def test_put_http_get_http_concurrently(self, simple_object_size):
+        """
+        Test that objects can be uploaded and downloaded concurrently over pooled connections.
+
+        Steps:
+        1. Create several simple objects.
+        2. Upload objects concurrently using HTTP.
+        3. Download objects concurrently using HTTP, hashing them while they are received.
+        4. Compare hashes for got and original objects.
+
+        Expected result:
+        Hashes must be the same.
+        """
+        cid = create_container(
+            self.wallet,
+            shell=self.shell,
+            endpoint=self.cluster.default_rpc_endpoint,
+            rule=self.PLACEMENT_RULE_2,
+            basic_acl=PUBLIC_ACL,
+        )
+        file_paths = [generate_file(simple_object_size) for _ in range(self.CONCURRENT_OBJECTS)]
+        client = get_http_gate_client(self.cluster.default_http_gate_endpoint)
+
+        oids = client.upload_many(cid, file_paths)
+        downloads = client.get_many([(cid, oid) for oid in oids])
+
+        with allure.step("Compare hashes for got and original objects"):
+            for file_path, download in zip(file_paths, downloads):
+                assert download.sha256 == get_file_hash(file_path), "Hashes must be the same"
+                assert (
+                    get_file_hash(download.file_path) == download.sha256
+                ), "Hash of the saved file does not match hash calculated while receiving"
+
+    @allure.title("Test concurrent Put and Get over HTTP with asynchronous client")
+    def test_put_http_get_http_concurrently_async(self, simple_object_size):
+        """
+        Test that objects can be uploaded and downloaded concurrently by asynchronous client.
+
+        Steps:
+        1. Create several simple objects.
+        2. Upload objects concurrently using aiohttp with bounded number of requests in flight.
+        3. Download objects concurrently the same way, hashing them while they are received.
+        4. Compare hashes for got and original objects.
+
+        Expected result:
+        Hashes must be the same.
+        """
+        cid = create_container(
+            self.wallet,
+            shell=self.shell,
+            endpoint=self.cluster.default_rpc_endpoint,
+            rule=self.PLACEMENT_RULE_2,
+            basic_acl=PUBLIC_ACL,
+        )
+        file_paths = [generate_file(simple_object_size) for _ in range(self.CONCURRENT_OBJECTS)]
+        concurrency = self.CONCURRENT_OBJECTS // 2
+
+        async def put_and_get() -> list[HttpGateDownload]:
+            async with AsyncHttpGateClient(self.cluster.default_http_gate_endpoint) as client:
+                oids = await client.upload_many(cid, file_paths, concurrency=concurrency)
+                objects = [(cid, oid) for oid in oids]
+                return await client.get_many(objects, concurrency=concurrency)
+
+        with allure.step("Upload and download objects concurrently using asynchronous client"):
+            downloads = asyncio.run(put_and_get())
+
+        with allure.step("Compare hashes for got and original objects"):
+            for file_path, download in zip(file_paths, downloads):
+                assert download.sha256 == get_file_hash(file_path), "Hashes must be the same"
+                assert (
+                    get_file_hash(download.file_path) == download.sha256
+                ), "Hash of the saved file does not match hash calculated while receiving"
+
+    @allure.title("Test ranged and segmented Get over HTTP")
+    def test_put_http_get_http_ranges(self, complex_object_size):
+        """
+        Test that ranges of object got via HTTP match slices of the original file.
+
+        Steps:
+        1. Create large object and upload it using HTTP.
+        2. Get single ranges of the object using Range header.
+        3. Get several ranges of the object with single multi-range request.
+        4. Download the object by ranges requested concurrently.
+        5. Compare got ranges and objects with the original file.
+
+        Expected result:
+        Ranges and objects must match the original file.
+        """
+        cid = create_container(
+            self.wallet,
+            shell=self.shell,
+            endpoint=self.cluster.default_rpc_endpoint,
+            rule=self.PLACEMENT_RULE_2,
+            basic_acl=PUBLIC_ACL,
+        )
+        file_path = generate_file(complex_object_size)
+        size = os.path.getsize(file_path)
+        endpoint = self.cluster.default_http_gate_endpoint
+        oid = upload_via_http_gate(cid=cid, path=file_path, endpoint=endpoint)
+
+        with allure.step("Get single ranges"):
+            for offset, length in ((0, 1), (size // 3, size // 4), (size - 10, 10)):
+                verify_ranges_via_http_gate(cid, oid, endpoint, file_path, [(offset, length)])
+
+        with allure.step("Get several ranges with single request"):
+            # Ranges are requested not in the order of offsets on purpose
+            ranges = [(size // 2, 100), (0, 100), (size - 100, 100)]
+            verify_ranges_via_http_gate(cid, oid, endpoint, file_path, ranges)
+
+        for segments in (1, 3, 8):
+            with allure.step(f"Get object by {segments} segments"):
+                got_file_path = get_via_http_gate_segmented(cid, oid, endpoint, segments)
+                assert get_file_hash(got_file_path) == get_file_hash(file_path)
+
+        with pytest.raises(ValueError):
+            get_via_http_gate_segmented(cid, oid, endpoint, 0)
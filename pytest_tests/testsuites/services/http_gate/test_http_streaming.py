@@ -4,7 +4,7 @@ import allure
 import pytest
 from container import create_container
 from file_helper import generate_file
-from http_gate import get_object_and_verify_hashes, upload_via_http_gate_curl
+from http_gate import get_object_and_verify_hashes, upload_via_http_gate_stream
 from wellknown_acl import PUBLIC_ACL
 
 from steps.cluster_test_base import ClusterTestBase
@@ -34,7 +34,7 @@ class Test_http_streaming(ClusterTestBase):
 
         Steps:
         1. Create big object;
-        2. Put object using curl with pipe (streaming);
+        2. Put object using HTTP gate in chunks (streaming);
         3. Download object using HTTP gate (https://github.com/nspcc-dev/neofs-http-gw#downloading);
         4. Compare hashes between original and downloaded object;
 
@@ -54,9 +54,9 @@ class Test_http_streaming(ClusterTestBase):
             file_path = generate_file(object_size)
 
         with allure.step(
-            "Put objects using curl utility and Get object and verify hashes [ get/$CID/$OID ]"
+            "Put objects by streaming and Get object and verify hashes [ get/$CID/$OID ]"
         ):
-            oid = upload_via_http_gate_curl(
+            oid = upload_via_http_gate_stream(
                 cid=cid, filepath=file_path, endpoint=self.cluster.default_http_gate_endpoint
             )
             get_object_and_verify_hashes(
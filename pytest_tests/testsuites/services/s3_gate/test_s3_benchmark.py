@@ -0,0 +1,60 @@
+import allure
+import pytest
+from benchmark_history import assert_no_benchmark_regressions, record_benchmark_run
+from load_params import (
+    S3_BENCHMARK_CONCURRENCY,
+    S3_BENCHMARK_ENABLED,
+    S3_BENCHMARK_OBJ_COUNT,
+    S3_BENCHMARK_OBJ_SIZE,
+    S3_BENCHMARK_RESULTS_DIR,
+)
+
+from steps.s3_gate_base import TestS3GateBase
+from steps.s3_gate_benchmark import run_s3_operations_benchmark, save_s3_benchmark_results
+
+
+def pytest_generate_tests(metafunc):
+    # Benchmark measures S3 gate with pooled connections, so AWS CLI that spawns a process
+    # per request is not used
+    if "s3_client" in metafunc.fixturenames:
+        metafunc.parametrize("s3_client", ["boto3"], indirect=True)
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not S3_BENCHMARK_ENABLED, reason="S3 gate benchmark is not enabled")
+class TestS3GateBenchmark(TestS3GateBase):
+    @pytest.mark.parametrize("concurrency", S3_BENCHMARK_CONCURRENCY)
+    @pytest.mark.parametrize("object_size", S3_BENCHMARK_OBJ_SIZE)
+    def test_s3_operations_benchmark(self, bucket, object_size: int, concurrency: int):
+        allure.dynamic.title(
+            f"Benchmark S3 operations with {object_size} bytes objects and "
+            f"{concurrency} concurrent requests"
+        )
+        results = run_s3_operations_benchmark(
+            self.s3_client, bucket, object_size, S3_BENCHMARK_OBJ_COUNT, concurrency
+        )
+        save_s3_benchmark_results(
+            results, S3_BENCHMARK_RESULTS_DIR, f"s3_{object_size}b_{concurrency}c"
+        )
+
+        # All operations are recorded to history before the run is checked, so a regression of
+        # one operation does not drop results of the others
+        regressions = {}
+        for result in results:
+            name = f"s3_{result.operation}"
+            _, regressions[name] = record_benchmark_run(
+                name,
+                {
+                    "ops_per_second": result.ops_per_second,
+                    "throughput": result.throughput,
+                    "latency_p50": result.latency_p50,
+                    "latency_p90": result.latency_p90,
+                    "latency_p99": result.latency_p99,
+                    "errors": result.errors,
+                },
+                {"object_size": object_size, "concurrency": concurrency},
+            )
+
+        failed = [result.operation for result in results if result.errors]
+        assert not failed, f"Benchmarked operations had failed requests: {failed}"
+        assert_no_benchmark_regressions(regressions)
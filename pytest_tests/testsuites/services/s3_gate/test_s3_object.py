@@ -6,6 +6,7 @@ from random import choices, sample
 
 import allure
 import pytest
+from boto3.s3.transfer import TransferConfig
 from aws_cli_client import AwsCliClient
 from common import ASSETS_DIR, FREE_STORAGE, WALLET_PASS
 from data_formatters import get_wallet_public_key
@@ -550,6 +551,75 @@ class TestS3GateObject(TestS3GateBase):
             assert contents[0].get("Key") == file_name_2, f"bucket has object key {file_name_2}"
             assert "DeleteMarker" in delete_obj.keys(), f"Expected delete Marker"
 
+    @allure.title("Test S3: paginated list of objects and versions")
+    def test_s3_list_object_paginated(self, bucket, simple_object_size):
+        page_size = 3
+        file_paths = [generate_file(simple_object_size) for _ in range(2 * page_size + 1)]
+        keys = {self.object_key_from_file_path(file_path) for file_path in file_paths}
+
+        set_bucket_versioning(self.s3_client, bucket, s3_gate_bucket.VersioningStatus.ENABLED)
+        with allure.step("Put objects into bucket"):
+            for file_path in file_paths:
+                s3_gate_object.put_object_s3(self.s3_client, bucket, file_path)
+
+        with allure.step(f"List objects by pages of {page_size} keys"):
+            for operation in ("list_objects", "list_objects_v2"):
+                pages = list(
+                    s3_gate_object.paginate_s3(self.s3_client, operation, page_size, Bucket=bucket)
+                )
+                assert len(pages) > 1, f"Expected several pages of {operation}, got {len(pages)}"
+            listed_keys = list(
+                s3_gate_object.iter_objects_s3(self.s3_client, bucket, page_size=page_size)
+            )
+            listed_keys_v2 = list(
+                s3_gate_object.iter_objects_s3_v2(self.s3_client, bucket, page_size=page_size)
+            )
+            assert sorted(listed_keys) == sorted(keys), "Expected all keys in v1 pages"
+            assert sorted(listed_keys_v2) == sorted(keys), "Expected all keys in v2 pages"
+
+        deleted_key = sorted(keys)[0]
+        s3_gate_object.delete_object_s3(self.s3_client, bucket, deleted_key)
+        with allure.step(f"List versions by pages of {page_size} entries"):
+            versions = list(
+                s3_gate_object.iter_objects_versions_s3(self.s3_client, bucket, page_size=page_size)
+            )
+            delete_markers = list(
+                s3_gate_object.iter_objects_delete_markers_s3(
+                    self.s3_client, bucket, page_size=page_size
+                )
+            )
+            version_keys = sorted(version["Key"] for version in versions)
+            marker_keys = [marker["Key"] for marker in delete_markers]
+            assert version_keys == sorted(keys), "Expected a version of every object"
+            assert marker_keys == [deleted_key], f"Expected single delete marker of {deleted_key}"
+
+    @allure.title("Test S3: upload large object with managed transfer")
+    def test_s3_upload_large_object(self, bucket, simple_object_size):
+        part_size = s3_gate_object.S3_MULTIPART_PART_SIZE
+        file_path = generate_file(2 * part_size + simple_object_size)
+        file_name = self.object_key_from_file_path(file_path)
+        # Threshold below the file size makes boto3 upload the file as concurrent parts
+        transfer_config = TransferConfig(
+            multipart_threshold=part_size, multipart_chunksize=part_size
+        )
+
+        with allure.step("Upload object with managed transfer"):
+            s3_gate_object.upload_object_s3(
+                self.s3_client, bucket, file_path, transfer_config=transfer_config
+            )
+
+        with allure.step("Check hash of the object"):
+            got_hash = s3_gate_object.get_object_hash_s3(self.s3_client, bucket, file_name)
+            assert got_hash == get_file_hash(file_path), "Hashes must be the same"
+
+        with allure.step("Check hash of the range on the boundary of parts"):
+            offset, length = part_size - simple_object_size, 2 * simple_object_size
+            got_hash = s3_gate_object.get_object_hash_s3(
+                self.s3_client, bucket, file_name, range=[offset, offset + length - 1]
+            )
+            expected_hash = get_file_hash(file_path, len=length, offset=offset)
+            assert got_hash == expected_hash, "Hashes of the range must be the same"
+
     @allure.title("Test S3: put object")
     def test_s3_put_object(self, bucket, complex_object_size, simple_object_size):
         file_path_1 = generate_file(complex_object_size)
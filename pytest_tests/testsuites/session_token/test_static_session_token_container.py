@@ -10,7 +10,7 @@ from python_keywords.acl import (
     EACLRule,
     create_eacl,
     set_eacl,
-    wait_for_cache_expired,
+    wait_for_eacl_propagation,
 )
 from python_keywords.container import (
     create_container,
@@ -300,12 +300,14 @@ class TestSessionTokenContainer(ClusterTestBase):
             set_eacl(
                 user_wallet.path,
                 cid,
-                create_eacl(cid, eacl_deny, shell=self.shell),
+                create_eacl(cid, eacl_deny),
                 shell=self.shell,
                 endpoint=self.cluster.default_rpc_endpoint,
                 session_token=static_sessions[ContainerVerb.SETEACL],
             )
-            wait_for_cache_expired()
+            wait_for_eacl_propagation(
+                user_wallet.path, cid, self.shell, self.cluster.get_storage_rpc_endpoints()
+            )
 
         assert not can_put_object(stranger_wallet.path, cid, file_path, self.shell, self.cluster)
 
@@ -346,7 +348,7 @@ class TestSessionTokenContainer(ClusterTestBase):
                 set_eacl(
                     user_wallet.path,
                     cid,
-                    create_eacl(cid, new_eacl, shell=self.shell),
+                    create_eacl(cid, new_eacl),
                     shell=self.shell,
                     endpoint=self.cluster.default_rpc_endpoint,
                     session_token=stranger_token[ContainerVerb.SETEACL],
@@ -358,7 +360,7 @@ class TestSessionTokenContainer(ClusterTestBase):
                     set_eacl(
                         scammer_wallet.path,
                         cid,
-                        create_eacl(cid, new_eacl, shell=self.shell),
+                        create_eacl(cid, new_eacl),
                         shell=self.shell,
                         endpoint=self.cluster.default_rpc_endpoint,
                         session_token=user_token[ContainerVerb.SETEACL],
@@ -368,7 +370,7 @@ class TestSessionTokenContainer(ClusterTestBase):
                     set_eacl(
                         scammer_wallet.path,
                         cid,
-                        create_eacl(cid, new_eacl, shell=self.shell),
+                        create_eacl(cid, new_eacl),
                         shell=self.shell,
                         endpoint=self.cluster.default_rpc_endpoint,
                         session_token=stranger_token[ContainerVerb.SETEACL],
@@ -1,19 +1,25 @@
 import base64
+import copy
+import hashlib
 import json
 import logging
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-from time import sleep
-from typing import Any, Dict, List, Optional, Union
+from time import sleep, time
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import allure
 import base58
+import yaml
 from common import ASSETS_DIR, TEST_FILES_DIR, NEOFS_CLI_EXEC, WALLET_CONFIG
 from data_formatters import get_wallet_public_key
+from eacl_encoding import encode_bearer_token, sign_bearer_token
 from neofs_testlib.cli import NeofsCli
 from neofs_testlib.shell import Shell
+from test_control import wait_for_success
 
 from grpc_responses import EACL_TABLE_IS_NOT_SET, EACL_NOT_FOUND
 
@@ -21,6 +27,13 @@ logger = logging.getLogger("NeoLogger")
 EACL_LIFETIME = 100500
 NEOFS_CONTRACT_CACHE_TIMEOUT = 30
 
+# Unsigned eACL tables built from rule sets, keyed by hash of container ID and rules
+_EACL_TABLES_CACHE: Dict[str, Dict[str, Any]] = {}
+# eACL tables written by create_eacl, keyed by table file path
+_EACL_TABLE_FILES: Dict[str, Dict[str, Any]] = {}
+# eACL tables that set_eacl has awaited to be set, keyed by container ID
+_CONTAINER_EACL_TABLES: Dict[str, Dict[str, Any]] = {}
+
 
 class EACLOperation(Enum):
     PUT = "put"
@@ -69,6 +82,14 @@ class EACLFilter:
             "value": self.value,
         }
 
+    def to_record(self) -> Dict[str, Any]:
+        return {
+            "headerType": self.header_type.name,
+            "matchType": self.match_type.name,
+            "key": self.key,
+            "value": self.value,
+        }
+
 
 @dataclass
 class EACLFilters:
@@ -116,6 +137,26 @@ class EACLRule:
         )
         return f'{self.access.value} {self.operation.value} {self.filters or ""} {role}'
 
+    def to_record(self) -> Dict[str, Any]:
+        """
+        Converts the rule into eACL record in the JSON layout of neofs-cli.
+        """
+        if isinstance(self.role, EACLRole):
+            target = {"role": self.role.value.upper()}
+        elif isinstance(self.role, EACLPubKey):
+            target = {"keys": self.role.keys}
+        else:
+            public_key = get_wallet_public_key(self.role, "", format="base64")
+            target = {"keys": [public_key]}
+
+        filters = self.filters.filters if self.filters else None
+        return {
+            "operation": self.operation.value.upper(),
+            "action": self.access.value.upper(),
+            "filters": [record_filter.to_record() for record_filter in filters or []],
+            "targets": [target],
+        }
+
 
 @allure.title("Get extended ACL")
 def get_eacl(wallet_path: str, cid: str, shell: Shell, endpoint: str) -> Optional[str]:
@@ -140,6 +181,9 @@ def set_eacl(
     endpoint: str,
     session_token: Optional[str] = None,
 ) -> None:
+    # The table is unknown until the change is confirmed, so failed or rejected requests make
+    # the table be fetched from the network
+    _CONTAINER_EACL_TABLES.pop(cid, None)
     cli = NeofsCli(shell, NEOFS_CLI_EXEC, WALLET_CONFIG)
     cli.container.set_eacl(
         wallet=wallet_path,
@@ -149,6 +193,21 @@ def set_eacl(
         await_mode=True,
         session=session_token,
     )
+    # The table is confirmed to be set once the command has awaited it, remember it to form
+    # bearer tokens and to check eACL propagation without fetching it back from the network
+    table = _EACL_TABLE_FILES.get(eacl_table_path) or _load_eacl_table(eacl_table_path)
+    if table is not None:
+        _CONTAINER_EACL_TABLES[cid] = table
+
+
+def _load_eacl_table(eacl_table_path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(eacl_table_path, "r", encoding="utf-8") as file:
+            table = json.load(file)
+    except (OSError, ValueError):
+        # Binary tables are not parsed
+        return None
+    return table if isinstance(table, dict) and "records" in table else None
 
 
 def _encode_cid_for_eacl(cid: str) -> str:
@@ -156,17 +215,52 @@ def _encode_cid_for_eacl(cid: str) -> str:
     return base64.b64encode(cid_base58).decode("utf-8")
 
 
-def create_eacl(cid: str, rules_list: List[EACLRule], shell: Shell) -> str:
+def build_eacl_table(cid: str, rules_list: Union[EACLRule, List[EACLRule]]) -> Dict[str, Any]:
+    """
+    Builds unsigned eACL table from the rules in the JSON layout of neofs-cli.
+
+    Tables are cached by hash of the container ID and the rules, so repeated rule sets are
+    converted only once.
+
+    Args:
+        cid: ID of the container the table is built for, might be empty
+        rules_list: eACL rule or list of eACL rules
+
+    Returns:
+        eACL table as a dictionary
+    """
+    rules = rules_list if isinstance(rules_list, list) else [rules_list]
+    rules_hash = hashlib.sha256(repr((cid, rules)).encode("utf-8")).hexdigest()
+    if rules_hash not in _EACL_TABLES_CACHE:
+        _EACL_TABLES_CACHE[rules_hash] = {
+            "containerID": {"value": _encode_cid_for_eacl(cid)} if cid else None,
+            "records": [rule.to_record() for rule in rules],
+        }
+    return copy.deepcopy(_EACL_TABLES_CACHE[rules_hash])
+
+
+def create_eacl(cid: str, rules_list: Union[EACLRule, List[EACLRule]]) -> str:
+    """
+    Writes eACL table with given rules for the container to a file.
+
+    The table is built locally, so neither CLI nor shell is needed.
+
+    Args:
+        cid: ID of the container, the table is not bound to a container if it is empty
+        rules_list: eACL rule or list of eACL rules
+
+    Returns:
+        Path to the file with eACL table
+    """
     table_file_path = os.path.join(
         os.getcwd(), ASSETS_DIR, TEST_FILES_DIR, f"eacl_table_{str(uuid.uuid4())}.json"
     )
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, WALLET_CONFIG)
-    cli.acl.extended_create(cid=cid, out=table_file_path, rule=rules_list)
-
-    with open(table_file_path, "r") as file:
-        table_data = file.read()
-        logger.info(f"Generated eACL:\n{table_data}")
+    table = build_eacl_table(cid, rules_list)
+    with open(table_file_path, "w", encoding="utf-8") as file:
+        json.dump(table, file, ensure_ascii=False, indent=4)
+    _EACL_TABLE_FILES[table_file_path] = table
 
+    logger.info(f"Generated eACL:\n{json.dumps(table, indent=4)}")
     return table_file_path
 
 
@@ -177,64 +271,65 @@ def form_bearertoken_file(
     shell: Shell,
     endpoint: str,
     sign: Optional[bool] = True,
+    binary: Optional[bool] = False,
+    wallet_password: Optional[str] = None,
 ) -> str:
     """
-    This function fetches eACL for given <cid> on behalf of <wif>,
+    This function takes eACL of given <cid> on behalf of <wif>,
     then extends it with filters taken from <eacl_rules>, signs
-    with bearer token and writes to file
+    with bearer token and writes to file.
+
+    eACL of the container is fetched from the network unless set_eacl has
+    confirmed setting a table from create_eacl. The token is signed locally
+    with the wallet key, the same way `neofs-cli util sign bearer-token` does;
+    the wallet is opened with <wallet_password> or, if it is not given, with
+    the password from the wallet config of neofs-cli.
+    If <binary> is set, signed token is written in binary form instead of JSON.
     """
-    enc_cid = _encode_cid_for_eacl(cid) if cid else None
     file_path = os.path.join(os.getcwd(), ASSETS_DIR, TEST_FILES_DIR, str(uuid.uuid4()))
 
-    eacl = get_eacl(wif, cid, shell, endpoint)
-    json_eacl = dict()
-    if eacl:
-        eacl = eacl.replace("eACL: ", "").split("Signature")[0]
-        json_eacl = json.loads(eacl)
+    if cid in _CONTAINER_EACL_TABLES:
+        json_eacl = _CONTAINER_EACL_TABLES[cid]
+    else:
+        eacl = get_eacl(wif, cid, shell, endpoint) if cid else None
+        json_eacl = dict()
+        if eacl:
+            eacl = eacl.replace("eACL: ", "").split("Signature")[0]
+            json_eacl = json.loads(eacl)
     logger.info(json_eacl)
+
+    assert eacl_rule_list, "Got empty eacl_records list"
+    eacl_table = build_eacl_table(cid, eacl_rule_list)
+    # Add records from current eACL
+    eacl_table["records"].extend(copy.deepcopy(json_eacl.get("records", [])))
+
     eacl_result = {
         "body": {
-            "eaclTable": {"containerID": {"value": enc_cid} if cid else enc_cid, "records": []},
+            "eaclTable": eacl_table,
             "lifetime": {"exp": EACL_LIFETIME, "nbf": "1", "iat": "0"},
         }
     }
-
-    assert eacl_rules, "Got empty eacl_records list"
-    for rule in eacl_rule_list:
-        op_data = {
-            "operation": rule.operation.value.upper(),
-            "action": rule.access.value.upper(),
-            "filters": rule.filters or [],
-            "targets": [],
-        }
-
-        if isinstance(rule.role, EACLRole):
-            op_data["targets"] = [{"role": rule.role.value.upper()}]
-        elif isinstance(rule.role, EACLPubKey):
-            op_data["targets"] = [{"keys": rule.role.keys}]
-
-        eacl_result["body"]["eaclTable"]["records"].append(op_data)
-
-    # Add records from current eACL
-    if "records" in json_eacl.keys():
-        for record in json_eacl["records"]:
-            eacl_result["body"]["eaclTable"]["records"].append(record)
-
-    with open(file_path, "w", encoding="utf-8") as eacl_file:
-        json.dump(eacl_result, eacl_file, ensure_ascii=False, indent=4)
-
     logger.info(f"Got these extended ACL records: {eacl_result}")
     if sign:
-        sign_bearer(
-            shell=shell,
-            wallet_path=wif,
-            eacl_rules_file_from=file_path,
-            eacl_rules_file_to=file_path,
-            json=True,
-        )
+        if wallet_password is None:
+            wallet_password = _get_wallet_config_password()
+        sign_bearer_token(eacl_result, wif, wallet_password)
+
+    if binary:
+        with open(file_path, "wb") as eacl_file:
+            eacl_file.write(encode_bearer_token(eacl_result))
+    else:
+        with open(file_path, "w", encoding="utf-8") as eacl_file:
+            json.dump(eacl_result, eacl_file, ensure_ascii=False, indent=4)
     return file_path
 
 
+def _get_wallet_config_password(wallet_config: str = WALLET_CONFIG) -> str:
+    with open(wallet_config, "r", encoding="utf-8") as file:
+        config = yaml.safe_load(file) or {}
+    return config.get("password") or ""
+
+
 def eacl_rules(access: str, verbs: list, user: str) -> list[str]:
     """
     This function creates a list of eACL rules.
@@ -273,6 +368,126 @@ def wait_for_cache_expired():
     return
 
 
+@allure.step("Wait for eACL propagation to storage nodes")
+def wait_for_eacl_propagation(
+    wallet_path: str,
+    cid: str,
+    shell: Shell,
+    endpoints: List[str],
+    timeout: int = 2 * NEOFS_CONTRACT_CACHE_TIMEOUT,
+    interval: float = 0.5,
+    probe: Optional[Callable[[], Any]] = None,
+) -> float:
+    """
+    Waits until every storage node serves the eACL table that was set for the container.
+
+    Nodes are polled concurrently and the records they return are compared by digest with
+    the table passed to the last confirmed set_eacl call. If this table is unknown (e.g. it
+    was set from a binary file or the request failed), waits until all nodes serve the same
+    table in two consecutive polls instead.
+
+    Args:
+        wallet_path: path to the wallet used to request eACL from the nodes
+        cid: ID of the container
+        shell: executor for cli command
+        endpoints: RPC endpoints of the storage nodes to poll
+        timeout: maximum time to wait for propagation, in seconds
+        interval: delay between polls, in seconds
+        probe: optional check of an operation affected by the new table; it should raise
+            until the expected result is observed
+
+    Returns:
+        Observed propagation time in seconds.
+    """
+    start = time()
+    expected_table = _CONTAINER_EACL_TABLES.get(cid)
+    with ThreadPoolExecutor(max_workers=max(len(endpoints), 1)) as executor:
+
+        def get_digests(pending: List[str]) -> List[Optional[str]]:
+            return list(
+                executor.map(
+                    lambda endpoint: _get_eacl_records_digest(wallet_path, cid, shell, endpoint),
+                    pending,
+                )
+            )
+
+        if expected_table is None:
+            logger.info(f"eACL table of container {cid} is unknown, waiting for nodes to agree")
+            previous_digests = None
+            while True:
+                digests = get_digests(endpoints)
+                if len(set(digests)) <= 1 and digests == previous_digests:
+                    break
+                if time() - start > timeout:
+                    raise AssertionError(
+                        f"Storage nodes have not agreed on eACL of container {cid} "
+                        f"in {timeout} seconds"
+                    )
+                previous_digests = digests
+                sleep(interval)
+        else:
+            expected_digest = _eacl_records_digest(expected_table)
+            pending = list(endpoints)
+            while pending:
+                pending = [
+                    endpoint
+                    for endpoint, digest in zip(pending, get_digests(pending))
+                    if digest != expected_digest
+                ]
+                if not pending:
+                    break
+                if time() - start > timeout:
+                    raise AssertionError(
+                        f"eACL of container {cid} has not been propagated to "
+                        f"{', '.join(pending)} in {timeout} seconds"
+                    )
+                sleep(interval)
+
+    if probe is not None:
+        wait_for_success(max_wait_time=max(int(start + timeout - time()), 0), interval=1)(probe)()
+
+    propagation_time = time() - start
+    logger.info(f"eACL of container {cid} has been propagated in {propagation_time:.2f} seconds")
+    allure.attach(
+        f"{propagation_time:.3f}", "eACL propagation time, s", allure.attachment_type.TEXT
+    )
+    return propagation_time
+
+
+def _get_eacl_records_digest(
+    wallet_path: str, cid: str, shell: Shell, endpoint: str
+) -> Optional[str]:
+    cli = NeofsCli(shell, NEOFS_CLI_EXEC, WALLET_CONFIG)
+    try:
+        result = cli.container.get_eacl(wallet=wallet_path, rpc_endpoint=endpoint, cid=cid)
+    except RuntimeError as exc:
+        logger.info(f"Got exception while getting eacl from {endpoint}: {exc}")
+        return None
+    try:
+        table = json.loads(result.stdout.replace("eACL: ", "").split("Signature")[0])
+    except ValueError:
+        return None
+    return _eacl_records_digest(table)
+
+
+def _eacl_records_digest(table: Dict[str, Any]) -> str:
+    # neofs-cli prints empty and unspecified fields that locally built tables omit
+    def normalize(value: Any) -> Any:
+        if isinstance(value, dict):
+            value = {key: normalize(item) for key, item in value.items()}
+            return {
+                key: item
+                for key, item in value.items()
+                if item not in (None, "", [], {}) and not str(item).endswith("_UNSPECIFIED")
+            }
+        if isinstance(value, list):
+            return [normalize(item) for item in value]
+        return value
+
+    records = normalize(table.get("records") or [])
+    return hashlib.sha256(json.dumps(records, sort_keys=True).encode("utf-8")).hexdigest()
+
+
 @allure.step("Return bearer token in base64 to caller")
 def bearer_token_base64_from_file(
     bearer_path: str,
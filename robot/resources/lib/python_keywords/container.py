@@ -14,6 +14,7 @@ import json_transformers
 from common import NEOFS_CLI_EXEC, WALLET_CONFIG
 from neofs_testlib.cli import NeofsCli
 from neofs_testlib.shell import Shell
+from operation_metrics import timed_operation
 
 logger = logging.getLogger("NeoLogger")
 
@@ -22,6 +23,7 @@ SINGLE_PLACEMENT_RULE = "REP 1 IN X CBF 1 SELECT 4 FROM * AS X"
 REP_2_FOR_3_NODES_PLACEMENT_RULE = "REP 2 IN X CBF 1 SELECT 3 FROM * AS X"
 
 
+@timed_operation("container.create")
 @allure.step("Create Container")
 def create_container(
     wallet: str,
@@ -114,6 +116,7 @@ def wait_for_container_deletion(
     raise AssertionError(f"Expected container deleted during {attempts * sleep_interval} sec.")
 
 
+@timed_operation("container.list")
 @allure.step("List Containers")
 def list_containers(wallet: str, shell: Shell, endpoint: str) -> list[str]:
     """
@@ -132,6 +135,7 @@ def list_containers(wallet: str, shell: Shell, endpoint: str) -> list[str]:
     return result.stdout.split()
 
 
+@timed_operation("container.get")
 @allure.step("Get Container")
 def get_container(
     wallet: str,
@@ -168,6 +172,7 @@ def get_container(
     return container_info
 
 
+@timed_operation("container.delete")
 @allure.step("Delete Container")
 # TODO: make the error message about a non-found container more user-friendly
 # https://github.com/nspcc-dev/neofs-contract/issues/121
@@ -0,0 +1,272 @@
+"""
+    Encoders for eACL tables and bearer tokens.
+
+    Tables and tokens are kept as dictionaries in the same JSON layout that neofs-cli
+    produces and accepts (protobuf JSON mapping), so records fetched from a node can be
+    mixed with records built locally. This module turns such dictionaries into the
+    binary protobuf form and signs bearer tokens with a wallet key, which lets tests
+    build tokens without spawning neofs-cli.
+"""
+
+import base64
+import hashlib
+import json
+from functools import lru_cache
+from typing import Iterator
+
+import base58
+from neo3.core import cryptography
+from neo3.wallet import account, scrypt_parameters
+
+OPERATIONS = {
+    "GET": 1,
+    "HEAD": 2,
+    "PUT": 3,
+    "DELETE": 4,
+    "SEARCH": 5,
+    "GETRANGE": 6,
+    "GETRANGEHASH": 7,
+}
+ACTIONS = {"ALLOW": 1, "DENY": 2}
+ROLES = {"USER": 1, "SYSTEM": 2, "OTHERS": 3}
+HEADER_TYPES = {"REQUEST": 1, "OBJECT": 2, "SERVICE": 3}
+MATCH_TYPES = {"STRING_EQUAL": 1, "STRING_NOT_EQUAL": 2}
+
+# Prefix of uncompressed EC point that NeoFS expects in ECDSA_SHA512 signatures
+_EC_POINT_UNCOMPRESSED = b"\x04"
+
+
+def encode_eacl_table(table: dict) -> bytes:
+    """Serializes eACL table into binary protobuf form.
+
+    Args:
+        table: eACL table in neofs-cli JSON layout.
+
+    Returns:
+        Protobuf encoded eACL table.
+    """
+    version = table.get("version") or {}
+    return b"".join(
+        [
+            _message(1, _uint(1, version.get("major")) + _uint(2, version.get("minor"))),
+            _message(2, _bytes(1, _b64decode((table.get("containerID") or {}).get("value")))),
+            *[_message(3, _encode_eacl_record(record)) for record in table.get("records") or []],
+        ]
+    )
+
+
+def encode_bearer_token_body(body: dict) -> bytes:
+    """Serializes bearer token body into binary protobuf form.
+
+    This is exactly the data that is covered by bearer token signature.
+
+    Args:
+        body: bearer token body in neofs-cli JSON layout.
+
+    Returns:
+        Protobuf encoded bearer token body.
+    """
+    lifetime = body.get("lifetime") or {}
+    return b"".join(
+        [
+            _message(1, encode_eacl_table(body.get("eaclTable") or {})),
+            _message(2, _bytes(1, _b64decode((body.get("ownerID") or {}).get("value")))),
+            _message(
+                3,
+                _uint(1, lifetime.get("exp"))
+                + _uint(2, lifetime.get("nbf"))
+                + _uint(3, lifetime.get("iat")),
+            ),
+            _message(4, _bytes(1, _b64decode((body.get("issuer") or {}).get("value")))),
+        ]
+    )
+
+
+def encode_bearer_token(token: dict) -> bytes:
+    """Serializes bearer token into binary protobuf form.
+
+    Args:
+        token: bearer token in neofs-cli JSON layout.
+
+    Returns:
+        Protobuf encoded bearer token, the same that `neofs-cli util sign bearer-token`
+        writes without `--json` flag.
+    """
+    signature = token.get("signature") or {}
+    return _message(1, encode_bearer_token_body(token.get("body") or {})) + _message(
+        2,
+        _bytes(1, _b64decode(signature.get("key")))
+        + _bytes(2, _b64decode(signature.get("signature"))),
+    )
+
+
+def sign_bearer_token(token: dict, wallet_path: str, wallet_password: str) -> dict:
+    """Signs bearer token with the key of the first account in the wallet.
+
+    The issuer of the token is set to the wallet owner, as neofs-cli does.
+
+    Args:
+        token: bearer token in neofs-cli JSON layout, it is modified in place.
+        wallet_path: path to the wallet which key should be used for signing.
+        wallet_password: password of the wallet.
+
+    Returns:
+        Signed bearer token in neofs-cli JSON layout.
+    """
+    private_key, public_key, owner_id = get_wallet_key(wallet_path, wallet_password)
+    body = token.setdefault("body", {})
+    body["issuer"] = {"value": base64.b64encode(owner_id).decode("utf-8")}
+
+    signature = cryptography.sign(
+        encode_bearer_token_body(body), private_key, hash_func=hashlib.sha512
+    )
+    token["signature"] = {
+        "key": base64.b64encode(public_key).decode("utf-8"),
+        "signature": base64.b64encode(_EC_POINT_UNCOMPRESSED + signature).decode("utf-8"),
+    }
+    return token
+
+
+def split_bearer_token(data: bytes) -> tuple[bytes, bytes, bytes]:
+    """Splits binary bearer token into its signed body and signature.
+
+    Args:
+        data: protobuf encoded bearer token, e.g. written by `neofs-cli util sign bearer-token`.
+
+    Returns:
+        Tuple of protobuf encoded body, public key and signature of the token.
+    """
+    fields = dict(_iter_fields(data))
+    signature = dict(_iter_fields(fields.get(2, b"")))
+    return fields.get(1, b""), signature.get(1, b""), signature.get(2, b"")
+
+
+def verify_bearer_token_signature(body: bytes, public_key: bytes, signature: bytes) -> bool:
+    """Checks that bearer token body is signed with the key.
+
+    Args:
+        body: protobuf encoded bearer token body.
+        public_key: compressed public key of the signer.
+        signature: ECDSA_SHA512 signature of the body.
+
+    Returns:
+        True if the signature is valid.
+    """
+    if not signature.startswith(_EC_POINT_UNCOMPRESSED):
+        return False
+    return cryptography.verify_signature(
+        body, signature[len(_EC_POINT_UNCOMPRESSED) :], public_key, hash_func=hashlib.sha512
+    )
+
+
+@lru_cache(maxsize=None)
+def get_wallet_key(wallet_path: str, wallet_password: str) -> tuple[bytes, bytes, bytes]:
+    """Decrypts the key of the first account in the wallet.
+
+    Decryption involves scrypt and takes noticeable time, so the result is cached for
+    every wallet.
+
+    Args:
+        wallet_path: path to the wallet file.
+        wallet_password: password of the wallet.
+
+    Returns:
+        Tuple of private key, compressed public key and binary owner ID of the account.
+    """
+    with open(wallet_path, "r") as file:
+        wallet_content = json.load(file)
+    wallet_account = wallet_content["accounts"][0]
+
+    private_key = account.Account.private_key_from_nep2(
+        wallet_account["key"],
+        wallet_password,
+        _scrypt_parameters=scrypt_parameters.ScryptParameters.from_json(wallet_content["scrypt"]),
+    )
+    public_key = cryptography.KeyPair(private_key).public_key.encode_point(True)
+    # NeoFS owner ID has the same binary form as base58-decoded Neo N3 address
+    owner_id = base58.b58decode(wallet_account["address"])
+    return private_key, public_key, owner_id
+
+
+def _encode_eacl_record(record: dict) -> bytes:
+    return b"".join(
+        [
+            _uint(1, OPERATIONS.get(record.get("operation"))),
+            _uint(2, ACTIONS.get(record.get("action"))),
+            *[
+                _message(
+                    3,
+                    _uint(1, HEADER_TYPES.get(record_filter.get("headerType")))
+                    + _uint(2, MATCH_TYPES.get(record_filter.get("matchType")))
+                    + _bytes(3, (record_filter.get("key") or "").encode("utf-8"))
+                    + _bytes(4, (record_filter.get("value") or "").encode("utf-8")),
+                )
+                for record_filter in record.get("filters") or []
+            ],
+            *[
+                _message(
+                    4,
+                    _uint(1, ROLES.get(target.get("role")))
+                    + b"".join(_bytes(2, _b64decode(key)) for key in target.get("keys") or []),
+                )
+                for target in record.get("targets") or []
+            ],
+        ]
+    )
+
+
+def _b64decode(value: str | None) -> bytes:
+    return base64.b64decode(value) if value else b""
+
+
+def _varint(value: int) -> bytes:
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _read_varint(data: bytes, position: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, position
+
+
+def _iter_fields(data: bytes) -> Iterator[tuple[int, bytes | int]]:
+    position = 0
+    while position < len(data):
+        key, position = _read_varint(data, position)
+        field_number, wire_type = key >> 3, key & 0x07
+        if wire_type == 0:
+            value, position = _read_varint(data, position)
+        elif wire_type == 2:
+            length, position = _read_varint(data, position)
+            value, position = data[position : position + length], position + length
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type} of field {field_number}")
+        yield field_number, value
+
+
+# Fields with default values are omitted, as NeoFS stable marshalling does. Signatures are
+# calculated over re-marshalled data, so the encoding must match it byte by byte.
+def _uint(field_number: int, value: int | str | None) -> bytes:
+    if not value or not int(value):
+        return b""
+    return _varint(field_number << 3) + _varint(int(value))
+
+
+def _bytes(field_number: int, value: bytes) -> bytes:
+    if not value:
+        return b""
+    return _varint(field_number << 3 | 2) + _varint(len(value)) + value
+
+
+def _message(field_number: int, encoded_message: bytes) -> bytes:
+    return _bytes(field_number, encoded_message)
@@ -17,7 +17,9 @@ from cli_helpers import _cmd_run
 from cluster import StorageNode
 from common import SIMPLE_OBJECT_SIZE
 from file_helper import get_file_hash
+from http_gate_client import get_http_gate_client
 from neofs_testlib.shell import Shell
+from operation_metrics import timed_operation
 from python_keywords.neofs_verbs import get_object
 from python_keywords.storage_policy import get_nodes_without_object
 
@@ -26,6 +28,7 @@ logger = logging.getLogger("NeoLogger")
 ASSETS_DIR = os.getenv("ASSETS_DIR", "TemporaryDir/")
 
 
+@timed_operation("http.get", payload_result=True)
 @allure.step("Get via HTTP Gate")
 def get_via_http_gate(
     cid: str,
@@ -53,7 +56,14 @@ def get_via_http_gate(
     else:
         request = f"{endpoint}{request_path}{download_attribute}"
 
-    resp = requests.get(request, stream=True)
+    client = get_http_gate_client(endpoint)
+    if not return_response:
+        # Client raises on error responses, so the object is always got with 200 status
+        downloaded = client.get(cid, oid, request_path=request_path, download=download)
+        _attach_allure_step(request, 200)
+        return downloaded.file_path
+
+    resp = client.session.get(request, stream=True)
 
     if not resp.ok:
         raise Exception(
@@ -69,8 +79,6 @@ def get_via_http_gate(
     file_path = os.path.join(os.getcwd(), ASSETS_DIR, f"{cid}_{oid}")
     with open(file_path, "wb") as file:
         shutil.copyfileobj(resp.raw, file)
-    if not return_response:
-        return file_path
     return resp
 
 
@@ -83,7 +91,7 @@ def get_via_zip_http_gate(cid: str, prefix: str, endpoint: str):
     endpoint: http gate endpoint
     """
     request = f"{endpoint}/zip/{cid}/{prefix}"
-    resp = requests.get(request, stream=True)
+    resp = get_http_gate_client(endpoint).session.get(request, stream=True)
 
     if not resp.ok:
         raise Exception(
@@ -106,6 +114,82 @@ def get_via_zip_http_gate(cid: str, prefix: str, endpoint: str):
     return os.path.join(os.getcwd(), ASSETS_DIR, prefix)
 
 
+@allure.step("Get via HTTP Gate by {segments} segments")
+def get_via_http_gate_segmented(cid: str, oid: str, endpoint: str, segments: int = 4) -> str:
+    """
+    This function gets given object from HTTP gate by ranges requested concurrently
+    cid:      container id to get object from
+    oid:      object ID
+    endpoint: http gate endpoint
+    segments: (optional) number of ranges the object is split into
+    """
+    download = get_http_gate_client(endpoint).get_segmented(cid, oid, segments)
+    throughput = download.throughput / 1024**2
+    logger.info(
+        f"Downloaded {download.size} bytes by {segments} segments in "
+        f"{download.duration:.2f}s ({throughput:.2f} MiB/s)"
+    )
+    allure.attach(
+        f"size: {download.size} bytes\nsegments: {segments}\nduration: {download.duration:.3f}s\n"
+        f"throughput: {throughput:.2f} MiB/s\nsha256: {download.sha256}",
+        "Download throughput",
+        allure.attachment_type.TEXT,
+    )
+    return download.file_path
+
+
+@allure.step("Verify ranges via HTTP Gate")
+def verify_ranges_via_http_gate(
+    cid: str, oid: str, endpoint: str, file_path: str, ranges: list[tuple[int, int]]
+) -> None:
+    """
+    This function gets ranges of given object from HTTP gate with single multi-range request,
+    or with request per range if the gate does not support multi-range requests, and compares
+    them with the same slices of the local file
+    cid:       container id to get object from
+    oid:       object ID
+    endpoint:  http gate endpoint
+    file_path: path to the original file of the object
+    ranges:    pairs of offset and length
+    """
+    got_ranges = get_http_gate_client(endpoint).get_ranges(cid, oid, ranges)
+    _attach_allure_step(f"{endpoint}/get/{cid}/{oid} Range: {ranges}", 206)
+    with open(file_path, "rb") as file:
+        for (offset, length), got_range in zip(ranges, got_ranges):
+            file.seek(offset)
+            assert got_range == file.read(length), f"Range {offset}:{length} does not match file"
+
+
+@allure.step("Verify Zip via HTTP Gate")
+def verify_zip_via_http_gate(
+    cid: str, prefix: str, endpoint: str, expected_hashes: dict[str, str]
+) -> None:
+    """
+    This function downloads objects with common prefix from HTTP gate as ZIP archive and
+    checks hashes of the files while the archive is being received, without saving it
+    cid:             container id to get objects from
+    prefix:          common prefix
+    endpoint:        http gate endpoint
+    expected_hashes: expected SHA-256 hashes of the files by their names in the archive
+    """
+    got_hashes = {}
+    for entry in get_http_gate_client(endpoint).get_zip_entries(cid, prefix):
+        assert entry.name not in got_hashes, f"File {entry.name} is duplicated in the archive"
+        got_hashes[entry.name] = entry.sha256
+    _attach_allure_step(f"{endpoint}/zip/{cid}/{prefix}", f"{len(got_hashes)} files")
+
+    missing = expected_hashes.keys() - got_hashes.keys()
+    unexpected = got_hashes.keys() - expected_hashes.keys()
+    mismatched = [
+        name
+        for name in expected_hashes.keys() & got_hashes.keys()
+        if expected_hashes[name] != got_hashes[name]
+    ]
+    assert not missing, f"Files are missing in the archive: {sorted(missing)}"
+    assert not unexpected, f"Unexpected files in the archive: {sorted(unexpected)}"
+    assert not mismatched, f"Hashes of the files do not match: {sorted(mismatched)}"
+
+
 @allure.step("Get via HTTP Gate by attribute")
 def get_via_http_gate_by_attribute(
     cid: str, attribute: dict, endpoint: str, request_path: Optional[str] = None
@@ -125,25 +209,14 @@ def get_via_http_gate_by_attribute(
     else:
         request = f"{endpoint}{request_path}"
 
-    resp = requests.get(request, stream=True)
-
-    if not resp.ok:
-        raise Exception(
-            f"""Failed to get object via HTTP gate:
-                request: {resp.request.path_url},
-                response: {resp.text},
-                status code: {resp.status_code} {resp.reason}"""
-        )
-
-    logger.info(f"Request: {request}")
-    _attach_allure_step(request, resp.status_code)
-
-    file_path = os.path.join(os.getcwd(), ASSETS_DIR, f"{cid}_{str(uuid.uuid4())}")
-    with open(file_path, "wb") as file:
-        shutil.copyfileobj(resp.raw, file)
-    return file_path
+    downloaded = get_http_gate_client(endpoint).get_by_attribute(
+        cid, attribute, request_path=request_path
+    )
+    _attach_allure_step(request, 200)
+    return downloaded.file_path
 
 
+@timed_operation("http.upload", payload_arg="path")
 @allure.step("Upload via HTTP Gate")
 def upload_via_http_gate(
     cid: str, path: str, endpoint: str, headers: dict = None, file_content_type: str = None
@@ -157,27 +230,9 @@ def upload_via_http_gate(
     file_content_type: Special Multipart Content-Type header
     """
     request = f"{endpoint}/upload/{cid}"
-    if not file_content_type:
-        files = {"upload_file": open(path, "rb")}
-    else:
-        files = {"upload_file": (path, open(path, "rb"), file_content_type)}
-    body = {"filename": path}
-    resp = requests.post(request, files=files, data=body, headers=headers)
-
-    if not resp.ok:
-        raise Exception(
-            f"""Failed to get object via HTTP gate:
-                request: {resp.request.path_url},
-                response: {resp.text},
-                status code: {resp.status_code} {resp.reason}"""
-        )
-
-    logger.info(f"Request: {request}")
-    _attach_allure_step(request, resp.json(), req_type="POST")
-
-    assert resp.json().get("object_id"), f"OID found in response {resp}"
-
-    return resp.json().get("object_id")
+    oid = get_http_gate_client(endpoint).upload(cid, path, headers, file_content_type)
+    _attach_allure_step(request, {"object_id": oid}, req_type="POST")
+    return oid
 
 
 @allure.step("Check is the passed object large")
@@ -224,13 +279,13 @@ def upload_via_http_gate_curl(
 
     large_object = is_object_large(filepath)
     if large_object:
-        # pre-clean
-        _cmd_run("rm pipe -f")
-        files = f"file=@pipe;filename={os.path.basename(filepath)}"
-        cmd = f"mkfifo pipe;cat {filepath} > pipe & curl --silent --no-buffer -F '{files}' {attributes}{cookies_attr} {request}"
+        # unique pipe name allows to run several uploads at once
+        pipe = os.path.join(os.getcwd(), ASSETS_DIR, f"pipe_{str(uuid.uuid4())}")
+        files = f"file=@{pipe};filename={os.path.basename(filepath)}"
+        cmd = f"mkfifo {pipe};cat {filepath} > {pipe} & curl --silent --no-buffer -F '{files}' {attributes}{cookies_attr} {request}"
         output = _cmd_run(cmd, LONG_TIMEOUT)
         # clean up pipe
-        _cmd_run("rm pipe")
+        _cmd_run(f"rm {pipe} -f")
     else:
         files = f"file=@{filepath};filename={os.path.basename(filepath)}"
         cmd = f"curl --silent -F '{files}' {attributes}{cookies_attr} {request}"
@@ -249,6 +304,52 @@ def upload_via_http_gate_curl(
         raise AssertionError(f'Could not find "object_id" in JSON response: {output}')
     return response_json['object_id']
 
+
+@allure.step("Upload via HTTP Gate using streaming")
+def upload_via_http_gate_stream(
+    cid: str,
+    filepath: str,
+    endpoint: str,
+    headers: Optional[dict] = None,
+    error_pattern: Optional[str] = None,
+    cookies: Optional[dict] = None,
+    chunked: bool = True,
+) -> str:
+    """
+    This function uploads given object through HTTP gate reading it by chunks, so objects of
+    any size can be uploaded without curl and named pipes.
+    cid: CID to upload object to
+    filepath: File path to upload
+    endpoint: http gate endpoint
+    headers: Object header
+    error_pattern: [optional] expected error message from the gate
+    cookies: [optional] request cookies
+    chunked: [optional] send the body with `Transfer-Encoding: chunked`
+    """
+    try:
+        upload = get_http_gate_client(endpoint).upload_stream(
+            cid, filepath, headers=headers, cookies=cookies, chunked=chunked
+        )
+    except Exception as err:
+        if not error_pattern:
+            raise
+        match = error_pattern.casefold() in str(err).casefold()
+        assert match, f"Expected {err} to match {error_pattern}"
+        return ""
+    if error_pattern:
+        raise AssertionError(f"Expected error {error_pattern} on upload, got OID {upload.oid}")
+
+    throughput = upload.throughput / 1024**2
+    logger.info(f"Uploaded {upload.size} bytes in {upload.duration:.2f}s ({throughput:.2f} MiB/s)")
+    allure.attach(
+        f"size: {upload.size} bytes\nduration: {upload.duration:.3f}s\n"
+        f"throughput: {throughput:.2f} MiB/s\nsha256: {upload.sha256}",
+        "Upload throughput",
+        allure.attachment_type.TEXT,
+    )
+    return upload.oid
+
+
 @allure.step("Get via HTTP Gate using Curl")
 def get_via_http_curl(cid: str, oid: str, endpoint: str) -> str:
     """
@@ -0,0 +1,700 @@
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
+from urllib.parse import quote_plus
+
+import aiohttp
+import allure
+import requests
+from requests.adapters import HTTPAdapter
+from zip_stream import ZipEntry, iter_zip_entries
+
+logger = logging.getLogger("NeoLogger")
+
+ASSETS_DIR = os.getenv("ASSETS_DIR", "TemporaryDir/")
+HTTP_GATE_POOL_SIZE = int(os.getenv("HTTP_GATE_POOL_SIZE", "32"))
+HTTP_GATE_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class HttpGateDownload:
+    """Object downloaded from HTTP gate.
+
+    Attributes:
+        file_path: Path to the file with object payload.
+        sha256: Hex-encoded SHA-256 hash of the payload, calculated while it was downloaded.
+        size: Size of the payload in bytes.
+        duration: Time of the download in seconds.
+    """
+
+    file_path: str
+    sha256: str
+    size: int
+    duration: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Download throughput in bytes per second."""
+        return self.size / self.duration if self.duration else 0.0
+
+
+@dataclass
+class HttpGateUpload:
+    """Object uploaded to HTTP gate by streaming uploader.
+
+    Attributes:
+        oid: ID of the uploaded object.
+        sha256: Hex-encoded SHA-256 hash of the payload, calculated while it was sent.
+        size: Size of the payload in bytes.
+        duration: Time of the upload in seconds.
+    """
+
+    oid: str
+    sha256: str
+    size: int
+    duration: float
+
+    @property
+    def throughput(self) -> float:
+        """Upload throughput in bytes per second."""
+        return self.size / self.duration if self.duration else 0.0
+
+
+class _MultipartFileStream:
+    """Body of multipart/form-data request with a single file that is read in chunks.
+
+    Having length, the stream is sent with Content-Length header; iterator over the stream
+    has no length and is sent with `Transfer-Encoding: chunked`.
+    """
+
+    def __init__(self, path: str, field_name: str, chunk_size: int) -> None:
+        self.path = path
+        self.chunk_size = chunk_size
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.file_hash = hashlib.sha256()
+        self.size = 0
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; '
+            f'filename="{os.path.basename(path)}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self._head) + os.path.getsize(self.path) + len(self._tail)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        with open(self.path, "rb") as file:
+            while chunk := file.read(self.chunk_size):
+                self.file_hash.update(chunk)
+                self.size += len(chunk)
+                yield chunk
+        yield self._tail
+
+
+class HttpGateClient:
+    """Synchronous client of HTTP gate that keeps connections alive between requests.
+
+    The client is thread-safe, so the same instance can be used by get_many/upload_many
+    workers; up to `pool_size` connections are kept open to the gate.
+    """
+
+    def __init__(
+        self, endpoint: str, pool_size: int = HTTP_GATE_POOL_SIZE, timeout: Optional[float] = None
+    ) -> None:
+        self.endpoint = endpoint.rstrip("/")
+        self.pool_size = pool_size
+        self.timeout = timeout
+        # Whether the gate answers multi-range requests with multipart/byteranges body, unknown
+        # until the first such request
+        self.multi_range_supported: Optional[bool] = None
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self) -> "HttpGateClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.session.close()
+
+    def get(
+        self,
+        cid: str,
+        oid: str,
+        file_path: Optional[str] = None,
+        request_path: Optional[str] = None,
+        download: bool = False,
+    ) -> HttpGateDownload:
+        """Downloads object from HTTP gate into the file.
+
+        Args:
+            cid: Container ID to get object from.
+            oid: Object ID.
+            file_path: Path to save object to, random file in assets directory by default.
+            request_path: Request path, `/get/{cid}/{oid}` by default.
+            download: Whether to add `download=true` to the request.
+
+        Returns:
+            Downloaded object.
+        """
+        request = _make_get_request(self.endpoint, cid, oid, request_path, download)
+        return self._download(request, file_path or _make_file_path(cid, oid))
+
+    def get_by_attribute(
+        self,
+        cid: str,
+        attribute: dict,
+        file_path: Optional[str] = None,
+        request_path: Optional[str] = None,
+    ) -> HttpGateDownload:
+        """Downloads object found by the attribute from HTTP gate into the file.
+
+        Args:
+            cid: Container ID to get object from.
+            attribute: Attribute {name: value} pair.
+            file_path: Path to save object to, random file in assets directory by default.
+            request_path: Request path, `/get_by_attribute/{cid}/{name}/{value}` by default.
+
+        Returns:
+            Downloaded object.
+        """
+        if request_path is None:
+            request = _make_get_by_attribute_request(self.endpoint, cid, attribute)
+        else:
+            request = f"{self.endpoint}{request_path}"
+        return self._download(request, file_path or _make_file_path(cid, str(uuid.uuid4())))
+
+    def upload(
+        self,
+        cid: str,
+        path: str,
+        headers: Optional[dict] = None,
+        file_content_type: Optional[str] = None,
+    ) -> str:
+        """Uploads the file to HTTP gate.
+
+        Args:
+            cid: Container ID to upload object to.
+            path: Path to the file to upload.
+            headers: Request headers, e.g. object attributes.
+            file_content_type: Content-Type of multipart file part.
+
+        Returns:
+            ID of the uploaded object.
+        """
+        request = f"{self.endpoint}/upload/{cid}"
+        with open(path, "rb") as file:
+            if file_content_type:
+                files = {"upload_file": (path, file, file_content_type)}
+            else:
+                files = {"upload_file": file}
+            resp = self.session.post(
+                request, files=files, data={"filename": path}, headers=headers, timeout=self.timeout
+            )
+        _check_response(resp)
+        logger.info(f"Request: POST {request}")
+
+        oid = resp.json().get("object_id")
+        assert oid, f"OID is not found in response {resp.text}"
+        return oid
+
+    def upload_stream(
+        self,
+        cid: str,
+        path: str,
+        headers: Optional[dict] = None,
+        cookies: Optional[dict] = None,
+        chunked: bool = True,
+        chunk_size: int = HTTP_GATE_CHUNK_SIZE,
+    ) -> HttpGateUpload:
+        """Uploads the file to HTTP gate reading it in chunks.
+
+        Unlike upload, the file is never loaded into memory entirely, so this method is
+        suitable for objects of any size.
+
+        Args:
+            cid: Container ID to upload object to.
+            path: Path to the file to upload.
+            headers: Request headers, e.g. object attributes.
+            cookies: Request cookies.
+            chunked: Whether to send the body with `Transfer-Encoding: chunked` instead of
+                Content-Length header.
+            chunk_size: Size of chunks the file is read and sent by.
+
+        Returns:
+            Uploaded object.
+        """
+        request = f"{self.endpoint}/upload/{cid}"
+        stream = _MultipartFileStream(path, "file", chunk_size)
+        start = time.perf_counter()
+        resp = self.session.post(
+            request,
+            data=iter(stream) if chunked else stream,
+            headers={**(headers or {}), "Content-Type": stream.content_type},
+            cookies=cookies,
+            timeout=self.timeout,
+        )
+        duration = time.perf_counter() - start
+        _check_response(resp)
+        logger.info(f"Request: POST {request}")
+
+        oid = resp.json().get("object_id")
+        assert oid, f"OID is not found in response {resp.text}"
+        return HttpGateUpload(
+            oid=oid, sha256=stream.file_hash.hexdigest(), size=stream.size, duration=duration
+        )
+
+    def get_zip_entries(self, cid: str, prefix: str) -> Iterator[ZipEntry]:
+        """Downloads objects with the common prefix as ZIP archive and hashes them in flight.
+
+        Neither the archive nor the files in it are written to disk.
+
+        Args:
+            cid: Container ID to get objects from.
+            prefix: Common prefix of FilePath attribute of the objects.
+
+        Yields:
+            Files of the archive with hashes of their content.
+        """
+        request = f"{self.endpoint}/zip/{cid}/{prefix}"
+        with self.session.get(request, stream=True, timeout=self.timeout) as resp:
+            _check_response(resp)
+            logger.info(f"Request: {request}")
+            yield from iter_zip_entries(resp.raw.stream(HTTP_GATE_CHUNK_SIZE, decode_content=False))
+
+    def get_size(self, cid: str, oid: str) -> int:
+        """Returns payload size of the object from HEAD response of HTTP gate."""
+        resp = self.session.head(f"{self.endpoint}/get/{cid}/{oid}", timeout=self.timeout)
+        _check_response(resp)
+        return int(resp.headers["Content-Length"])
+
+    def get_range(self, cid: str, oid: str, offset: int, length: int) -> bytes:
+        """Gets the range of object payload using Range header.
+
+        Args:
+            cid: Container ID to get object from.
+            oid: Object ID.
+            offset: Offset of the range.
+            length: Length of the range.
+
+        Returns:
+            Payload of the range.
+        """
+        request = f"{self.endpoint}/get/{cid}/{oid}"
+        range_header = f"bytes={offset}-{offset + length - 1}"
+        resp = self.session.get(request, headers={"Range": range_header}, timeout=self.timeout)
+        _check_response(resp)
+        logger.info(f"Request: {request}, Range: {range_header}")
+        assert resp.status_code == 206, f"Expected partial content, got {resp.status_code}"
+        got_offset = _parse_content_range(resp.headers["Content-Range"])
+        assert got_offset == offset, f"Expected range at offset {offset}, got {got_offset}"
+        assert (
+            len(resp.content) == length
+        ), f"Expected {length} bytes of range at offset {offset}, got {len(resp.content)}"
+        return resp.content
+
+    def get_ranges(self, cid: str, oid: str, ranges: list[tuple[int, int]]) -> list[bytes]:
+        """Gets several ranges of object payload.
+
+        Several ranges are requested with single multi-range request first. HTTP servers may
+        answer such request with anything but multipart/byteranges body, in this case the ranges
+        are requested one by one and the gate is not probed for multi-range support again.
+
+        Args:
+            cid: Container ID to get object from.
+            oid: Object ID.
+            ranges: Pairs of offset and length.
+
+        Returns:
+            Payloads of the ranges in the order of the requested ones.
+        """
+        if len(ranges) > 1 and self.multi_range_supported is not False:
+            parts = self._get_multi_range(cid, oid, ranges)
+            self.multi_range_supported = parts is not None
+            if parts is not None:
+                return parts
+        return [self.get_range(cid, oid, offset, length) for offset, length in ranges]
+
+    @allure.step("Get object via HTTP Gate by segments")
+    def get_segmented(
+        self,
+        cid: str,
+        oid: str,
+        segments: int,
+        file_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> HttpGateDownload:
+        """Downloads object by ranges fetched concurrently.
+
+        Segments are written to their places in the file as they arrive and the payload is
+        hashed in order, so the hash covers the reassembled object.
+
+        Args:
+            cid: Container ID to get object from.
+            oid: Object ID.
+            segments: Number of ranges to split the object into.
+            file_path: Path to save object to, random file in assets directory by default.
+            max_workers: Maximum number of concurrent requests, number of segments by default.
+
+        Returns:
+            Downloaded object.
+        """
+        if segments < 1:
+            raise ValueError(f"Number of segments must be positive, got {segments}")
+        file_path = file_path or _make_file_path(cid, oid)
+        start = time.perf_counter()
+        size = self.get_size(cid, oid)
+        segment_size = max(-(-size // segments), 1)
+        offsets = list(range(0, size, segment_size))
+
+        def get_segment(offset: int) -> bytes:
+            return self.get_range(cid, oid, offset, min(segment_size, size - offset))
+
+        file_hash = hashlib.sha256()
+        received = {}
+        next_offset = 0
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers or len(offsets) or 1) as executor:
+                futures = {executor.submit(get_segment, offset): offset for offset in offsets}
+                for future in as_completed(futures):
+                    offset = futures[future]
+                    data = future.result()
+                    os.pwrite(fd, data, offset)
+                    received[offset] = data
+                    # Hash contiguous segments and release them
+                    while next_offset in received:
+                        data = received.pop(next_offset)
+                        file_hash.update(data)
+                        next_offset += len(data)
+        finally:
+            os.close(fd)
+        return HttpGateDownload(
+            file_path=file_path,
+            sha256=file_hash.hexdigest(),
+            size=size,
+            duration=time.perf_counter() - start,
+        )
+
+    @allure.step("Get objects via HTTP Gate")
+    def get_many(
+        self, objects: Iterable[tuple[str, str]], max_workers: Optional[int] = None
+    ) -> list[HttpGateDownload]:
+        """Downloads objects concurrently.
+
+        Args:
+            objects: Pairs of container ID and object ID.
+            max_workers: Maximum number of concurrent downloads, pool size by default.
+
+        Returns:
+            Downloaded objects in the order of the requested ones.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or self.pool_size) as executor:
+            return list(executor.map(lambda obj: self.get(*obj), objects))
+
+    @allure.step("Upload objects via HTTP Gate")
+    def upload_many(
+        self,
+        cid: str,
+        paths: Iterable[str],
+        headers: Optional[dict] = None,
+        max_workers: Optional[int] = None,
+    ) -> list[str]:
+        """Uploads files concurrently.
+
+        Args:
+            cid: Container ID to upload objects to.
+            paths: Paths to the files to upload.
+            headers: Request headers for every object.
+            max_workers: Maximum number of concurrent uploads, pool size by default.
+
+        Returns:
+            IDs of the uploaded objects in the order of the files.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or self.pool_size) as executor:
+            return list(executor.map(lambda path: self.upload(cid, path, headers), paths))
+
+    def _get_multi_range(
+        self, cid: str, oid: str, ranges: list[tuple[int, int]]
+    ) -> Optional[list[bytes]]:
+        request = f"{self.endpoint}/get/{cid}/{oid}"
+        range_header = ",".join(f"{offset}-{offset + length - 1}" for offset, length in ranges)
+        resp = self.session.get(
+            request, headers={"Range": f"bytes={range_header}"}, timeout=self.timeout
+        )
+        logger.info(f"Request: {request}, Range: bytes={range_header}")
+        content_type = resp.headers.get("Content-Type", "")
+        if resp.status_code != 206 or not content_type.startswith("multipart/byteranges"):
+            logger.info(
+                f"Gate does not support multi-range requests, got {resp.status_code} "
+                f"{content_type}, requesting ranges one by one"
+            )
+            return None
+
+        parts = dict(_parse_byteranges(content_type, resp.content))
+        for offset, length in ranges:
+            assert offset in parts, f"Range {offset}-{offset + length - 1} is missing in response"
+            assert (
+                len(parts[offset]) == length
+            ), f"Expected {length} bytes of range at offset {offset}, got {len(parts[offset])}"
+        return [parts[offset] for offset, _ in ranges]
+
+    def _download(self, request: str, file_path: str) -> HttpGateDownload:
+        start = time.perf_counter()
+        with self.session.get(request, stream=True, timeout=self.timeout) as resp:
+            _check_response(resp)
+            logger.info(f"Request: {request}")
+
+            file_hash = hashlib.sha256()
+            size = 0
+            with open(file_path, "wb") as file:
+                for chunk in resp.raw.stream(HTTP_GATE_CHUNK_SIZE, decode_content=False):
+                    file_hash.update(chunk)
+                    file.write(chunk)
+                    size += len(chunk)
+        return HttpGateDownload(
+            file_path=file_path,
+            sha256=file_hash.hexdigest(),
+            size=size,
+            duration=time.perf_counter() - start,
+        )
+
+
+class AsyncHttpGateClient:
+    """Asynchronous client of HTTP gate based on aiohttp.
+
+    Must be used as async context manager, which opens and closes the connection pool of up to
+    `pool_size` connections:
+
+        async with AsyncHttpGateClient(endpoint) as client:
+            downloads = await client.get_many(objects)
+    """
+
+    def __init__(
+        self, endpoint: str, pool_size: int = HTTP_GATE_POOL_SIZE, timeout: Optional[float] = None
+    ) -> None:
+        self.endpoint = endpoint.rstrip("/")
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncHttpGateClient":
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.pool_size),
+            auto_decompress=False,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get(
+        self,
+        cid: str,
+        oid: str,
+        file_path: Optional[str] = None,
+        request_path: Optional[str] = None,
+        download: bool = False,
+    ) -> HttpGateDownload:
+        """Downloads object from HTTP gate into the file, see HttpGateClient.get."""
+        request = _make_get_request(self.endpoint, cid, oid, request_path, download)
+        return await self._download(request, file_path or _make_file_path(cid, oid))
+
+    async def get_by_attribute(
+        self,
+        cid: str,
+        attribute: dict,
+        file_path: Optional[str] = None,
+        request_path: Optional[str] = None,
+    ) -> HttpGateDownload:
+        """Downloads object found by the attribute, see HttpGateClient.get_by_attribute."""
+        if request_path is None:
+            request = _make_get_by_attribute_request(self.endpoint, cid, attribute)
+        else:
+            request = f"{self.endpoint}{request_path}"
+        return await self._download(request, file_path or _make_file_path(cid, str(uuid.uuid4())))
+
+    async def upload(
+        self,
+        cid: str,
+        path: str,
+        headers: Optional[dict] = None,
+        file_content_type: Optional[str] = None,
+    ) -> str:
+        """Uploads the file to HTTP gate, see HttpGateClient.upload."""
+        request = f"{self.endpoint}/upload/{cid}"
+        with open(path, "rb") as file:
+            form = aiohttp.FormData()
+            form.add_field("filename", path)
+            form.add_field(
+                "upload_file",
+                file,
+                filename=os.path.basename(path),
+                content_type=file_content_type or "application/octet-stream",
+            )
+            async with self._session.post(request, data=form, headers=headers) as resp:
+                text = await resp.text()
+                if not resp.ok:
+                    _raise_http_gate_error(resp.url.path, text, resp.status, resp.reason)
+                response_json = await resp.json(content_type=None)
+        logger.info(f"Request: POST {request}")
+
+        oid = response_json.get("object_id")
+        assert oid, f"OID is not found in response {text}"
+        return oid
+
+    async def get_many(
+        self, objects: Iterable[tuple[str, str]], concurrency: Optional[int] = None
+    ) -> list[HttpGateDownload]:
+        """Downloads objects with at most `concurrency` requests in flight.
+
+        Args:
+            objects: Pairs of container ID and object ID.
+            concurrency: Maximum number of concurrent downloads, pool size by default.
+
+        Returns:
+            Downloaded objects in the order of the requested ones.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.pool_size)
+
+        async def get(cid: str, oid: str) -> HttpGateDownload:
+            async with semaphore:
+                return await self.get(cid, oid)
+
+        return await asyncio.gather(*(get(cid, oid) for cid, oid in objects))
+
+    async def upload_many(
+        self,
+        cid: str,
+        paths: Iterable[str],
+        headers: Optional[dict] = None,
+        concurrency: Optional[int] = None,
+    ) -> list[str]:
+        """Uploads files with at most `concurrency` requests in flight.
+
+        Args:
+            cid: Container ID to upload objects to.
+            paths: Paths to the files to upload.
+            headers: Request headers for every object.
+            concurrency: Maximum number of concurrent uploads, pool size by default.
+
+        Returns:
+            IDs of the uploaded objects in the order of the files.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.pool_size)
+
+        async def upload(path: str) -> str:
+            async with semaphore:
+                return await self.upload(cid, path, headers)
+
+        return await asyncio.gather(*(upload(path) for path in paths))
+
+    async def _download(self, request: str, file_path: str) -> HttpGateDownload:
+        start = time.perf_counter()
+        async with self._session.get(request) as resp:
+            if not resp.ok:
+                text = await resp.text()
+                _raise_http_gate_error(resp.url.path, text, resp.status, resp.reason)
+            logger.info(f"Request: {request}")
+
+            file_hash = hashlib.sha256()
+            size = 0
+            with open(file_path, "wb") as file:
+                async for chunk in resp.content.iter_chunked(HTTP_GATE_CHUNK_SIZE):
+                    file_hash.update(chunk)
+                    file.write(chunk)
+                    size += len(chunk)
+        return HttpGateDownload(
+            file_path=file_path,
+            sha256=file_hash.hexdigest(),
+            size=size,
+            duration=time.perf_counter() - start,
+        )
+
+
+@lru_cache(maxsize=None)
+def get_http_gate_client(endpoint: str) -> HttpGateClient:
+    """Returns the client shared by all helpers that work with the endpoint.
+
+    Args:
+        endpoint: HTTP gate endpoint.
+
+    Returns:
+        Client with connection pool to the endpoint.
+    """
+    return HttpGateClient(endpoint)
+
+
+def _make_get_request(
+    endpoint: str, cid: str, oid: str, request_path: Optional[str], download: bool
+) -> str:
+    download_attribute = "?download=true" if download else ""
+    if request_path is None:
+        return f"{endpoint}/get/{cid}/{oid}{download_attribute}"
+    return f"{endpoint}{request_path}{download_attribute}"
+
+
+def _make_get_by_attribute_request(endpoint: str, cid: str, attribute: dict) -> str:
+    attr_name = list(attribute.keys())[0]
+    attr_value = quote_plus(str(attribute.get(attr_name)))
+    return f"{endpoint}/get_by_attribute/{cid}/{quote_plus(str(attr_name))}/{attr_value}"
+
+
+def _make_file_path(cid: str, name: str) -> str:
+    return os.path.join(os.getcwd(), ASSETS_DIR, f"{cid}_{name}")
+
+
+def _parse_content_range(content_range: str) -> int:
+    match = re.match(r"bytes (\d+)-(\d+)/", content_range.strip())
+    assert match, f"Unexpected Content-Range: {content_range}"
+    return int(match.group(1))
+
+
+def _parse_byteranges(content_type: str, body: bytes) -> Iterator[tuple[int, bytes]]:
+    boundary = re.search(r'boundary="?([^";]+)"?', content_type)
+    assert boundary, f"Boundary is missing in Content-Type: {content_type}"
+    delimiter = b"--" + boundary.group(1).encode("utf-8")
+    for part in body.split(delimiter)[1:]:
+        if part.startswith(b"--"):
+            break
+        headers, _, data = part.partition(b"\r\n\r\n")
+        content_range = re.search(rb"Content-Range:([^\r\n]+)", headers, re.IGNORECASE)
+        assert content_range, f"Content-Range is missing in part headers: {headers}"
+        # Part data is followed by CRLF that belongs to the next delimiter
+        yield _parse_content_range(content_range.group(1).decode("utf-8")), data[:-2]
+
+
+def _check_response(resp: requests.Response) -> None:
+    if not resp.ok:
+        _raise_http_gate_error(resp.request.path_url, resp.text, resp.status_code, resp.reason)
+
+
+def _raise_http_gate_error(path: str, text: str, status_code: int, reason: str) -> None:
+    raise Exception(
+        f"""Failed to get object via HTTP gate:
+            request: {path},
+            response: {text},
+            status code: {status_code} {reason}"""
+    )
@@ -13,6 +13,7 @@ from common import ASSETS_DIR, TEST_OBJECTS_DIR, NEOFS_CLI_EXEC, WALLET_CONFIG
 from neofs_testlib.cli import NeofsCli
 from neofs_testlib.env.env import NeoFSEnv
 from neofs_testlib.shell import Shell
+from operation_metrics import timed_operation
 
 logger = logging.getLogger("NeoLogger")
 
@@ -69,6 +70,7 @@ def get_object_from_random_node(
     )
 
 
+@timed_operation("object.get", payload_result=True)
 @allure.step("Get object from {endpoint}")
 def get_object(
     wallet: str,
@@ -122,6 +124,7 @@ def get_object(
     return file_path
 
 
+@timed_operation("object.hash")
 @allure.step("Get Range Hash from {endpoint}")
 def get_range_hash(
     wallet: str,
@@ -229,6 +232,7 @@ def put_object_to_random_node(
     )
 
 
+@timed_operation("object.put", payload_arg="path")
 @allure.step("Put object at {endpoint} in container {cid}")
 def put_object(
     wallet: str,
@@ -287,6 +291,7 @@ def put_object(
     return oid.strip()
 
 
+@timed_operation("object.delete")
 @allure.step("Delete object {cid}/{oid} from {endpoint}")
 def delete_object(
     wallet: str,
@@ -332,6 +337,7 @@ def delete_object(
     return tombstone.strip()
 
 
+@timed_operation("object.range", payload_result=lambda result: result[1])
 @allure.step("Get Range")
 def get_range(
     wallet: str,
@@ -382,6 +388,7 @@ def get_range(
     return range_file_path, content
 
 
+@timed_operation("object.lock")
 @allure.step("Lock Object")
 def lock_object(
     wallet: str,
@@ -440,6 +447,7 @@ def lock_object(
     return oid.strip()
 
 
+@timed_operation("object.search")
 @allure.step("Search object")
 def search_object(
     wallet: str,
@@ -565,6 +573,7 @@ def get_netmap_netinfo(
     return settings
 
 
+@timed_operation("object.head")
 @allure.step("Head object")
 def head_object(
     wallet: str,